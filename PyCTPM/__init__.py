@@ -1,4 +1,38 @@
+from PyCTPM.core.info import __version__, __description__
 
-from PyCTPM.core import __version__, __description__, PackInfo
-from PyCTPM.ctpm import thermo, thermoInfo, eos, component, ion, pool, solution, is_component_available
-from PyCTPM.docs import ExcessProperties, ElectrolytesClass
+# public attributes (loaded on first access, PEP 562)
+_LAZY_ATTRIBUTES = {
+    'PackInfo': 'PyCTPM.core.package',
+    'thermo': 'PyCTPM.ctpm',
+    'thermoInfo': 'PyCTPM.ctpm',
+    'eos': 'PyCTPM.ctpm',
+    'eos_batch': 'PyCTPM.ctpm',
+    'fugacity_batch': 'PyCTPM.ctpm',
+    'component': 'PyCTPM.ctpm',
+    'ion': 'PyCTPM.ctpm',
+    'pool': 'PyCTPM.ctpm',
+    'solution': 'PyCTPM.ctpm',
+    'is_component_available': 'PyCTPM.ctpm',
+    'run_batch': 'PyCTPM.ctpm',
+    'ExcessProperties': 'PyCTPM.docs.excessproperties',
+    'ElectrolytesClass': 'PyCTPM.docs.electrolyte',
+}
+
+__all__ = ['__version__', '__description__', *_LAZY_ATTRIBUTES.keys()]
+
+
+def __getattr__(name):
+    '''
+    import a public attribute on first access
+    '''
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        # cache
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_LAZY_ATTRIBUTES.keys()))
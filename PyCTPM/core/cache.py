@@ -0,0 +1,185 @@
+# CACHE (MEMOIZATION)
+# --------------------
+
+# import packages/modules
+import threading
+import functools
+from collections import OrderedDict
+import numpy as np
+# internals
+from PyCTPM.core.config import CACHE_ENABLED, CACHE_MAX_SIZE, CACHE_KEY_DIGITS, CACHE_SCOPE
+
+
+class LRUCache:
+    '''
+    bounded least-recently-used cache (thread-safe)
+
+    keys:
+        float arguments are quantised to a number of significant digits, so states that differ
+        only by round-off share an entry, array arguments are not cached
+    '''
+
+    # global cache (scope: global)
+    _shared = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, maxsize=CACHE_MAX_SIZE, digits=CACHE_KEY_DIGITS, enabled=CACHE_ENABLED):
+        self.maxsize = maxsize
+        self.digits = digits
+        self.enabled = enabled
+        # entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        # stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def shared(cls):
+        '''
+        process-wide cache
+        '''
+        if cls._shared is None:
+            with cls._sharedLock:
+                if cls._shared is None:
+                    cls._shared = LRUCache()
+        return cls._shared
+
+    @classmethod
+    def create(cls):
+        '''
+        cache of a component (config scope)
+        '''
+        return cls.shared() if CACHE_SCOPE == 'global' else LRUCache()
+
+    def __getstate__(self):
+        # locks and entries are not copied (e.g. to a worker process)
+        return {"maxsize": self.maxsize, "digits": self.digits, "enabled": self.enabled}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def keyItem(self, item):
+        '''
+        quantised key item (None: not cacheable)
+        '''
+        if item is None or isinstance(item, (str, bool, int)):
+            return item
+        if isinstance(item, (float, np.floating)) or (isinstance(item, np.ndarray) and item.ndim == 0):
+            return float('%.*g' % (self.digits, float(item)))
+        if isinstance(item, np.integer):
+            return int(item)
+        return None
+
+    def key(self, *args):
+        '''
+        build a cache key
+
+        return:
+            key: tuple or None (not cacheable)
+        '''
+        res = []
+        for item in args:
+            _item = self.keyItem(item)
+            if _item is None and item is not None:
+                return None
+            res.append(_item)
+        return tuple(res)
+
+    def get(self, key):
+        '''
+        find an entry
+
+        return:
+            hit: True/False
+            value: cached value (copy)
+        '''
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, copyResult(self._data[key])
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        '''
+        add an entry (evict the least recently used)
+        '''
+        with self._lock:
+            self._data[key] = copyResult(value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        '''
+        remove all entries and reset stats
+        '''
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        '''
+        cache statistics
+        '''
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "enabled": self.enabled
+            }
+
+
+def copyResult(value):
+    '''
+    copy mutable results (dict/list/array), so a caller cannot change a cached entry
+    '''
+    if isinstance(value, dict):
+        return {k: copyResult(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copyResult(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(copyResult(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
+
+def memoize(name):
+    '''
+    cache a method of a class with a `cache` attribute (LRUCache)
+
+    the key is (name, id, state, *args), calls with non-cacheable arguments (e.g. arrays)
+    are evaluated directly
+    '''
+    def decorator(fun):
+        @functools.wraps(fun)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, 'cache', None)
+            # check
+            if cache is None or not cache.enabled:
+                return fun(self, *args, **kwargs)
+            _kwargs = [item for pair in sorted(kwargs.items()) for item in pair]
+            key = cache.key(name, getattr(self, 'id', None),
+                            getattr(self, 'state', None), *args, *_kwargs)
+            if key is None:
+                return fun(self, *args, **kwargs)
+
+            # cache
+            hit, res = cache.get(key)
+            if hit:
+                return res
+            res = fun(self, *args, **kwargs)
+            cache.put(key, res)
+            return res
+        return wrapper
+    return decorator
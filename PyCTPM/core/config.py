@@ -8,7 +8,21 @@ import enum
 appConfig = {
     "calculation": {
         "roundAccuracy": 2,
-        "roundAccuracyRoot": 4
+        "roundAccuracyRoot": 4,
+        "eosRootMethod": "analytic",
+        "eosRootTolerance": 1e-9,
+        "flashTolerance": 1e-12,
+        "flashMaxIteration": 50
+    },
+    "cache": {
+        "enabled": True,
+        "maxSize": 1024,
+        "keyDigits": 12,
+        "scope": "component"
+    },
+    "database": {
+        "snapshot": True,
+        "snapshotDirEnv": "PYCTPM_SNAPSHOT_DIR"
     }
 }
 
@@ -16,3 +30,25 @@ appConfig = {
 ROUND_FUN_ACCURACY = appConfig['calculation']['roundAccuracy']
 # eos root accuracy
 EOS_ROOT_ACCURACY = appConfig['calculation']['roundAccuracyRoot']
+# eos root method (analytic/fsolve)
+EOS_ROOT_METHOD = appConfig['calculation']['eosRootMethod']
+# eos root tolerance (merge repeated roots)
+EOS_ROOT_TOLERANCE = appConfig['calculation']['eosRootTolerance']
+# eos with closed-form root solver
+EOS_ROOT_ANALYTIC_LIST = ["PR", "SRK", "RK", "VDW"]
+# rachford-rice tolerance
+FLASH_TOLERANCE = appConfig['calculation']['flashTolerance']
+# rachford-rice max iteration
+FLASH_MAX_ITERATION = appConfig['calculation']['flashMaxIteration']
+# database binary snapshot (use if fresh)
+DATABASE_SNAPSHOT = appConfig['database']['snapshot']
+# environment variable of the snapshot folder
+DATABASE_SNAPSHOT_DIR_ENV = appConfig['database']['snapshotDirEnv']
+# memoization cache (component thermodynamic calls)
+CACHE_ENABLED = appConfig['cache']['enabled']
+# max number of entries (LRU eviction)
+CACHE_MAX_SIZE = appConfig['cache']['maxSize']
+# key quantisation (significant digits)
+CACHE_KEY_DIGITS = appConfig['cache']['keyDigits']
+# cache scope (component/global)
+CACHE_SCOPE = appConfig['cache']['scope']
@@ -12,10 +12,13 @@ VAN_DER_WAALS = "VDW"
 # ! vle models
 RAOULT_MODEL = 'raoult'
 MODIFIED_RAOULT_MODEL = 'modified-raoult'
+EOS_MODEL = 'eos'
 
 # ! activity coefficient model
 VAN_LAAR_ACTIVITY_MODEL = 'van-laar'
 WILSON_ACTIVITY_MODEL = 'wilson'
+NRTL_ACTIVITY_MODEL = 'nrtl'
+MARGULES_ACTIVITY_MODEL = 'margules'
 
 
 # universal gas constant [J/mol.K]
@@ -4,7 +4,6 @@
 # packages/modules
 import os
 import numpy as np
-import pandas as pd
 from PyCTPM.core.futilities import FileUtilityClass
 
 
@@ -33,6 +32,9 @@ class LoaddataClass:
             fileDir, fileName, fileFormat = FileUtilityClass.CheckFileFormat(
                 filePath)
 
+            # import
+            import pandas as pd
+
             # dataframe
             df = pd.read_csv(filePath)
             # remove duplicated records
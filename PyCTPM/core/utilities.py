@@ -4,11 +4,11 @@
 # import packages/modules
 import os
 import numpy as np
-import pandas as pd
 import csv
 # internal
 from PyCTPM.core.config import ROUND_FUN_ACCURACY
 from PyCTPM.database import DATABASE_INFO, DATABASE_FOLDER_NAME
+from PyCTPM.database.registry import ComponentRegistry
 from PyCTPM.core.info import packageShortName
 
 
@@ -41,28 +41,10 @@ def comp():
     try:
         # data file
         dataFile = DATABASE_INFO[0]['file']
-        # abs path
-        pathAbs = os.path.abspath(os.path.dirname(__file__))
-        # relative path to database file
-        dataPathDirRel = '../' + DATABASE_FOLDER_NAME
-        # database file
-        dataPath = os.path.join(pathAbs, dataPathDirRel, dataFile)
 
         # component list
-        compList = []
-
-        csv.register_dialect('myDialect', delimiter=',',
-                             skipinitialspace=True, quoting=csv.QUOTE_MINIMAL)
-
-        with open(dataPath, 'r') as file:
-            reader = csv.reader(file)
-
-            # ignore header
-            next(reader, None)
-            next(reader, None)
-
-            for row in reader:
-                compList.append([row[1], row[2]])
+        compList = [[row['component-name'], row['component-symbol']]
+                    for row in ComponentRegistry.records(dataFile)]
 
         if len(compList) > 0:
             return compList
@@ -134,43 +116,8 @@ def loadGeneralDataV2(compList, dataFile=DATABASE_INFO[0]['file']):
         compList: component list
     '''
     try:
-
-        # abs path
-        pathAbs = os.path.abspath(os.path.dirname(__file__))
-        # relative path to database file
-        dataPathDirRel = '../' + DATABASE_FOLDER_NAME
-        # database file
-        dataPath = os.path.join(pathAbs, dataPathDirRel, dataFile)
-
-        csv.register_dialect('myDialect', delimiter=',',
-                             skipinitialspace=True, quoting=csv.QUOTE_MINIMAL)
-
-        # component data
-        compData = []
-        compDataIndex = []
-        compDataSelected = []
-
-        file = open(dataPath, 'r')
-        reader = csv.DictReader(file)
-
-        # skip unit row
-        next(reader, None)
-
-        # convert to dict
-        for row in reader:
-            compData.append(row)
-
-        # find compo index in data comp
-        for i in compList:
-            _loop1 = [j for j, item in enumerate(
-                compData) if i in item.values()]
-            #! check
-            if len(_loop1) > 0:
-                compDataIndex.append(_loop1[0])
-
-        # select
-        for j in compDataIndex:
-            compDataSelected.append(compData[j])
+        # component data (indexed database)
+        compDataSelected = ComponentRegistry.search(dataFile, compList)
 
         return compDataSelected
     except Exception as e:
@@ -189,54 +136,13 @@ def loadGeneralDataV3(compList, state=[], dataFile=DATABASE_INFO[0]['file']):
         dict of list of thermodynamic data 
     '''
     try:
-        # data file
-        # dataFile = DATABASE_INFO[0]['file']
-        # abs path
-        pathAbs = os.path.abspath(os.path.dirname(__file__))
-        # relative path to database file
-        dataPathDirRel = '../' + DATABASE_FOLDER_NAME
-        # database file
-        dataPath = os.path.join(pathAbs, dataPathDirRel, dataFile)
-
-        csv.register_dialect('myDialect', delimiter=',',
-                             skipinitialspace=True, quoting=csv.QUOTE_MINIMAL)
-
-        # component data
-        compData = []
-        compDataIndex = []
-        compDataSelected = []
-        compDataSelectedDict = {}
+        # state is only used when provided
+        if not ("g" in state or "l" in state or "s" in state):
+            state = []
 
-        file = open(dataPath, 'r')
-        reader = csv.DictReader(file)
-
-        # skip unit row
-        next(reader, None)
-
-        # convert to dict
-        for row in reader:
-            compData.append(row)
-
-        # find compo index in data comp
-        if "g" in state or "l" in state or "s" in state:
-            for i in enumerate(zip(compList, state)):
-                _loop1 = [j for j, item in enumerate(
-                    compData) if (str(i[1][0]).title() in item.values() or str(i[1][0]).lower() in item.values()) and i[1][1] == str(item['state']).lower()]
-                #! check
-                if len(_loop1) > 0:
-                    compDataIndex.append(_loop1[0])
-        else:
-            # when state is not provided
-            for i in compList:
-                _loop1 = [j for j, item in enumerate(
-                    compData) if str(i).title() in item.values() or str(i).lower() in item.values()]
-                #! check
-                if len(_loop1) > 0:
-                    compDataIndex.append(_loop1[0])
-
-        # select
-        for j in compDataIndex:
-            compDataSelected.append(compData[j])
+        # component data (indexed database)
+        compDataSelected = ComponentRegistry.search(
+            dataFile, compList, state)
 
         #! check
         if len(compDataSelected) == 1:
@@ -255,37 +161,11 @@ def loadGeneralDataInfo():
     load info of the general data of components
     '''
     try:
-        # data path
-        # dataMainDir = packageShortName + '\database'
-        # dataFile = DATABASE_INFO[0]['file']
-        # dataPath = os.path.join(dataMainDir, dataFile)
-
         # data file
         dataFile = DATABASE_INFO[0]['file']
-        # abs path
-        pathAbs = os.path.abspath(os.path.dirname(__file__))
-        # relative path to database file
-        dataPathDirRel = '../' + DATABASE_FOLDER_NAME
-        # database file
-        dataPath = os.path.join(pathAbs, dataPathDirRel, dataFile)
-
-        csv.register_dialect('myDialect', delimiter=',',
-                             skipinitialspace=True, quoting=csv.QUOTE_MINIMAL)
 
-        # component data
-        infoData = []
-
-        file = open(dataPath, 'r')
-        reader = csv.DictReader(file)
-
-        k = 0
-        # save title/unit
-        for row in reader:
-            if k < 1:
-                infoData.append(row)
-                k += 1
-            else:
-                break
+        # title/unit
+        infoData = [ComponentRegistry.unit(dataFile)]
 
         return infoData
     except Exception as e:
@@ -368,7 +248,7 @@ def csvLoader(databaseName, compList):
         raise
 
 
-def csvLoaderV2(compList, databaseName, rowsSkip=0):
+def csvLoaderV2(compList, databaseName):
     '''
     load csv data of components
     args:
@@ -379,49 +259,14 @@ def csvLoaderV2(compList, databaseName, rowsSkip=0):
         dict
     '''
     try:
-        # data path
-        # dataMainDir = packageShortName + '\database'
-        # dataFile = databaseName
-        # dataPath = os.path.join(dataMainDir, dataFile)
-
-        # data file
-        dataFile = databaseName
-        # abs path
-        pathAbs = os.path.abspath(os.path.dirname(__file__))
-        # relative path to database file
-        dataPathDirRel = '../' + DATABASE_FOLDER_NAME
-        # database file
-        dataPath = os.path.join(pathAbs, dataPathDirRel, dataFile)
-
-        csv.register_dialect('myDialect', delimiter=',',
-                             skipinitialspace=True, quoting=csv.QUOTE_MINIMAL)
-
-        # component data
-        compData = []
-        compDataIndex = []
+        # component data (indexed database)
         compDataSelected = []
-
-        file = open(dataPath, 'r')
-        reader = csv.DictReader(file)
-
-        # skip unit row
-        if rowsSkip > 0:
-            for r in range(rowsSkip):
-                next(reader, None)
-
-        # convert to dict
-        for row in reader:
-            compData.append(row)
-
-        # find compo index in data comp
         for i in compList:
-            _loop1 = [j for j, item in enumerate(
-                compData) if str(i).title() in item.values() or str(i).lower() in item.values()]
-            compDataIndex.append(_loop1[0])
-
-        # select
-        for j in compDataIndex:
-            compDataSelected.append(compData[j])
+            _record = ComponentRegistry.find(databaseName, i)
+            #! check
+            if not _record:
+                raise IndexError(f"component {i} not found!")
+            compDataSelected.append(_record)
 
         # check record no.
         if len(compDataSelected) == 1:
@@ -448,11 +293,11 @@ def loadAllData(compList):
         # load heat capacity at constant pressure
         _d2 = csvLoaderV2(compList, DATABASE_INFO[1]['file'])
         # load thermal conductivity
-        _d3 = csvLoaderV2(compList, DATABASE_INFO[2]['file'], 1)
+        _d3 = csvLoaderV2(compList, DATABASE_INFO[2]['file'])
         # load viscosity
-        _d4 = csvLoaderV2(compList, DATABASE_INFO[3]['file'], 1)
+        _d4 = csvLoaderV2(compList, DATABASE_INFO[3]['file'])
         # load vapor-pressure
-        _d5 = csvLoaderV2(compList, DATABASE_INFO[4]['file'], 1)
+        _d5 = csvLoaderV2(compList, DATABASE_INFO[4]['file'])
 
         # data
         databaseSet = {
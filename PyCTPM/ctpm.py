@@ -163,9 +163,9 @@ def thermoInfo(propName='ALL'):
 def eos(modelInput):
     """
     # Estimation of molar-volume at fixed pressure and temperature using a EOS as:
-        1. van der Waals
-        2. Redlich-Kwong and Soave
-        3. Peng-Robinson
+        1. van der Waals (VDW)
+        2. Redlich-Kwong (RK) and Soave-Redlich-Kwong (SRK)
+        3. Peng-Robinson (PR)
 
         Z is determined thereby molar-volume is calculated.
         eosMode: pure/mixture 
@@ -208,13 +208,55 @@ def eos(modelInput):
     # * init eos class
     _eosCoreClass = eosCoreClass(
         compData, compList, eosModel, moleFraction, params)
-    # select method
-    selectEOS = {
-        "PR": lambda: _eosCoreClass._eosPR()
-    }
 
-    # return
-    return selectEOS.get(eosModel)()
+    # return (PR, SRK, RK, VDW)
+    return _eosCoreClass._eosCubic()
+
+
+def eos_batch(modelInput):
+    """
+    # Estimation of compressibility factor and molar-volume for many states (P, T, composition) at once
+
+    args:
+        modelInput:
+            eos-model: eos equation name (PR, SRK, RK, VDW)
+            components: component list
+            MoFr: mole fraction *** array *** (M,N), or (N) for all states
+            params:
+                pressure: *** array *** (M) [Pa]
+                temperature: *** array *** (M) [K]
+
+    output:
+        structured array (M):
+            pressure, temperature
+            a, b, A, B, alpha, beta, gamma: eos-params
+            ZL, ZV: liquid/vapor compressibility factor [-]
+            VL, VV: liquid/vapor molar-volume [m^3/mol]
+            rootNo: number of physical Z (Z > B)
+
+        a state without a physical root (rootNo = 0) has ZL, ZV, VL, VV = nan
+    """
+    # get primary info
+    compList = modelInput.get("components")
+    # eos method
+    eosModel = modelInput.get('eos-model', 'PR')
+    # mole fraction
+    moleFraction = modelInput.get('MoFr', [1])
+    # params
+    params = modelInput.get('params')
+
+    # check component list
+    compListUnique = dUtilityClass.buildComponentList(compList)
+
+    # load all data
+    compData = loadDataEOS(compListUnique)
+
+    # * init eos class
+    _eosCoreClass = eosCoreClass(
+        compData, compList, eosModel, moleFraction, {})
+
+    # res
+    return _eosCoreClass._eosBatch(params.get('pressure'), params.get('temperature'), moleFraction)
 
 
 def fugacity(modelInput):
@@ -278,5 +320,94 @@ def fugacity(modelInput):
         raise Exception("Fugacity calculation failed!, ", e)
 
 
+def fugacity_batch(modelInput):
+    '''
+    # Calculate component fugacity coefficients of a mixture for many states (P, T, composition) at once
+
+    args:
+        modelInput:
+            eos-model: eos equation name (PR, SRK, RK, VDW)
+            components: component list
+            MoFr: mole fraction *** array *** (M,N), or (N) for all states
+            phase: gas, liquid (default: the root with the lowest Gibbs energy)
+            derivatives: calculate composition/pressure/temperature derivatives (default: False)
+            params:
+                pressure: *** array *** (M) [Pa]
+                temperature: *** array *** (M) [K]
+
+    output:
+        Z: compressibility factor [-] *** array *** (M)
+        ln-phi: ln(phi[i]) *** array *** (M,N)
+        d-ln-phi-dn: n*d(ln(phi[i]))/dn[j] at fixed T, P *** array *** (M,N,N)
+        d-ln-phi-dP: d(ln(phi[i]))/dP [1/Pa] *** array *** (M,N)
+        d-ln-phi-dT: d(ln(phi[i]))/dT [1/K] *** array *** (M,N)
+    '''
+    try:
+        # get primary info
+        compList = modelInput.get("components")
+        # eos method
+        eosModel = modelInput.get('eos-model', 'PR')
+        # mole fraction
+        moleFraction = modelInput.get('MoFr', [1])
+        # phase
+        phase = modelInput.get("phase", None)
+        # derivatives
+        derivatives = modelInput.get("derivatives", False)
+        # params
+        params = modelInput.get('params')
+
+        # check component list
+        compListUnique = dUtilityClass.buildComponentList(compList)
+
+        # load all data
+        compData = loadDataEOS(compListUnique)
+
+        # * init eos class
+        _eosCoreClass = eosCoreClass(
+            compData, compList, eosModel, moleFraction, {})
+
+        # res
+        return _eosCoreClass._fugacityBatch(params.get('pressure'), params.get('temperature'),
+                                            moleFraction, phase, derivatives)
+    except Exception as e:
+        raise Exception("Fugacity calculation failed!, ", e)
+
+
+def run_batch(jobs, workers=None, chunk_size=64):
+    '''
+    # Run many independent jobs (parameter sweeps) over a process pool
+
+    args:
+        jobs: iterable of job specs (dict)
+            function: thermo, eos, eos_batch, fugacity, fugacity_batch, component.<method>, pool.<method>
+            args: positional (list) or keyword (dict) arguments
+            component: component id (component.<method>)
+            components: component id list (pool.<method>)
+            state: component state (g, l, s) or a state list for a pool
+        workers: number of processes (default: cpu count), 0/1 runs in the current process
+        chunk_size: number of jobs sent to a worker at once
+
+    output:
+        generator of results (job order):
+            index: job index
+            success: job status
+            res: job result
+            error: error message of a failed job
+
+    example:
+        jobs = [{"function": "component.fugacity", "component": "propane", "state": "g",
+                 "args": {"P": P, "T": 300}} for P in P_range]
+        for item in run_batch(jobs, workers=4):
+            print(item['index'], item['res'])
+
+    note:
+        on platforms without fork (windows/macos) call it under `if __name__ == "__main__":`
+    '''
+    # import
+    from PyCTPM.docs.executor import BatchExecutor
+
+    return BatchExecutor(workers, chunk_size).run(jobs)
+
+
 if __name__ == "__main__":
     main()
@@ -1,3 +1,4 @@
 from PyCTPM.database.dataInfo import (
     DATABASE_INFO, DATABASE_GENERAL_ITEMS, DATABASE_FOLDER_NAME, DATABASE_GENERAL_ITEMS_FULL, DB_GENERAL, DB_HEAT, DB_VAPOR_PRESSURE)
 from PyCTPM.database.datasource import DataSource
+from PyCTPM.database.registry import ComponentRegistry
@@ -0,0 +1,323 @@
+# COMPONENT REGISTRY
+# -------------------
+
+# packages/modules
+import os
+import csv
+import threading
+import numpy as np
+# internals
+from PyCTPM.database.dataInfo import DATABASE_INFO, DB_GENERAL, DB_HEAT, DB_VAPOR_PRESSURE
+
+
+class SnapshotRows:
+    '''
+    read-only record list over a snapshot string array (rows are built on access)
+    '''
+
+    def __init__(self, header, cells):
+        self.header = header
+        self.cells = cells
+
+    def __len__(self):
+        return self.cells.shape[0]
+
+    def __getitem__(self, i):
+        return dict(zip(self.header, self.cells[i].tolist()))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, name):
+        '''
+        a string column *** list ***
+        '''
+        return self.cells[:, self.header.index(name)].tolist()
+
+
+class ComponentRegistry:
+    '''
+    process-wide in-memory database
+
+    each csv file is parsed once (on first use), then hash indexes are built on:
+        1. component name/symbol (formula)/CAS
+        2. (component id, state)
+
+    all lookups are served from the indexes,
+    a table is read from the binary snapshot (memory-mapped) if it is fresh,
+    otherwise from the csv file
+    '''
+
+    # database folder
+    databaseDir = os.path.abspath(os.path.dirname(__file__))
+
+    # columns used to identify a component
+    keyColumns = ["component-name", "component-symbol",
+                  "Name", "Formula", "CAS"]
+
+    # loaded tables
+    _tables = {}
+    _lock = threading.RLock()
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def table(cls, dataFile):
+        '''
+        get a table (load and index on first use)
+
+        args:
+            dataFile: csv file name (database folder)
+
+        return:
+            table:
+                header: column names
+                unit: unit row (dict) or None
+                rows: records *** list of dict ***
+                index: {key: [row index]}
+                stateIndex: {(key, state): [row index]}
+                hasState: state column exists
+                cells: string array (snapshot) or None
+                values: float64 array (snapshot) or None
+        '''
+        _table = cls._tables.get(dataFile)
+        if _table is None:
+            with cls._lock:
+                _table = cls._tables.get(dataFile)
+                if _table is None:
+                    _table = cls.loadTable(dataFile)
+                    cls._tables[dataFile] = _table
+        return _table
+
+    @classmethod
+    def loadTable(cls, dataFile):
+        '''
+        load a table (snapshot or csv) and build indexes
+        '''
+        # avoid circular import (python -m PyCTPM.database.snapshot)
+        from PyCTPM.database.snapshot import loadSnapshot
+
+        # snapshot
+        _snapshot = loadSnapshot(dataFile)
+        if _snapshot is not None:
+            header, unit, cells, values = _snapshot
+            return cls.buildTable(header, unit, SnapshotRows(header, cells), cells, values)
+
+        # csv
+        return cls.loadCsv(dataFile)
+
+    @classmethod
+    def loadCsv(cls, dataFile):
+        '''
+        parse a csv file and build indexes
+        '''
+        try:
+            # database file
+            dataPath = os.path.join(cls.databaseDir, dataFile)
+
+            with open(dataPath, 'r') as file:
+                reader = csv.DictReader(file)
+                header = list(reader.fieldnames or [])
+                records = [row for row in reader]
+
+            # unit row (first column is `-`)
+            unit = None
+            if len(records) > 0 and len(header) > 0 and str(records[0].get(header[0])).strip() == '-':
+                unit = records[0]
+                records = records[1:]
+
+            return cls.buildTable(header, unit, records)
+        except Exception as e:
+            raise Exception(f"loading database {dataFile} failed!, ", e)
+
+    @classmethod
+    def buildTable(cls, header, unit, records, cells=None, values=None):
+        '''
+        build indexes for a list of records
+        '''
+        # key columns
+        keyCols = [item for item in cls.keyColumns if item in header]
+        hasState = 'state' in header
+
+        # index
+        index = {}
+        stateIndex = {}
+        _keys = [records.column(col) if isinstance(records, SnapshotRows)
+                 else [row.get(col) for row in records] for col in keyCols]
+        _states = (records.column('state') if isinstance(records, SnapshotRows)
+                   else [row.get('state', '') for row in records]) if hasState else []
+        for i in range(len(records)):
+            _state = str(_states[i]).lower() if hasState else ''
+            for col in _keys:
+                _key = col[i]
+                if _key is None or _key == '':
+                    continue
+                index.setdefault(_key, []).append(i)
+                if hasState:
+                    stateIndex.setdefault((_key, _state), []).append(i)
+
+        # res
+        return {
+            "header": header,
+            "unit": unit,
+            "rows": records,
+            "index": index,
+            "stateIndex": stateIndex,
+            "hasState": hasState,
+            "cells": cells,
+            "values": values
+        }
+
+    @classmethod
+    def install(cls, tables):
+        '''
+        install tables loaded elsewhere (e.g. shipped to a worker process)
+        '''
+        with cls._lock:
+            cls._tables.update(tables)
+
+    @staticmethod
+    def dataFiles():
+        '''
+        all database files
+        '''
+        files = [item['file'] for item in [
+            *DATABASE_INFO, *DB_GENERAL, *DB_HEAT, *DB_VAPOR_PRESSURE]]
+        return list(dict.fromkeys(files))
+
+    @classmethod
+    def loadAll(cls):
+        '''
+        load all database files
+
+        return:
+            tables: {file: table}
+        '''
+        for f in cls.dataFiles():
+            cls.table(f)
+        return dict(cls._tables)
+
+    @classmethod
+    def clear(cls):
+        '''
+        remove all tables (reload on next use)
+        '''
+        with cls._lock:
+            cls._tables.clear()
+
+    @staticmethod
+    def idKeys(id):
+        '''
+        lookup keys for a component id (as given, title case, lower case)
+        '''
+        _id = str(id)
+        return list(dict.fromkeys([_id, _id.title(), _id.lower()]))
+
+    @classmethod
+    def findIndex(cls, dataFile, id, state=''):
+        '''
+        find the first record of a component
+
+        args:
+            dataFile: csv file name
+            id: component id (name/symbol/formula)
+            state: component state (g,l,s), ignored for tables without state
+
+        return:
+            row index or -1
+        '''
+        _table = cls.table(dataFile)
+        _state = str(state).lower() if state else ''
+
+        # candidates
+        _res = []
+        for key in cls.idKeys(id):
+            if _state in ('g', 'l', 's') and _table['hasState']:
+                _res.extend(_table['stateIndex'].get((key, _state), []))
+            else:
+                _res.extend(_table['index'].get(key, []))
+
+        # res
+        return min(_res) if len(_res) > 0 else -1
+
+    @classmethod
+    def find(cls, dataFile, id, state=''):
+        '''
+        find a component record
+
+        return:
+            record (dict copy) or {}
+        '''
+        i = cls.findIndex(dataFile, id, state)
+        return dict(cls.table(dataFile)['rows'][i]) if i >= 0 else {}
+
+    @classmethod
+    def search(cls, dataFile, compList, state=[]):
+        '''
+        find records of a component list
+
+        args:
+            compList: component list
+            state: state list (optional)
+
+        return:
+            records *** list of dict ***
+        '''
+        res = []
+        for i, id in enumerate(compList):
+            _state = state[i] if i < len(state) else ''
+            _record = cls.find(dataFile, id, _state)
+            if _record:
+                res.append(_record)
+        return res
+
+    @classmethod
+    def unit(cls, dataFile):
+        '''
+        unit row of a table
+        '''
+        _unit = cls.table(dataFile)['unit']
+        return dict(_unit) if _unit is not None else {}
+
+    @classmethod
+    def records(cls, dataFile):
+        '''
+        all records of a table (read-only)
+        '''
+        return cls.table(dataFile)['rows']
+
+    @classmethod
+    def values(cls, dataFile):
+        '''
+        all cells of a table as float64 (nan for non-numeric cells)
+
+        return:
+            values: array (rows x columns)
+        '''
+        _table = cls.table(dataFile)
+        if _table['values'] is None:
+            # avoid circular import
+            from PyCTPM.database.snapshot import tableArrays
+            with cls._lock:
+                if _table['values'] is None:
+                    _table['cells'], _table['values'] = tableArrays(
+                        _table['header'], _table['rows'])
+        return _table['values']
+
+    @classmethod
+    def column(cls, dataFile, name, rows=None):
+        '''
+        a float64 column of a table
+
+        args:
+            name: column name
+            rows: row index list (optional)
+
+        return:
+            values: array
+        '''
+        _table = cls.table(dataFile)
+        _values = cls.values(dataFile)[:, _table['header'].index(name)]
+        return np.asarray(_values if rows is None else _values[np.asarray(rows, dtype=int)])
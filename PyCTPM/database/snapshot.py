@@ -0,0 +1,236 @@
+# DATABASE SNAPSHOT
+# ------------------
+'''
+compile database csv files into a binary snapshot (numpy .npy files)
+
+each table is stored as:
+    1. <name>.str.npy: cells *** unicode array (rows x columns) ***
+    2. <name>.num.npy: cells converted to float64 (nan for non-numeric cells)
+    3. <name>.json: header, unit row, source file stamp (size, mtime, crc32)
+
+arrays are loaded with mmap_mode='r' so worker processes share the same pages,
+a table is served from the snapshot only if its stamp matches the csv file
+(size and mtime, crc32 only if the mtime differs).
+
+snapshot folder: PYCTPM_SNAPSHOT_DIR or the user cache folder (e.g. ~/.cache/PyCTPM/snapshot)
+
+build/refresh:
+    python -m PyCTPM.database.snapshot [output dir]
+'''
+
+# import packages/modules
+import os
+import sys
+import json
+import zlib
+import numpy as np
+# internals
+from PyCTPM.core.config import DATABASE_SNAPSHOT, DATABASE_SNAPSHOT_DIR_ENV
+
+# database folder
+DATABASE_DIR = os.path.abspath(os.path.dirname(__file__))
+# snapshot version
+SNAPSHOT_VERSION = 1
+
+
+def userCacheDir():
+    '''
+    user cache folder of the package
+    '''
+    if os.name == 'nt':
+        _base = os.environ.get('LOCALAPPDATA') or os.path.join(
+            os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        _base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        _base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.path.expanduser('~'), '.cache')
+    return os.path.join(_base, "PyCTPM")
+
+
+def snapshotDir():
+    '''
+    snapshot folder (environment variable or user cache folder)
+    '''
+    return os.environ.get(DATABASE_SNAPSHOT_DIR_ENV) or os.path.join(userCacheDir(), "snapshot")
+
+
+def snapshotName(dataFile):
+    '''
+    snapshot file name of a table (without extension)
+    '''
+    return os.path.splitext(os.path.basename(dataFile))[0].replace(' ', '_')
+
+
+def fileCrc32(dataPath):
+    '''
+    crc32 of a file
+    '''
+    with open(dataPath, 'rb') as file:
+        return zlib.crc32(file.read())
+
+
+def sourceStamp(dataPath):
+    '''
+    stamp of a csv file (size, mtime [ns], crc32)
+    '''
+    _stat = os.stat(dataPath)
+    return {"size": _stat.st_size, "mtime": _stat.st_mtime_ns, "crc32": fileCrc32(dataPath)}
+
+
+def isFresh(stamp, dataPath):
+    '''
+    check a snapshot stamp against a csv file
+
+    size and mtime are compared first (no read), crc32 only if the mtime differs
+    (e.g. a reinstalled package)
+    '''
+    _stat = os.stat(dataPath)
+    if not stamp or stamp.get('size') != _stat.st_size:
+        return False
+    if stamp.get('mtime') == _stat.st_mtime_ns:
+        return True
+    return stamp.get('crc32') == fileCrc32(dataPath)
+
+
+def toFloat(cells):
+    '''
+    convert cells to float64 (nan for non-numeric cells)
+
+    args:
+        cells: string array
+
+    return:
+        values: float64 array
+    '''
+    values = np.full(np.shape(cells), np.nan)
+    for index, item in np.ndenumerate(cells):
+        try:
+            values[index] = float(item)
+        except (TypeError, ValueError):
+            pass
+    return values
+
+
+def tableArrays(header, records):
+    '''
+    cells and float64 values of a record list
+
+    return:
+        cells: unicode array (rows x columns)
+        values: float64 array (rows x columns)
+    '''
+    cells = np.array([[str(row.get(col) or '') for col in header] for row in records],
+                     dtype=str).reshape(len(records), len(header))
+    return cells, toFloat(cells)
+
+
+def _save(path, saveFun):
+    '''
+    write a file atomically (temp file + rename)
+    '''
+    tmpPath = f"{path}.{os.getpid()}.tmp"
+    with open(tmpPath, 'wb') as file:
+        saveFun(file)
+    os.replace(tmpPath, path)
+
+
+def buildSnapshot(outDir=None, files=None):
+    '''
+    compile database csv files into a snapshot
+
+    args:
+        outDir: output folder (default: snapshotDir())
+        files: csv file list (default: all database files)
+
+    return:
+        res: list of snapshot names
+    '''
+    try:
+        # avoid circular import
+        from PyCTPM.database.registry import ComponentRegistry
+
+        # set
+        outDir = outDir or snapshotDir()
+        files = files or ComponentRegistry.dataFiles()
+        os.makedirs(outDir, exist_ok=True)
+
+        res = []
+        for dataFile in files:
+            # parse csv
+            _table = ComponentRegistry.loadCsv(dataFile)
+            header = _table['header']
+            cells, values = tableArrays(header, _table['rows'])
+
+            # info
+            _name = snapshotName(dataFile)
+            info = {
+                "version": SNAPSHOT_VERSION,
+                "file": dataFile,
+                "source": sourceStamp(os.path.join(DATABASE_DIR, dataFile)),
+                "header": header,
+                "unit": _table['unit']
+            }
+
+            # save (info last: marks a complete snapshot)
+            _path = os.path.join(outDir, _name)
+            _save(f"{_path}.str.npy", lambda f: np.save(
+                f, cells, allow_pickle=False))
+            _save(f"{_path}.num.npy", lambda f: np.save(
+                f, values, allow_pickle=False))
+            _save(f"{_path}.json", lambda f: f.write(
+                json.dumps(info, indent=1).encode('utf-8')))
+
+            res.append(_name)
+
+        # res
+        return res
+    except Exception as e:
+        raise Exception("building database snapshot failed!, ", e)
+
+
+def loadSnapshot(dataFile, outDir=None):
+    '''
+    load a table from the snapshot (memory-mapped)
+
+    args:
+        dataFile: csv file name (database folder)
+        outDir: snapshot folder
+
+    return:
+        res: (header, unit, cells, values) or None (snapshot missing/stale)
+    '''
+    # check
+    if not DATABASE_SNAPSHOT:
+        return None
+
+    _path = os.path.join(outDir or snapshotDir(), snapshotName(dataFile))
+    if not os.path.exists(f"{_path}.json"):
+        return None
+
+    try:
+        with open(f"{_path}.json", 'r', encoding='utf-8') as file:
+            info = json.load(file)
+
+        # ! stale snapshot
+        if info.get('version') != SNAPSHOT_VERSION or info.get('file') != dataFile:
+            return None
+        if not isFresh(info.get('source'), os.path.join(DATABASE_DIR, dataFile)):
+            return None
+
+        # arrays
+        cells = np.load(f"{_path}.str.npy", mmap_mode='r', allow_pickle=False)
+        values = np.load(f"{_path}.num.npy", mmap_mode='r', allow_pickle=False)
+
+        # res
+        return info['header'], info['unit'], cells, values
+    except Exception:
+        # fall back to csv
+        return None
+
+
+if __name__ == "__main__":
+    # build/refresh
+    _outDir = sys.argv[1] if len(sys.argv) > 1 else None
+    for item in buildSnapshot(_outDir):
+        print(item)
@@ -2,10 +2,9 @@
 # ---------
 
 # packages/modules
-from math import pow, exp, log
 import numpy as np
-from PyCTPM.core.constants import R_CONST
-from PyCTPM.docs.dThermo import ModifiedRackettEquation
+# local
+from PyCTPM.docs.activityModel import WilsonModel, NRTLModel
 
 
 class ActivityClass:
@@ -42,33 +41,11 @@ class ActivityClass:
                     k += 1
 
         # activity coefficient
-        AcCoi = np.zeros(compNo)
-
-        # activity coefficient
-        xj_Aij = np.zeros((compNo, compNo))
-        xk_Aki = np.zeros((compNo, compNo))
-        xj_Akj = np.zeros((compNo, compNo))
-
-        for i in range(compNo):
-            for j in range(compNo):
-                xj_Aij[i, j] = xi[j]*Aij[i, j]
-            # _c2 = np.dot(xi, Aij[i, :])
-
-            for k in range(compNo):
-                _c0 = xi[k]*Aij[k, i]
-
-                _c1 = 0
-                for j in range(compNo):
-                    _c1 = xi[j]*Aij[k, j] + _c1
-
-                # set
-                xk_Aki[i, k] = _c0/_c1
-
-            _c3 = 1 - log(np.sum(xj_Aij[i, :])) - np.sum(xk_Aki[i, :])
-            AcCoi[i] = exp(_c3)
+        lnGamma = WilsonModel.lnActivityCoefficientSet(
+            np.reshape(xi, (1, -1)), Aij)[0]
 
         # res
-        return AcCoi
+        return np.exp(lnGamma[0])
 
     def Wilson_activity_coefficient(self, xi, T, aij):
         '''
@@ -86,56 +63,12 @@ class ActivityClass:
         return:
             AcCo: activity coefficient
         '''
-        # component no
-        compNo = xi.shape[0]
-
-        # activity coefficient
-        AcCoi = np.zeros(compNo)
-        #  molar volume [m^3/mol]
-        MoVoi = np.zeros(compNo)
-
-        # molar volume [m^3/mol]
-        for i in range(compNo):
-            _comp = self.components[i]
-            _Pc = float(_comp.Pc)*1e5
-            _Tc = _comp.Tc
-            _w = _comp.w
-            MoVoi[i] = ModifiedRackettEquation(T, _Pc, _Tc, _w)
-
-        # parameter (dependent of temperature)
-        Aij = np.ones((compNo, compNo))
-
-        for i in range(compNo):
-            for j in range(compNo):
-                if j == i:
-                    Aij[i, j] = 1
-                else:
-                    Aij[i, j] = (MoVoi[j]/MoVoi[i]) * \
-                        exp(-1*aij[i, j]/(R_CONST*T))
-
-        # activity coefficient
-        xj_Aij = np.zeros((compNo, compNo))
-        xk_Aki = np.zeros((compNo, compNo))
-
-        for i in range(compNo):
-            for j in range(compNo):
-                xj_Aij[i, j] = xi[j]*Aij[i, j]
-
-            for k in range(compNo):
-                _c0 = xi[k]*Aij[k, i]
-
-                _c1 = 0
-                for j in range(compNo):
-                    _c1 = xi[j]*Aij[k, j] + _c1
-
-                # set
-                xk_Aki[i, k] = _c0/_c1
-
-            _c3 = 1 - log(np.sum(xj_Aij[i, :])) - np.sum(xk_Aki[i, :])
-            AcCoi[i] = exp(_c3)
+        # activity coefficient (molar volume from the pool data)
+        AcCoi = WilsonModel(aij, self.poolData.molarVolumeRackett).activityCoefficient(
+            xi, T)
 
         # res
-        return AcCoi
+        return AcCoi[0]
 
     @staticmethod
     def Wilson_excess_molar_Gibbs_free_energy(xi, AcCoi):
@@ -180,56 +113,17 @@ class ActivityClass:
         return:
             AcCo: activity coefficient
         '''
-        # component no
-        compNo = xi.shape[0]
-
         # dependent parameters
-        Gij = np.ones((compNo, compNo))
-        k = 0
-        for i in range(compNo):
-            for j in range(compNo):
-                if i != j:
-                    Gij[i, j] = exp(-1*aij[i, j]*taij[i, j])
-                    k += 1
-                else:
-                    Gij[i, j] = 1
-
-        # activity coefficient
-        AcCoi = np.zeros(compNo)
+        taij = np.asarray(taij, dtype=float)
+        Gij = np.exp(-1*np.asarray(aij, dtype=float)*taij)
+        np.fill_diagonal(Gij, 1)
 
         # activity coefficient
-        C0 = np.zeros((compNo, compNo))
-
-        for i in range(compNo):
-            _c0 = 0
-            for j in range(compNo):
-                _c0 = taij[j, i]*Gij[j, i]*xi[j] + _c0
-
-            _c1 = 0
-            for k in range(compNo):
-                _c1 = Gij[k, i]*xi[k] + _c1
-
-            for j in range(compNo):
-                _c2 = xi[j]*Gij[i, j]
-
-                _c3 = 0
-                for k in range(compNo):
-                    _c3 = Gij[k, j]*xi[k] + _c3
-
-                _c4 = 0
-                for n in range(compNo):
-                    _c4 = xi[n]*taij[n, j]*Gij[n, j] + _c4
-
-                _c5 = taij[i, j] - (_c4/_c3)
-
-                # set
-                C0[i, j] = (_c2/_c3)*_c5
-
-            _c6 = (_c0/_c1) + np.sum(C0[i, :])
-            AcCoi[i] = exp(_c6)
+        lnGamma = NRTLModel.lnActivityCoefficientSet(
+            np.reshape(xi, (1, -1)), taij, Gij)[0]
 
         # res
-        return AcCoi
+        return np.exp(lnGamma[0])
 
     def NRTL_activity_coefficient(self, xi, T, aij, gij):
         '''
@@ -246,60 +140,8 @@ class ActivityClass:
         return:
             AcCo: activity coefficient
         '''
-        # component no
-        compNo = xi.shape[0]
-
-        # temperature dependent parameter
-        taij = np.zeros((compNo, compNo))
-        for i in range(compNo):
-            for j in range(compNo):
-                if j != i:
-                    taij[i, j] = gij[i, j]/(R_CONST*T)
-
-        # dependent parameters
-        Gij = np.ones((compNo, compNo))
-        k = 0
-        for i in range(compNo):
-            for j in range(compNo):
-                if i != j:
-                    Gij[i, j] = exp(-1*aij[i, j]*taij[i, j])
-                    k += 1
-                else:
-                    Gij[i, j] = 1
-
-        # activity coefficient
-        AcCoi = np.zeros(compNo)
-
-        # activity coefficient
-        C0 = np.zeros((compNo, compNo))
-
-        for i in range(compNo):
-            _c0 = 0
-            for j in range(compNo):
-                _c0 = taij[j, i]*Gij[j, i]*xi[j] + _c0
-
-            _c1 = 0
-            for k in range(compNo):
-                _c1 = Gij[k, i]*xi[k] + _c1
-
-            for j in range(compNo):
-                _c2 = xi[j]*Gij[i, j]
-
-                _c3 = 0
-                for k in range(compNo):
-                    _c3 = Gij[k, j]*xi[k] + _c3
-
-                _c4 = 0
-                for n in range(compNo):
-                    _c4 = xi[n]*taij[n, j]*Gij[n, j] + _c4
-
-                _c5 = taij[i, j] - (_c4/_c3)
-
-                # set
-                C0[i, j] = (_c2/_c3)*_c5
-
-            _c6 = (_c0/_c1) + np.sum(C0[i, :])
-            AcCoi[i] = exp(_c6)
+        # activity coefficient (tau[i,j], G[i,j] at T)
+        AcCoi = NRTLModel(aij, gij).activityCoefficient(xi, T)
 
         # res
-        return AcCoi
+        return AcCoi[0]
@@ -0,0 +1,319 @@
+# ACTIVITY COEFFICIENT MODELS (BATCH)
+# ------------------------------------
+
+# packages/modules
+from abc import ABC, abstractmethod
+import numpy as np
+# local
+from PyCTPM.core.constants import R_CONST, VAN_LAAR_ACTIVITY_MODEL, WILSON_ACTIVITY_MODEL, \
+    NRTL_ACTIVITY_MODEL, MARGULES_ACTIVITY_MODEL
+
+
+def rowDot(xi, A):
+    '''
+    sum(x[j]*A[j,i]) for each row of xi
+
+    args:
+        xi: *** array *** (M, N)
+        A: *** array *** (N, N) or (M, N, N)
+
+    return:
+        res: *** array *** (M, N)
+    '''
+    return np.matmul(xi[:, None, :], A)[:, 0, :]
+
+
+def transpose(A):
+    '''
+    transpose of the last two axes
+    '''
+    return np.swapaxes(A, -1, -2)
+
+
+class ActivityModel(ABC):
+    '''
+    liquid activity coefficient model (batch)
+
+    all models share one interface:
+        xi: liquid mole fraction (N) or (M, N)
+        T: temperature [K] scalar or (M)
+
+        activityCoefficient(xi, T): gamma *** array *** (M, N)
+        excessGibbs(xi, T): G(E)/RT *** array *** (M)
+        calculate(xi, T): gamma, G(E)/RT
+
+    temperature-dependent parameters (e.g. Lambda[i,j], tau[i,j]) are evaluated once per
+    temperature (N, N), or once per call for a temperature array (M, N, N)
+    '''
+
+    # model name
+    name = ''
+
+    def __init__(self, compNo):
+        self.compNo = compNo
+        # last temperature parameters
+        self._T = None
+        self._params = None
+
+    def temperatureParameters(self, T):
+        '''
+        temperature-dependent parameters (set by each model)
+
+        args:
+            T: temperature [K] scalar or (M, 1, 1)
+        '''
+        return {}
+
+    @abstractmethod
+    def lnActivityCoefficient(self, xi, params):
+        '''
+        ln(gamma) (set by each model)
+        '''
+
+    def excessGibbsSet(self, xi, lnGamma, params):
+        '''
+        G(E)/RT = sum(x[i]*ln(gamma[i]))
+        '''
+        return np.sum(xi*lnGamma, axis=1)
+
+    def parameters(self, T):
+        '''
+        temperature-dependent parameters (cached for the last scalar temperature)
+        '''
+        T = np.asarray(T, dtype=float)
+        # a single temperature
+        if T.ndim > 0 and T.size > 0 and np.all(T == T.flat[0]):
+            T = T.flat[0]
+        if np.ndim(T) == 0:
+            T = float(T)
+            if self._T != T:
+                self._params = self.temperatureParameters(T)
+                self._T = T
+            return self._params
+        # temperature array (M, 1, 1)
+        return self.temperatureParameters(T.reshape(-1, 1, 1))
+
+    @staticmethod
+    def moleFractionSet(xi):
+        '''
+        mole fraction as (M, N)
+        '''
+        xi = np.asarray(xi, dtype=float)
+        return xi.reshape(1, -1) if xi.ndim == 1 else xi
+
+    def calculate(self, xi, T=None):
+        '''
+        activity coefficient and excess molar gibbs energy
+
+        return:
+            gamma: activity coefficient *** array *** (M, N)
+            GE: G(E)/RT *** array *** (M)
+        '''
+        xi = self.moleFractionSet(xi)
+        params = self.parameters(T)
+        lnGamma = self.lnActivityCoefficient(xi, params)
+        return np.exp(lnGamma), self.excessGibbsSet(xi, lnGamma, params)
+
+    def activityCoefficient(self, xi, T=None):
+        '''
+        activity coefficient *** array *** (M, N)
+        '''
+        xi = self.moleFractionSet(xi)
+        return np.exp(self.lnActivityCoefficient(xi, self.parameters(T)))
+
+    def excessGibbs(self, xi, T=None):
+        '''
+        G(E)/RT *** array *** (M)
+        '''
+        return self.calculate(xi, T)[1]
+
+
+class MargulesModel(ActivityModel):
+    '''
+    Margules equation (binary system)
+
+    args:
+        Aij: Margules constant(s)
+            1. one-parameter: [A]
+            2. two-parameter: [A12, A21]
+    '''
+
+    name = MARGULES_ACTIVITY_MODEL
+
+    def __init__(self, Aij):
+        ActivityModel.__init__(self, 2)
+        self.Aij = np.atleast_1d(np.asarray(Aij, dtype=float))
+
+    def lnActivityCoefficient(self, xi, params):
+        x1 = xi[:, 0]
+        x2 = xi[:, 1]
+        if self.Aij.size == 1:
+            # 1-parameter
+            return self.Aij[0]*np.power(1 - xi, 2)
+        # 2-parameter
+        A12, A21 = self.Aij[:2]
+        lnGamma1 = np.power(x2, 2)*(A12 + 2*(A21 - A12)*x1)
+        lnGamma2 = np.power(x1, 2)*(A21 + 2*(A12 - A21)*x2)
+        return np.stack([lnGamma1, lnGamma2], axis=1)
+
+
+class VanLaarModel(ActivityModel):
+    '''
+    van Laar theory using van der Waals constants (multi-component)
+
+    ln(gamma[i]) = (b[i]/RT)*(sum(phi[j]*D[i,j]) - 1/2*sum(phi[j]*phi[k]*D[j,k]))
+        D[i,j] = (sqrt(a[i])/b[i] - sqrt(a[j])/b[j])^2
+        phi[i] = x[i]*b[i]/sum(x[j]*b[j])
+
+    for a binary system: ln(gamma[1]) = L12*(1 + L12*x1/(L21*x2))^-2
+
+    args:
+        ai: van der Waals a constant
+        bi: van der Waals b constant
+    '''
+
+    name = VAN_LAAR_ACTIVITY_MODEL
+
+    def __init__(self, ai, bi):
+        self.ai = np.asarray(ai, dtype=float)
+        self.bi = np.asarray(bi, dtype=float)
+        ActivityModel.__init__(self, self.ai.size)
+        # D[i,j]
+        _delta = np.sqrt(self.ai)/self.bi
+        self.Dij = np.power(_delta[:, None] - _delta[None, :], 2)
+
+    def temperatureParameters(self, T):
+        # 1/RT
+        return {"RT": R_CONST*np.ravel(np.asarray(T, dtype=float)).reshape(-1, 1)}
+
+    def lnActivityCoefficient(self, xi, params):
+        # volume fraction
+        _xb = xi*self.bi
+        phi = _xb/np.sum(_xb, axis=1, keepdims=True)
+        # sum(phi[j]*D[i,j])
+        _c0 = phi @ self.Dij.T
+        _c1 = 0.5*np.sum(phi*_c0, axis=1, keepdims=True)
+        return (self.bi/params['RT'])*(_c0 - _c1)
+
+
+class WilsonModel(ActivityModel):
+    '''
+    Wilson equation (multi-component)
+
+    Lambda[i,j] = (V[j]/V[i])*exp(-alpha[i,j]/RT), Lambda[i,i] = 1
+    ln(gamma[i]) = 1 - ln(S[i]) - sum(x[k]*Lambda[k,i]/S[k]), S[i] = sum(x[j]*Lambda[i,j])
+    G(E)/RT = -sum(x[i]*ln(S[i]))
+
+    args:
+        aij: alpha[i,j] composition-independent parameters [J/mol]
+        molarVolume: function T -> liquid molar volume [m^3/mol] (M, N)
+    '''
+
+    name = WILSON_ACTIVITY_MODEL
+
+    def __init__(self, aij, molarVolume):
+        self.aij = np.asarray(aij, dtype=float)
+        self.molarVolume = molarVolume
+        ActivityModel.__init__(self, self.aij.shape[0])
+
+    def temperatureParameters(self, T):
+        # molar volume [m^3/mol]
+        MoVoi = self.molarVolume(np.ravel(T))
+        MoVoi = MoVoi[0] if np.ndim(T) == 0 else MoVoi[:, None, :]
+        # Lambda[i,j]
+        Aij = (MoVoi/np.swapaxes(MoVoi, -1, -2) if np.ndim(T) > 0 else MoVoi[None, :]/MoVoi[:, None]) * \
+            np.exp(-1*self.aij/(R_CONST*T))
+        Aij = Aij*(1 - np.eye(self.compNo)) + np.eye(self.compNo)
+        return {"Aij": Aij}
+
+    @staticmethod
+    def lnActivityCoefficientSet(xi, Aij):
+        '''
+        ln(gamma) and S for Lambda[i,j] (N, N) or (M, N, N)
+        '''
+        S = rowDot(xi, transpose(Aij))
+        lnGamma = 1 - np.log(S) - rowDot(xi/S, Aij)
+        return lnGamma, S
+
+    def lnActivityCoefficient(self, xi, params):
+        return self.lnActivityCoefficientSet(xi, params['Aij'])[0]
+
+    def excessGibbsSet(self, xi, lnGamma, params):
+        S = rowDot(xi, transpose(params['Aij']))
+        return -np.sum(xi*np.log(S), axis=1)
+
+
+class NRTLModel(ActivityModel):
+    '''
+    non-random two-liquid model (multi-component)
+
+    tau[i,j] = g[i,j]/RT (tau[i,i] = 0), G[i,j] = exp(-a[i,j]*tau[i,j])
+    ln(gamma[i]) = N[i]/D[i] + sum(x[j]*G[i,j]/D[j]*(tau[i,j] - N[j]/D[j]))
+        N[i] = sum(x[j]*tau[j,i]*G[j,i])
+        D[i] = sum(x[j]*G[j,i])
+    G(E)/RT = sum(x[i]*N[i]/D[i])
+
+    args:
+        aij: non-randomness parameter (a[i,j]=a[j,i])
+        gij: interaction energy parameter [J/mol]
+    '''
+
+    name = NRTL_ACTIVITY_MODEL
+
+    def __init__(self, aij, gij):
+        self.aij = np.asarray(aij, dtype=float)
+        self.gij = np.asarray(gij, dtype=float)
+        ActivityModel.__init__(self, self.aij.shape[0])
+
+    def temperatureParameters(self, T):
+        # tau[i,j]
+        taij = (self.gij/(R_CONST*T))*(1 - np.eye(self.compNo))
+        return {"taij": taij, "Gij": np.exp(-1*self.aij*taij)}
+
+    @staticmethod
+    def lnActivityCoefficientSet(xi, taij, Gij):
+        '''
+        ln(gamma), N and D for tau[i,j], G[i,j] (N, N) or (M, N, N)
+        '''
+        N = rowDot(xi, taij*Gij)
+        D = rowDot(xi, Gij)
+        ND = N/D
+        lnGamma = ND + rowDot(xi/D, transpose(Gij*taij)) - \
+            rowDot(xi*ND/D, transpose(Gij))
+        return lnGamma, N, D
+
+    def lnActivityCoefficient(self, xi, params):
+        return self.lnActivityCoefficientSet(xi, params['taij'], params['Gij'])[0]
+
+    def excessGibbsSet(self, xi, lnGamma, params):
+        N = rowDot(xi, params['taij']*params['Gij'])
+        D = rowDot(xi, params['Gij'])
+        return np.sum(xi*N/D, axis=1)
+
+
+def activityModel(name, params=None, poolData=None):
+    '''
+    build an activity coefficient model
+
+    args:
+        name: model name (van-laar, wilson, nrtl, margules)
+        params: model parameters
+            1. van-laar: not required (van der Waals constants of the pool)
+            2. wilson: aij
+            3. nrtl: {aij, gij}
+            4. margules: Aij
+        poolData: pool data (PoolData)
+
+    return:
+        model: ActivityModel
+    '''
+    if name == VAN_LAAR_ACTIVITY_MODEL:
+        return VanLaarModel(poolData.aVDW, poolData.bVDW)
+    elif name == WILSON_ACTIVITY_MODEL:
+        return WilsonModel(params, poolData.molarVolumeRackett)
+    elif name == NRTL_ACTIVITY_MODEL:
+        return NRTLModel(params['aij'], params['gij'])
+    elif name == MARGULES_ACTIVITY_MODEL:
+        return MargulesModel(params)
+    else:
+        raise Exception(f"activity coefficient model {name} is not defined!")
@@ -4,13 +4,13 @@
 # package/module list
 import string
 import numpy as np
-import pandas as pd
 # local
 from PyCTPM.core.package import PackInfo
 from PyCTPM.core.utilities import csvLoaderV2, loadGeneralDataV2, loadGeneralDataV3
 from PyCTPM.database.dataInfo import DATABASE_INFO, DB_GENERAL, DB_HEAT, DB_VAPOR_PRESSURE
 from PyCTPM.docs.equilibrium import EquilibriumClass
 from PyCTPM.docs.dThermo import SetPhase, calMolarVolume, calVapourPressure
+from PyCTPM.docs.proptable import PropertyTable
 from PyCTPM.database import DataSource
 
 
@@ -50,6 +50,9 @@ class Component(EquilibriumClass):
     _T_Tc_ratio = 0
     _Vp = 0
 
+    # ! property table (opt-in)
+    propertyTable = None
+
     def __init__(self, id, state):
         self.id = str(id)
         self.state = state
@@ -201,7 +204,7 @@ class Component(EquilibriumClass):
                 vaporPressureList = DataSource.dbSearch(
                     self.id, self.state, loadGeneralDataV3, DB_VAPOR_PRESSURE)
                 # vaporPressureList = csvLoaderV2(
-                #     [self.id], DATABASE_INFO[4]['file'], 1)
+                #     [self.id], DATABASE_INFO[4]['file'])
 
                 # REVIEW
                 # res
@@ -251,6 +254,9 @@ class Component(EquilibriumClass):
         show a list of thermo properties
         '''
         try:
+            # import
+            import pandas as pd
+
             df = pd.DataFrame(self.thermoPropData, index=[1])
             return df
         except Exception as e:
@@ -272,6 +278,11 @@ class Component(EquilibriumClass):
             3. shortcut
         '''
         try:
+            # property table
+            if self.propertyTable is not None and mode == self.propertyTable.vaporPressureMethod \
+                    and eos_model == self.propertyTable.eosModel:
+                return self.propertyTable.vapor_pressure(T)
+
             _res = self.vaporPressure(T, mode, eos_model)
 
             return _res
@@ -292,9 +303,14 @@ class Component(EquilibriumClass):
 
         return:
             Z: compressibility coefficient [-]
-            eos-params: a,b,A,B,alpha,beta,gamma
+            eos-params: a,b,A,B,alpha,beta,gamma (not set by the property table)
         '''
         try:
+            # property table (component phase root)
+            if self.__propertyTableSet(P, T, eos_model):
+                Z = self.propertyTable.compressibility_factor(P, T)
+                return {'Zs': np.array([Z]), 'pressure': P, 'temperature': T}
+
             _res = self.compressibilityFactor(P, T, eos_model)
 
             return _res
@@ -316,9 +332,14 @@ class Component(EquilibriumClass):
         return:
             Vms: molar-volume list for all Z [m^3/mol]
             Z: compressibility coefficient [-]
-            eos-params: a,b,A,B,alpha,beta,gamma
+            eos-params: a,b,A,B,alpha,beta,gamma (not set by the property table)
         '''
         try:
+            # property table (component phase root)
+            if self.__propertyTableSet(P, T, eos_model):
+                Z = self.propertyTable.compressibility_factor(P, T)
+                return calMolarVolume(P, T, Z), {'Zs': np.array([Z]), 'pressure': P, 'temperature': T}
+
             _res = self.molarVolume(P, T, eos_model)
 
             return _res
@@ -349,6 +370,10 @@ class Component(EquilibriumClass):
             # set phase
             phase = SetPhase(self.state)
 
+            # property table (eos fugacity)
+            if self.__propertyTableSet(P, T, eos_model) and not (phase == 'liquid' and pressure_correction == True):
+                return self.propertyTable.fugacity(P, T)
+
             _res = self.fugacities(
                 P, T, phase, eos_model, pressure_correction)
 
@@ -357,3 +382,73 @@ class Component(EquilibriumClass):
 
         except Exception as e:
             raise Exception("fugacity failed!, ", e)
+
+    # NOTE
+    # ! cache
+
+    def cache_info(self):
+        '''
+        memoization cache statistics (hits, misses, evictions, size)
+        '''
+        return self.cache.info()
+
+    def cache_clear(self):
+        '''
+        remove all cached results
+        '''
+        self.cache.clear()
+
+    # NOTE
+    # ! property table
+
+    @property
+    def property_table(self):
+        return self.propertyTable
+
+    def enable_property_table(self, T_range, P_range, T_no=64, P_no=64, eos_model='PR', vapor_pressure_method='polynomial', tolerance=1e-6):
+        '''
+        precompute vapor-pressure, compressibility factor, molar-volume and fugacity on a (P, T) grid,
+        then vapor_pressure, compressibility_factor, molar_volume and fugacity are served by interpolation
+
+        args:
+            T_range: temperature range [K] [Tmin, Tmax]
+            P_range: pressure range [Pa] [Pmin, Pmax]
+            T_no: number of temperature points
+            P_no: number of pressure points
+            eos_model: eos model (PR)
+            vapor_pressure_method: vapor-pressure method served by the table
+            tolerance: max error of a grid cell (relative: Z, P*, absolute: ln(phi)), checked
+                against the direct calculation on a sub-grid of each cell
+
+        notes:
+            1. queries outside the grid or in a cell above the tolerance use the direct calculation
+            2. only the root of the component phase (state) is tabulated
+
+        return:
+            coverage: fraction of the grid served by the table
+        '''
+        try:
+            # check
+            if self.state not in ('g', 'l'):
+                raise Exception("component state should be g or l!")
+
+            self.propertyTable = PropertyTable(
+                self, T_range, P_range, T_no, P_no, eos_model, vapor_pressure_method, tolerance)
+
+            # res
+            return self.propertyTable.coverage()
+        except Exception as e:
+            raise Exception("building property table failed!, ", e)
+
+    def disable_property_table(self):
+        '''
+        remove the property table (direct calculation)
+        '''
+        self.propertyTable = None
+
+    def __propertyTableSet(self, P, T, eos_model):
+        '''
+        check a query can be served by the property table (scalar P, T)
+        '''
+        return self.propertyTable is not None and eos_model == self.propertyTable.eosModel \
+            and np.ndim(P) == 0 and np.ndim(T) == 0
@@ -0,0 +1,171 @@
+# CORRELATION EXPRESSION COMPILER
+# --------------------------------
+
+# import packages/modules
+import ast
+import numpy as np
+from functools import lru_cache
+
+# allowed functions (numpy, array-friendly)
+CORRELATION_FUNCTIONS = {
+    "exp": np.exp,
+    "log": np.log,
+    "ln": np.log,
+    "log10": np.log10,
+    "sqrt": np.sqrt,
+    "pow": np.power,
+    "power": np.power,
+    "abs": np.abs,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+}
+
+# allowed constants
+CORRELATION_CONSTANTS = {
+    "pi": np.pi,
+    "e": np.e
+}
+
+# allowed variables (temperature, equation parameters)
+CORRELATION_VARIABLES = ["T", "A", "B", "C", "D", "E",
+                         "C1", "C2", "C3", "C4", "C5"]
+
+# allowed syntax
+CORRELATION_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+                     ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow,
+                     ast.USub, ast.UAdd)
+
+
+class Correlation:
+    '''
+    compiled correlation expression (e.g. Cp = f(T))
+
+    the expression is parsed once, its syntax tree is checked against a whitelist
+    (arithmetic, numpy functions, variables T/A..E/C1..C5), then it is compiled to a code object,
+    the callable accepts a scalar or numpy array temperature
+    '''
+
+    def __init__(self, expr):
+        self.expr = str(expr).strip()
+        # parse
+        tree = ast.parse(self.expr, mode='eval')
+        # check
+        self.variables = self.checkTree(tree)
+        # compile
+        self.code = compile(tree, '<correlation>', 'eval')
+
+    @staticmethod
+    def checkTree(tree):
+        '''
+        check syntax tree
+
+        return:
+            variables: variable names used in the expression
+        '''
+        variables = []
+        for node in ast.walk(tree):
+            if not isinstance(node, CORRELATION_NODES):
+                raise Exception(
+                    f"correlation syntax {type(node).__name__} is not allowed!")
+            if isinstance(node, ast.Constant) and (isinstance(node.value, bool) or not isinstance(node.value, (int, float))):
+                raise Exception(
+                    f"correlation constant {node.value!r} is not allowed!")
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in CORRELATION_FUNCTIONS or len(node.keywords) > 0:
+                    raise Exception("correlation function is not allowed!")
+            if isinstance(node, ast.Name):
+                if node.id in CORRELATION_VARIABLES:
+                    if node.id not in variables:
+                        variables.append(node.id)
+                elif node.id not in CORRELATION_FUNCTIONS and node.id not in CORRELATION_CONSTANTS:
+                    raise Exception(
+                        f"correlation name {node.id} is not defined!")
+        return variables
+
+    def __call__(self, T, **params):
+        '''
+        evaluate expression
+
+        args:
+            T: temperature [K] (scalar/array)
+            params: equation parameters (A..E, C1..C5)
+        '''
+        # namespace
+        _vars = {**CORRELATION_FUNCTIONS, **CORRELATION_CONSTANTS}
+        _vars['T'] = toTemperature(T)
+        for key in self.variables:
+            if key != 'T':
+                _vars[key] = float(params[key])
+        # res
+        return eval(self.code, {"__builtins__": {}}, _vars)
+
+
+class BoundCorrelation:
+    '''
+    correlation with fixed parameters (one component)
+    '''
+
+    def __init__(self, correlation, params):
+        self.correlation = correlation
+        self.params = dict(params)
+
+    def __call__(self, T):
+        return self.correlation(T, **self.params)
+
+
+def asFloat(x):
+    '''
+    scalar/array as float/float64 array (avoid integer powers)
+    '''
+    if np.ndim(x) == 0:
+        return float(x)
+    return np.asarray(x, dtype=float)
+
+
+def toTemperature(T):
+    '''
+    temperature as float/float64 array (avoid integer powers)
+    '''
+    return asFloat(T)
+
+
+@lru_cache(maxsize=None)
+def compileCorrelation(expr):
+    '''
+    compile a correlation expression (cached per expression)
+
+    args:
+        expr: expression string
+
+    return:
+        Correlation
+    '''
+    try:
+        return Correlation(expr)
+    except Exception as e:
+        raise Exception(f"compiling correlation {expr} failed!, ", e)
+
+
+@lru_cache(maxsize=None)
+def _bindCorrelation(expr, params):
+    return BoundCorrelation(compileCorrelation(expr), params)
+
+
+def bindCorrelation(expr, params={}):
+    '''
+    compiled correlation with fixed parameters (cached per expression/parameters)
+
+    args:
+        expr: expression string
+        params: equation parameters {name: value}
+
+    return:
+        fun(T)
+    '''
+    _params = tuple(sorted((key, float(value))
+                    for key, value in params.items()))
+    return _bindCorrelation(str(expr).strip(), _params)
@@ -0,0 +1,186 @@
+# GENERIC CUBIC EOS
+# -----------------
+
+# packages/modules
+import numpy as np
+# local
+from PyCTPM.core.constants import R_CONST
+
+# two-parameter cubic eos
+#   P = RT/(V-b) - a(T)/((V + delta1*b)*(V + delta2*b))
+#   u = delta1 + delta2, w = delta1*delta2
+#   a(T) = OmegaA*(R*Tc)^2/Pc*alpha(T), b = OmegaB*R*Tc/Pc
+# alpha(T):
+#   soave: (1 + kappa*(1 - sqrt(Tr)))^2
+#   rk: 1/sqrt(Tr)
+#   None: 1
+CUBIC_EOS = {
+    "PR": {"u": 2, "w": -1, "OmegaA": 0.45723553, "OmegaB": 0.07779607, "alpha": "soave"},
+    "SRK": {"u": 1, "w": 0, "OmegaA": 0.42748023, "OmegaB": 0.08664035, "alpha": "soave"},
+    "RK": {"u": 1, "w": 0, "OmegaA": 0.42748023, "OmegaB": 0.08664035, "alpha": "rk"},
+    "VDW": {"u": 0, "w": 0, "OmegaA": 27/64, "OmegaB": 1/8, "alpha": None},
+}
+
+# other names of the eos
+CUBIC_EOS_ALIAS = {
+    "SKR": "SRK",
+    "RKS": "SRK",
+    "VW": "VDW"
+}
+
+
+def cubicEosName(eosName):
+    '''
+    eos name (alias -> CUBIC_EOS key)
+    '''
+    _name = CUBIC_EOS_ALIAS.get(eosName, eosName)
+    # check
+    if _name not in CUBIC_EOS:
+        raise Exception(f"eos {eosName} is not supported!")
+    return _name
+
+
+class CubicEos:
+    '''
+    generic cubic eos kernel (PR, SRK, RK, VDW)
+
+    all eos share the same f(Z) coefficients, root selection, fugacity and departure
+    functions, an eos is defined by a row of CUBIC_EOS only
+
+        f(Z) = Z^3 + alpha*Z^2 + beta*Z + gamma
+            alpha = (u - 1)*B - 1
+            beta = A - (u - w)*B^2 - u*B
+            gamma = -A*B - w*B^2 - w*B^3
+
+    attraction term (delta1 = delta2: limit A/(Z + delta1*B)):
+
+        A/(B*(delta1 - delta2))*ln((Z + delta1*B)/(Z + delta2*B))
+    '''
+
+    # kernels {name: CubicEos}
+    _kernels = {}
+
+    def __init__(self, eosName):
+        self.name = cubicEosName(eosName)
+        _params = CUBIC_EOS[self.name]
+        self.u = _params['u']
+        self.w = _params['w']
+        self.OmegaA = _params['OmegaA']
+        self.OmegaB = _params['OmegaB']
+        self.alphaModel = _params['alpha']
+        # delta1, delta2
+        self.deltaDiff = np.sqrt(self.u*self.u - 4*self.w)
+        self.delta1 = (self.u + self.deltaDiff)/2
+        self.delta2 = (self.u - self.deltaDiff)/2
+
+    @classmethod
+    def get(cls, eosName):
+        '''
+        shared kernel of an eos
+        '''
+        _name = cubicEosName(eosName)
+        _res = cls._kernels.get(_name)
+        if _res is None:
+            _res = cls(_name)
+            cls._kernels[_name] = _res
+        return _res
+
+    # NOTE
+    # ! pure-component constants
+
+    def ac(self, Pc, Tc):
+        '''
+        a constant at the critical temperature [Pa.(m3^2)/(mol^2)]
+        '''
+        return (self.OmegaA*(np.power(R_CONST, 2)*np.power(Tc, 2)))/Pc
+
+    def b(self, Pc, Tc):
+        '''
+        b constant [m^3/mol]
+        '''
+        return (self.OmegaB*R_CONST*Tc)/Pc
+
+    def kappa(self, w):
+        '''
+        kappa of the soave alpha function (None for the other alpha functions)
+
+        args:
+            w: acentric factor [-] *** array *** (N)
+        '''
+        if self.alphaModel != "soave":
+            return None
+        if self.name == "PR":
+            return np.where(w < 0.49, 0.37464 + 1.54226*w - 0.26993*np.power(w, 2),
+                            0.379642 + 1.48503*w - 0.164423*np.power(w, 2) + 0.016666*np.power(w, 3))
+        return 0.480 + 1.574*w - 0.176*np.power(w, 2)
+
+    def alphaT(self, T, Tc, kappa):
+        '''
+        alpha(T) for many temperatures
+
+        args:
+            T: temperature [K] *** array *** (M,1)
+            Tc: critical temperature [K] *** array *** (N)
+            kappa: soave kappa *** array *** (N)
+
+        return:
+            alpha: *** array *** (M,N)
+        '''
+        if self.alphaModel == "soave":
+            return np.power(1 + kappa*(1 - np.sqrt(T/Tc)), 2)
+        elif self.alphaModel == "rk":
+            return 1/np.sqrt(T/Tc)
+        return np.ones((T.shape[0], Tc.size))
+
+    def dalphaT(self, T, Tc, kappa):
+        '''
+        d(alpha)/dT for many temperatures [1/K] *** array *** (M,N)
+        '''
+        if self.alphaModel == "soave":
+            _sqrtTr = np.sqrt(T/Tc)
+            return -kappa*(1 + kappa*(1 - _sqrtTr))*_sqrtTr/T
+        elif self.alphaModel == "rk":
+            return -0.5/(np.sqrt(T/Tc)*T)
+        return np.zeros((T.shape[0], Tc.size))
+
+    # NOTE
+    # ! f(Z)
+
+    def coefficients(self, A, B):
+        '''
+        f(Z) coefficients
+
+        return:
+            alpha, beta, gamma
+        '''
+        u, w = self.u, self.w
+        alpha = (u - 1)*B - 1
+        beta = A - (u - w)*np.power(B, 2) - u*B
+        gamma = -A*B - w*np.power(B, 2) - w*np.power(B, 3)
+        return alpha, beta, gamma
+
+    def attraction(self, Z, A, B):
+        '''
+        attraction term of ln(phi) (pure component/mixture)
+
+            A/(B*(delta1 - delta2))*ln((Z + delta1*B)/(Z + delta2*B))
+        '''
+        d1, d2 = self.delta1, self.delta2
+        if self.deltaDiff == 0:
+            return A/(Z + d1*B)
+        return (A/(B*self.deltaDiff))*np.log((Z + d1*B)/(Z + d2*B))
+
+    def residualGibbs(self, Z, A, B):
+        '''
+        residual Gibbs energy G[R]/RT (ln(phi) of a pure component)
+        '''
+        return (Z - 1) - np.log(Z - B) - self.attraction(Z, A, B)
+
+    def residualEnthalpy(self, Z, A, B, dlnadlnT):
+        '''
+        residual enthalpy H[R]/RT
+
+        args:
+            dlnadlnT: T*(da/dT)/a of the mixture
+        '''
+        return (Z - 1) + (dlnadlnT - 1)*self.attraction(Z, A, B)
@@ -0,0 +1,117 @@
+# CUBIC EQUATION ROOTS
+# ---------------------
+
+# import packages/modules
+import numpy as np
+# internals
+from PyCTPM.core.config import EOS_ROOT_TOLERANCE
+
+
+def cubicRoots(alpha, beta, gamma, polishNo=2):
+    '''
+    find real roots of f(Z) = Z^3 + alpha*Z^2 + beta*Z + gamma (vectorized)
+
+    the cubic is reduced to its depressed form t^3 + p*t + q = 0 (Z = t - alpha/3), then:
+        1. one real root (discriminant > 0): Cardano formula
+        2. three real roots (discriminant <= 0): trigonometric formula
+
+    accuracy:
+        each root is polished by Newton steps on the original cubic, so |f(Z)| is at
+        the round-off level of double precision (relative to the largest term of f)
+
+    args:
+        alpha: coefficient of Z^2 (scalar/array)
+        beta: coefficient of Z (scalar/array)
+        gamma: constant term (scalar/array)
+        polishNo: number of Newton steps
+
+    return:
+        Zs: real roots *** array *** (..., 3) sorted ascending, nan for non-real roots
+    '''
+    # broadcast
+    alpha, beta, gamma = np.broadcast_arrays(
+        np.asarray(alpha, dtype=float), np.asarray(beta, dtype=float), np.asarray(gamma, dtype=float))
+    shape = alpha.shape
+    a = alpha.ravel()
+    b = beta.ravel()
+    c = gamma.ravel()
+
+    # depressed cubic
+    a3 = a/3
+    p = b - a*a3
+    q = 2*np.power(a3, 3) - a3*b + c
+    # discriminant
+    D = np.power(q/2, 2) + np.power(p/3, 3)
+
+    # roots
+    Zs = np.full((a.size, 3), np.nan)
+
+    # ! one real root (Cardano)
+    m1 = D > 0
+    if np.any(m1):
+        _q = q[m1]
+        _p = p[m1]
+        # avoid cancellation
+        _s = np.where(_q >= 0, 1.0, -1.0)
+        u = np.cbrt(-_q/2 - _s*np.sqrt(D[m1]))
+        _u = np.where(u == 0, 1.0, u)
+        t = np.where(u == 0, 0.0, u - _p/(3*_u))
+        Zs[m1, 0] = t - a3[m1]
+
+    # ! three real roots (trigonometric)
+    m3 = ~m1
+    if np.any(m3):
+        _q = q[m3]
+        _p = np.minimum(p[m3], 0.0)
+        _pSafe = np.where(_p < 0, _p, -1.0)
+        r = 2*np.sqrt(-_p/3)
+        _c = np.where(_p < 0, (3*_q/(2*_pSafe))*np.sqrt(-3/_pSafe), 0.0)
+        theta = np.arccos(np.clip(_c, -1.0, 1.0))/3
+        for k in range(3):
+            Zs[m3, k] = r*np.cos(theta - 2*np.pi*k/3) - a3[m3]
+
+    # ! Newton polishing
+    A = a[:, None]
+    B = b[:, None]
+    C = c[:, None]
+    for i in range(polishNo):
+        fZ = ((Zs + A)*Zs + B)*Zs + C
+        dfZ = (3*Zs + 2*A)*Zs + B
+        step = np.where(np.abs(dfZ) > 1e-300, fZ/np.where(dfZ == 0, 1.0, dfZ), 0.0)
+        Zs = np.where(np.isfinite(step), Zs - step, Zs)
+
+    # sort (nan at the end)
+    Zs = np.sort(Zs, axis=1)
+
+    # res
+    return Zs.reshape(shape + (3,))
+
+
+def cubicRealRoots(alpha, beta, gamma, Zmin=0.0, tol=EOS_ROOT_TOLERANCE):
+    '''
+    distinct physical roots of f(Z) for a single state
+
+    args:
+        alpha, beta, gamma: cubic coefficients
+        Zmin: lower bound of physical roots (Z > B for a cubic eos)
+        tol: relative tolerance to merge (double/triple) roots
+
+    return:
+        Zs: distinct real roots *** array *** sorted as liquid -> vapor,
+            empty if no root is above Zmin
+    '''
+    # all real roots
+    _Zs = cubicRoots(alpha, beta, gamma)
+    _Zs = _Zs[np.isfinite(_Zs)]
+
+    # physical roots
+    Zs = _Zs[_Zs > Zmin]
+
+    # merge repeated roots
+    res = []
+    for Z in Zs:
+        if len(res) == 0 or abs(Z - res[-1]) > tol*max(1.0, abs(Z)):
+            res.append(Z)
+
+    # res
+    return np.array(res)
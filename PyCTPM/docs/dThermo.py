@@ -4,9 +4,10 @@
 # import packages/modules
 import numpy as np
 import re
-from math import sqrt, exp, pow, log
+from math import pow
 # internals
 from PyCTPM.core import Tref, R_CONST
+from PyCTPM.docs.correlation import bindCorrelation, toTemperature, asFloat
 
 
 def main():
@@ -67,8 +68,11 @@ def calCpEq1(comList, T, loadData):
 
         args:
             comList: component name list
-            T: temperature [K]
+            T: temperature [K] (scalar/array)
             loadData: expr to be evaluated 
+
+        return:
+            Cpi: heat capacity *** array *** (N) or (N, M) for array T
     """
     # try/except
     try:
@@ -81,8 +85,8 @@ def calCpEq1(comList, T, loadData):
         for i in comList:
             # fun expr
             CpiData = [item['Cp'] for item in loadData if i == item['symbol']]
-            # fun
-            def cpFun(T): return eval(CpiData[0])
+            # fun (compiled once)
+            cpFun = bindCorrelation(CpiData[0])
             # fun exe
             CpiVal = cpFun(T)
             # store
@@ -443,6 +447,7 @@ def calGasVisEq1(params, T):
         B = float(params[1])
         C = float(params[2])
         D = float(params[3])
+        T = toTemperature(T)
         _res = A*1e-6*(T**B)/(1+C*(1/T)+D*(T**-2))
         return _res
     except Exception as e:
@@ -454,11 +459,11 @@ def calGasVisEq2(eqExpr, T):
     gas viscosity equation - Pa.s
     args:
         eqExpr: equation expression
-        T: temperature [K]
+        T: temperature [K] (scalar/array)
     """
     # try/except
     try:
-        return eval(eqExpr)
+        return bindCorrelation(eqExpr)(T)
     except Exception as e:
         raise
 
@@ -562,7 +567,7 @@ def calGasThermalConductivity(comList, T, loadData):
                     # eq2
                     _eqExpr = _eqData.get('eqExpr')
                     # build fun
-                    _res = calGasVisEq2(_eqExpr, T)
+                    _res = calGasTherCondEq2(_eqExpr, T)
                     _ThCoi.append(_res)
                 else:
                     print('viscosity data not found, update app database!')
@@ -586,21 +591,16 @@ def calGasTherCondEq1(expr, params, T):
     args:
         params: 
             equation parameters list [C1, C2, C3, C4]
-        T: temperature [K]
+        T: temperature [K] (scalar/array)
     """
     # try/except
     try:
         # params
-        C1 = float(params[0])
-        C2 = float(params[1])
-        C3 = float(params[2])
-        C4 = float(params[3])
-        # expr
-        def ThCoFun(T, C1, C2, C3, C4): return eval(expr)
-        _var1 = C1*(T**C2)
-        _var2 = 1 + (C3/T) + C4/(T**2)
-        _res0 = _var1/_var2
-        _res = ThCoFun(T, C1, C2, C3, C4)
+        _params = {"C1": params[0], "C2": params[1],
+                   "C3": params[2], "C4": params[3]}
+        # expr (compiled once)
+        ThCoFun = bindCorrelation(expr, _params)
+        _res = ThCoFun(T)
         return _res
     except Exception as e:
         raise
@@ -629,7 +629,17 @@ def calGasTherCondEq1V1(params, T):
 
 
 def calGasTherCondEq2(eqExpr, T):
-    pass
+    """ 
+    gas thermal conductivity equation - W/m.K
+    args:
+        eqExpr: equation expression
+        T: temperature [K] (scalar/array)
+    """
+    # try/except
+    try:
+        return bindCorrelation(eqExpr)(T)
+    except Exception as e:
+        raise
 
 # NOTE
 ### mixture property ###
@@ -642,6 +652,7 @@ def calMixPropertySelection(params, equation):
         params: changes with respect of eq.
         equation:
             1: Method of Wilke (default)
+            2: Method of Herning and Zipperer
     '''
     try:
         # choose equation
@@ -649,6 +660,10 @@ def calMixPropertySelection(params, equation):
             res = calMixturePropertyM1(params)
             # return
             return res
+        elif equation == 2:
+            res = calMixturePropertyM2(params)
+            # return
+            return res
         else:
             raise Exception("the equation not found, ")
 
@@ -656,57 +671,144 @@ def calMixPropertySelection(params, equation):
         print(e)
 
 
+def mixturePropertyStates(params):
+    '''
+    set mixture property inputs as states (M, N)
+
+    args:
+        Xi: property of components (N), or (N, M) for M temperatures (as calGasViscosity)
+        MoFri: mole fraction (N) or (M, N)
+        MWi: molecular weight [g/mol] (N)
+
+    return:
+        Xi: *** array *** (M, N)
+        MoFri: *** array *** (M, N)
+        MWi: *** array *** (N)
+        batch: more than a single state
+    '''
+    # params
+    Xi = np.asarray(params['Xi'], dtype=float)
+    MoFri = np.asarray(params['MoFri'], dtype=float)
+    MWi = np.asarray(params['MWi'], dtype=float)
+
+    # states
+    batch = Xi.ndim > 1 or MoFri.ndim > 1
+    Xi = Xi.T if Xi.ndim > 1 else Xi.reshape(1, -1)
+    MoFri = MoFri.reshape(-1, MWi.size)
+    Xi, MoFri = np.broadcast_arrays(Xi, MoFri)
+
+    # res
+    return Xi, MoFri, MWi, batch
+
+
+def calWilkeCoefficient(Xi, MWi):
+    '''
+    Wilke coefficient
+
+        phi[i,j] = (1 + sqrt(X[i]/X[j])*(MW[j]/MW[i])^(1/4))^2 / sqrt(8*(1 + MW[i]/MW[j]))
+
+    args:
+        Xi: property of components *** array *** (M, N)
+        MWi: molecular weight [g/mol] *** array *** (N)
+
+    return:
+        phi: *** array *** (M, N, N)
+    '''
+    # MW[j]/MW[i]
+    MWji = MWi[None, :]/MWi[:, None]
+    # X[i]/X[j]
+    Xij = Xi[:, :, None]/Xi[:, None, :]
+    A = np.power(1 + np.sqrt(Xij)*np.power(MWji, 1/4), 2)
+    B = np.sqrt(8*(1 + 1/MWji))
+    return A/B
+
+
+def calMixturePropertyWilke(Xi, MoFri, MWi):
+    '''
+    mixture property (Method of Wilke) for many states
+
+        X[mix] = sum(x[i]*X[i]/sum(x[j]*phi[i,j]))
+
+    args:
+        Xi: property of components *** array *** (M, N)
+        MoFri: mole fraction [-] *** array *** (M, N)
+        MWi: molecular weight [g/mol] *** array *** (N)
+
+    return:
+        mixture property *** array *** (M)
+    '''
+    # phi[i,j]
+    wilkeCo = calWilkeCoefficient(Xi, MWi)
+    # sum(x[j]*phi[i,j])
+    B = np.einsum('mij,mj->mi', wilkeCo, MoFri)
+    # res
+    return np.sum(Xi*MoFri/B, axis=1)
+
+
+def calMixturePropertyHerningZipperer(Xi, MoFri, MWi):
+    '''
+    mixture property (Method of Herning and Zipperer) for many states
+
+        X[mix] = sum(x[i]*X[i]*sqrt(MW[i]))/sum(x[i]*sqrt(MW[i]))
+
+    args:
+        Xi: property of components *** array *** (M, N)
+        MoFri: mole fraction [-] *** array *** (M, N)
+        MWi: molecular weight [g/mol] *** array *** (N)
+
+    return:
+        mixture property *** array *** (M)
+    '''
+    _xM = MoFri*np.sqrt(MWi)
+    return np.sum(_xM*Xi, axis=1)/np.sum(_xM, axis=1)
+
+
 def calMixturePropertyM1(params):
     '''
     calculate mixture property M1
         Method of Wilke
     args:
-        compNo: component number
-        Xi: property name []
-        MoFri: mole fraction [-]
+        Xi: property of components (N), or (N, M) for M temperatures
+        MoFri: mole fraction [-] (N) or (M, N)
         MWi: molecular weight [g/mol]
+
+    output:
+        mixture property, scalar (single state) or *** array *** (M)
     '''
     try:
-        # params
-        Xi = params['Xi']
-        MoFri = params['MoFri']
-        MWi = params['MWi']
-
-        # component no
-        compNo = len(MoFri)
-
-        # wilke res
-        wilkeCo = np.zeros((compNo, compNo))
-        for i in range(compNo):
-            for j in range(compNo):
-                if i == j:
-                    wilkeCo[i, j] = 1
-                else:
-                    if i < j:
-                        # wilke coefficient mix
-                        A = 1 + sqrt(Xi[i]/Xi[j])*((MWi[j]/MWi[i])**(1/4))
-                        AA = A**2
-                        B = 8*(1+(MWi[i]/MWi[j]))
-                        BB = sqrt(B)
-                        wilkeCo[i, j] = AA/BB
-                    else:
-                        C = (Xi[i]/Xi[j])*(MWi[j]/MWi[i]) * wilkeCo[j, i]
-                        wilkeCo[i, j] = C
-        # vars
-        A = np.zeros(compNo)
-        B = np.zeros((compNo, compNo))
+        # states
+        Xi, MoFri, MWi, batch = mixturePropertyStates(params)
+
+        # mixture property
+        mixPropVal = calMixturePropertyWilke(Xi, MoFri, MWi)
+
+        # res
+        return mixPropVal if batch else mixPropVal[0]
+    except Exception as e:
+        print(e)
+
+
+def calMixturePropertyM2(params):
+    '''
+    calculate mixture property M2
+        Method of Herning and Zipperer
+    args:
+        Xi: property of components (N), or (N, M) for M temperatures
+        MoFri: mole fraction [-] (N) or (M, N)
+        MWi: molecular weight [g/mol]
+
+    output:
+        mixture property, scalar (single state) or *** array *** (M)
+    '''
+    try:
+        # states
+        Xi, MoFri, MWi, batch = mixturePropertyStates(params)
+
         # mixture property
-        mixProp = np.zeros(compNo)
-        for i in range(compNo):
-            A[i] = Xi[i]*MoFri[i]
-            for j in range(compNo):
-                B[i, j] = MoFri[j]*wilkeCo[i, j]
-            # set
-            mixProp[i] = A[i]/np.sum(B[i, :])
-
-        mixPropVal = np.sum(mixProp)
+        mixPropVal = calMixturePropertyHerningZipperer(Xi, MoFri, MWi)
+
         # res
-        return mixPropVal
+        return mixPropVal if batch else mixPropVal[0]
     except Exception as e:
         print(e)
 
@@ -723,7 +825,7 @@ def calVapourPressureEq1(params, T):
             A
             B
             C
-        T: temperature [K]
+        T: temperature [K] (scalar/array)
 
     output:
         res: vapour pressure [Pa] - needs conversion from bar to Pa
@@ -735,7 +837,7 @@ def calVapourPressureEq1(params, T):
         C = float(params[2])
 
         # vapour pressure [kPa]
-        res = exp(A - (B/(T+C)))
+        res = np.exp(A - (B/(T+C)))
 
         # res
         return res*1e5
@@ -756,7 +858,7 @@ def calVapourPressureEq2(params, T):
             C3
             C4
             C5
-        T: temperature [K]
+        T: temperature [K] (scalar/array)
 
     output:
         res: vapour pressure [Pa] 
@@ -768,9 +870,10 @@ def calVapourPressureEq2(params, T):
         C3 = float(params[2])
         C4 = float(params[3])
         C5 = float(params[4])
+        T = toTemperature(T)
 
         # vapour pressure [kPa]
-        res = exp(C1 + (C2/T) + C3*log(T) + C4*pow(T, C5))
+        res = np.exp(C1 + (C2/T) + C3*np.log(T) + C4*np.power(T, C5))
 
         # res
         return res
@@ -778,66 +881,132 @@ def calVapourPressureEq2(params, T):
         raise
 
 
+class VaporPressureEngine:
+    '''
+    vectorized vapor-pressure of many components
+
+    components are grouped by equation id once (at construction):
+        1. eq1: Antoine equation, ln(P*[bar]) = A - B/(T+C)
+        2. eq2: DIPPR 101, ln(P*[Pa]) = C1 + C2/T + C3*ln(T) + C4*T^C5
+
+    then each group is evaluated with numpy over a (components x temperatures) grid,
+    dP*/dT is obtained from the same pass (dP*/dT = P* * dln(P*)/dT)
+
+    args:
+        comList: component name list (symbol)
+        loadData: vapor-pressure database records *** list of dict ***
+    '''
+
+    # equation ids
+    eqIds = {'eq1': 1, 'eq2': 2}
+    # equation parameters
+    eqParams = {
+        1: ('A', 'B', 'C'),
+        2: ('C1', 'C2', 'C3', 'C4', 'C5')
+    }
+
+    def __init__(self, comList, loadData):
+        # set
+        self.comList = [str(i) for i in comList]
+        self.compNo = len(self.comList)
+
+        # equation id (0: not found) and parameters
+        self.eqId = np.zeros(self.compNo, dtype=int)
+        self.eq1 = np.full((self.compNo, 3), np.nan)
+        self.eq2 = np.full((self.compNo, 5), np.nan)
+
+        for i, item in enumerate(self.comList):
+            # first record
+            _data = next((record for record in loadData
+                          if record and str(record.get('component-symbol')) == item), None)
+            if _data is None:
+                continue
+            _eqId = self.eqIds.get(_data.get('id'), 0)
+            try:
+                if _eqId == 1:
+                    self.eq1[i, :] = [float(_data[k])
+                                      for k in self.eqParams[1]]
+                elif _eqId == 2:
+                    self.eq2[i, :] = [float(_data[k])
+                                      for k in self.eqParams[2]]
+            except (KeyError, TypeError, ValueError):
+                _eqId = 0
+            self.eqId[i] = _eqId
+
+        # groups
+        self.m1 = self.eqId == 1
+        self.m2 = self.eqId == 2
+        self.missing = [self.comList[i]
+                        for i in np.flatnonzero(self.eqId == 0)]
+
+    def calculate(self, T, derivative=False):
+        '''
+        calculate vapor-pressure
+
+        args:
+            T: temperature [K] (scalar/array M)
+            derivative: calculate dP*/dT
+
+        return:
+            VaPe: vapor-pressure [Pa] *** array *** (N, M)
+            dVaPe: dP*/dT [Pa/K] *** array *** (N, M) (derivative=True)
+        '''
+        # check
+        if len(self.missing) > 0:
+            raise Exception(
+                f"vapor-pressure data of {self.missing} not found, update the app database!")
+
+        # set
+        T = np.asarray(T, dtype=float).reshape(1, -1)
+        VaPe = np.zeros((self.compNo, T.shape[1]))
+        dlnVaPe = np.zeros((self.compNo, T.shape[1]))
+
+        # eq1 [bar]
+        if np.any(self.m1):
+            A, B, C = [item.reshape(-1, 1) for item in self.eq1[self.m1].T]
+            _TC = T + C
+            VaPe[self.m1] = np.exp(A - (B/_TC))*1e5
+            if derivative:
+                dlnVaPe[self.m1] = B/np.power(_TC, 2)
+
+        # eq2 [Pa]
+        if np.any(self.m2):
+            C1, C2, C3, C4, C5 = [item.reshape(-1, 1)
+                                  for item in self.eq2[self.m2].T]
+            _TC5 = np.power(T, C5)
+            VaPe[self.m2] = np.exp(C1 + (C2/T) + C3*np.log(T) + C4*_TC5)
+            if derivative:
+                dlnVaPe[self.m2] = -C2/np.power(T, 2) + C3/T + C4*C5*_TC5/T
+
+        # check
+        if derivative is False:
+            return VaPe
+
+        # res
+        return VaPe, VaPe*dlnVaPe
+
+
 def calVapourPressure(comList, T, loadData):
     """
         calculate vapor pressure of pure component [Pa]
 
         args:
             comList: component name list (symbol) *** array ***
-            T: temperature [K]
+            T: temperature [K] (scalar/array)
             loadData: database *** array ***
+
+        return:
+            Vp: vapor pressure [Pa] (N) or (N, M) for array temperature
     """
     # try/except
     try:
-        # res
-        _Vp = []
+        # engine
+        _engine = VaporPressureEngine(comList, loadData)
+        Vp = _engine.calculate(T)
 
-        # load data
-
-        for i in comList:
-            # get id
-            eqIdData = [item['id']
-                        for item in loadData if str(i) == item['component-symbol']]
-            # check
-            _eqLen = len(eqIdData)
-            if _eqLen > 0:
-                _eqIdSet = eqIdData[0]
-                # ! check
-                if _eqIdSet == "eq1":
-                    # * get eq parameters
-                    eqData = [{"eqParams": [item['A'], item['B'], item['C']], "eqExpr": item['expr']}
-                              for item in loadData if i == item['component-symbol']]
-                    if len(eqData) > 0:
-                        # set
-                        _eqData = eqData[0]
-                        # REVIEW
-                        # eq1
-                        _eqParams = _eqData.get('eqParams')
-                        _eqExpr = _eqData.get('eqExpr')
-                        _res = calVapourPressureEq1(_eqParams, T)
-                        _Vp.append(_res)
-                elif _eqIdSet == "eq2":
-                    # * get eq parameters
-                    eqData = [{"eqParams": [item['C1'], item['C2'], item['C3'], item['C4'], item['C5']]}
-                              for item in loadData if i == item['component-symbol']]
-                    if len(eqData) > 0:
-                        # set
-                        _eqData = eqData[0]
-                        # REVIEW
-                        # eq1
-                        _eqParams = _eqData.get('eqParams')
-                        _res = calVapourPressureEq2(_eqParams, T)
-                        _Vp.append(_res)
-                    pass
-                else:
-                    print('data not found, update app database!')
-                    raise Exception()
-            else:
-                print("component not found, update the app database!")
-                raise Exception()
-
-        # convert to numpy array
-        Vp = np.array(_Vp)
+        # scalar temperature
+        if np.ndim(T) == 0:
+            Vp = Vp[:, 0]
 
         # ! check
         if len(comList) == 1:
@@ -884,16 +1053,16 @@ def ModifiedRackettEquation(T, Pc, Tc, w):
     estimation of saturated liquid volume
 
     args:
-        T: temperature [K]
-        Pc: critical pressure [Pa]
-        Tc: critical temperature [K]
-        w: acentric factor
+        T: temperature [K] (scalar/array)
+        Pc: critical pressure [Pa] (scalar/array)
+        Tc: critical temperature [K] (scalar/array)
+        w: acentric factor (scalar/array)
     '''
     _c0 = R_CONST*Tc/Pc
     ZRA = 0.2956 - 0.08775*w
     Tr = T/Tc
-    _c1 = 1 + pow(1-Tr, 2/7)
-    _c2 = _c0*pow(ZRA, _c1)
+    _c1 = 1 + np.power(1-Tr, 2/7)
+    _c2 = _c0*np.power(ZRA, _c1)
 
     return _c2
 
@@ -909,7 +1078,7 @@ def calVaporPressureV1():
     pass
 
 
-def calVaporPressureV2(T, Tc, w):
+def calVaporPressureV2(T, Pc, Tc, w):
     '''
     calculate vapor pressure using the shortcut equation
 
@@ -919,21 +1088,20 @@ def calVaporPressureV2(T, Tc, w):
         Keep in mind that its estimates are based on the critical pressure which is generally 40-50 bar and acentric factor (at Tr = 0.7).
 
     args:
-        T: desired temperature [K]
-        Pc: critical pressure [Pa]
-        Tc: critical temperature [K]
-        w: acentric factor [-]
+        T: desired temperature [K] (scalar/array)
+        Pc: critical pressure [Pa] (scalar/array)
+        Tc: critical temperature [K] (scalar/array)
+        w: acentric factor [-] (scalar/array)
 
     return:
         VaPe: vapor pressure [Pa]
     '''
     # reduced temperature
-    Tr = T/Tc
+    Tr = toTemperature(T)/toTemperature(Tc)
     # vapor pressure
-    _VaPe = (7/3)*(1+w)*(1-(1/Tr))
-    VaPe = pow(10, _VaPe)
-    # -> conversion [bar -> Pa]
-    VaPe = VaPe*1e5
+    _VaPe = (7/3)*(1+asFloat(w))*(1-(1/Tr))
+    # log10(P*/Pc)
+    VaPe = asFloat(Pc)*np.power(10, _VaPe)
     # res
     return VaPe
 
@@ -4,7 +4,6 @@
 # import packages/modules
 import os
 import numpy as np
-import pandas as pd
 import csv
 from typing import List
 # internals
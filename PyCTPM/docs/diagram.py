@@ -0,0 +1,211 @@
+# PHASE DIAGRAM (BINARY)
+# -----------------------
+
+# packages/modules
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+
+class DiagramClass:
+    '''
+    binary Txy/Pxy diagram engine
+
+    all points of a curve (and all curves) are solved in one vectorized pass:
+        1. Txy: pure-component boiling points are found first, each mixture point is seeded by
+        interpolating 1/T between them (continuation predictor), then bubble temperatures are solved
+        2. Pxy: bubble pressures are explicit
+
+    large jobs can be split over a process pool (workers > 1)
+    '''
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def binaryMoleFractions(zi_no, x1Min=0.001, x1Max=0.999):
+        '''
+        binary liquid mole fraction grid
+
+        return:
+            xi: *** array *** (zi_no, 2)
+        '''
+        x1 = np.linspace(x1Min, x1Max, zi_no)
+        return np.column_stack((x1, 1 - x1))
+
+    def TxyDiagram(self, params, config):
+        '''
+        Txy diagram at one or more pressures
+
+        args:
+            params:
+                1. P: pressure [Pa] (scalar or K)
+                2. zi_no: number of mole fractions
+            config:
+                1. Tg0: initial guess temperature [K]
+                2. VaPeCal: vapor-pressure calculation method
+                3. model: vle model
+                4. AcCoModel: activity coefficient model
+
+        return:
+            res:
+                P: pressure *** array *** (K)
+                T: bubble temperature *** array *** (K, zi_no)
+                x1: liquid mole fraction of component 1 (K, zi_no)
+                y1: vapor mole fraction of component 1 (K, zi_no)
+                xi, yi: mole fractions (K, zi_no, 2)
+        '''
+        try:
+            # params
+            P = np.atleast_1d(np.asarray(params.get('P'), dtype=float))
+            zi_no = params.get('zi_no', 10)
+            K = P.size
+
+            # config
+            Tg0 = config.get('Tg0', 350)
+
+            # ! pure components (x1 = 1, x1 = 0)
+            _pure = np.tile(np.eye(2), (K, 1))
+            _config = {**config, "Tg0": Tg0, "model": "raoult"}
+            _res0 = self.bubbleTemperatureBatch(
+                {"zi": _pure, "P": np.repeat(P, 2)}, _config)
+            Tb = _res0['T'].reshape(K, 2)
+
+            # ! mixture points
+            xi = self.binaryMoleFractions(zi_no)
+            _xi = np.tile(xi, (K, 1))
+            _P = np.repeat(P, zi_no)
+
+            # initial guess: 1/T linear in x1
+            _x1 = xi[:, 0][None, :]
+            _Tg = 1/(_x1/Tb[:, [0]] + (1 - _x1)/Tb[:, [1]])
+            _config = {**config, "Tg0": _Tg.ravel()}
+
+            # bubble temperature
+            _res = self.bubbleTemperatureBatch({"zi": _xi, "P": _P}, _config)
+
+            # res
+            T = _res['T'].reshape(K, zi_no)
+            yi = _res['yi'].reshape(K, zi_no, 2)
+            xi = _xi.reshape(K, zi_no, 2)
+            return {
+                "P": P,
+                "T": T,
+                "x1": xi[:, :, 0],
+                "y1": yi[:, :, 0],
+                "xi": xi,
+                "yi": yi
+            }
+        except Exception as e:
+            raise Exception("Txy diagram calculation failed!, ", e)
+
+    def PxyDiagram(self, params, config):
+        '''
+        Pxy diagram at one or more temperatures
+
+        args:
+            params:
+                1. T: temperature [K] (scalar or K)
+                2. zi_no: number of mole fractions
+            config:
+                1. VaPeCal: vapor-pressure calculation method
+                2. model: vle model
+                3. AcCoModel: activity coefficient model
+
+        return:
+            res:
+                T: temperature *** array *** (K)
+                P: bubble pressure *** array *** (K, zi_no)
+                x1: liquid mole fraction of component 1 (K, zi_no)
+                y1: vapor mole fraction of component 1 (K, zi_no)
+                xi, yi: mole fractions (K, zi_no, 2)
+        '''
+        try:
+            # params
+            T = np.atleast_1d(np.asarray(params.get('T'), dtype=float))
+            zi_no = params.get('zi_no', 10)
+            K = T.size
+
+            # mixture points
+            xi = self.binaryMoleFractions(zi_no)
+            _xi = np.tile(xi, (K, 1))
+            _T = np.repeat(T, zi_no)
+
+            # bubble pressure
+            _res = self.bubblePressureBatch({"zi": _xi, "T": _T}, config)
+
+            # res
+            P = _res['P'].reshape(K, zi_no)
+            yi = _res['yi'].reshape(K, zi_no, 2)
+            xi = _xi.reshape(K, zi_no, 2)
+            return {
+                "T": T,
+                "P": P,
+                "x1": xi[:, :, 0],
+                "y1": yi[:, :, 0],
+                "xi": xi,
+                "yi": yi
+            }
+        except Exception as e:
+            raise Exception("Pxy diagram calculation failed!, ", e)
+
+    def diagramParallel(self, name, params, config, workers):
+        '''
+        split a diagram job over a process pool (one chunk of pressures/temperatures per task)
+
+        args:
+            name: Txy, Pxy
+            params: diagram params
+            config: diagram config
+            workers: number of processes
+
+        return:
+            res: diagram arrays (same as serial)
+        '''
+        # fixed variable
+        key = 'P' if name == 'Txy' else 'T'
+        values = np.atleast_1d(np.asarray(params.get(key), dtype=float))
+
+        # check
+        if workers is None or workers <= 1 or values.size <= 1:
+            return diagramWorker(self, name, params, config)
+
+        # chunks
+        chunks = [item for item in np.array_split(
+            values, min(workers, values.size)) if item.size > 0]
+
+        # run
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(diagramWorker, self, name, {
+                **params, key: item}, config) for item in chunks]
+            _res = [item.result() for item in futures]
+
+        # merge
+        return {k: np.concatenate([item[k] for item in _res], axis=0) for k in _res[0]}
+
+    @staticmethod
+    def diagramPlot(res, name):
+        '''
+        plot a binary diagram (bubble/dew lines of each curve)
+        '''
+        # import
+        from matplotlib import pyplot as plt
+
+        key = 'T' if name == 'Txy' else 'P'
+        for k in range(res[key].shape[0]):
+            plt.plot(res['x1'][k], res[key][k], 'r-',
+                     res['y1'][k], res[key][k], 'b-')
+        plt.xlabel('x1, y1')
+        plt.ylabel(key)
+        plt.show()
+
+
+def diagramWorker(pool, name, params, config):
+    '''
+    compute a diagram (process pool task)
+    '''
+    if name == 'Txy':
+        return pool.TxyDiagram(params, config)
+    elif name == 'Pxy':
+        return pool.PxyDiagram(params, config)
+    else:
+        raise Exception(f"diagram {name} is not defined!")
@@ -1,17 +1,18 @@
 # eos class
-# parameters for three equation of states
+# parameters for the cubic equation of states (see CubicEos)
 # van der Waals
 # Redlich-Kwong and Soave
 # Peng-Robinson
 
 # import packages/modules
 import numpy as np
-from scipy.optimize import fsolve
 import math
 # internals
 import PyCTPM.core.constants as CONST
 from PyCTPM.core.utilities import roundNum, removeDuplicatesList
-from PyCTPM.core.config import EOS_ROOT_ACCURACY
+from PyCTPM.core.config import EOS_ROOT_ACCURACY, EOS_ROOT_METHOD, EOS_ROOT_ANALYTIC_LIST
+from PyCTPM.docs.cubicRoot import cubicRealRoots
+from PyCTPM.docs.cubicEos import CubicEos, CUBIC_EOS_ALIAS
 
 
 class eosClass:
@@ -27,21 +28,8 @@ class eosClass:
         return len(self.moleFraction)
 
     def eos_A(self, a):
-        # A value
-        # var
-        res = 0
-        # eos name
-        eosNameSet = self.eosName
-        # select method
-        selectEOS = {
-            "PR": lambda: (a * self.P) / np.power(CONST.R_CONST * self.T, 2),
-            "RK": lambda: (a * self.P) / (np.power(CONST.R_CONST, 2) * np.power(self.T, 2.5)),
-            "VDW": lambda: (a * self.P) / np.power(CONST.R_CONST * self.T, 2),
-        }
-        # exe
-        res = selectEOS.get(eosNameSet)()
-        # return
-        return res
+        """ calculate A (a includes alpha(T)) """
+        return (a * self.P) / np.power(CONST.R_CONST * self.T, 2)
 
     def eos_B(self, b):
         """ calculate B """
@@ -53,57 +41,15 @@ class eosClass:
 
     def eos_alpha(self, B):
         """ calculate alpha in f(Z) """
-        # var
-        res = 0
-        # eos name
-        eosNameSet = self.eosName
-
-        # select eos
-        selectEOS = {
-            "VDW": lambda B: -1 - B,
-            "SKR": lambda B: -1,
-            "PR": lambda B: -1 + B,
-        }
-        # res
-        res = selectEOS.get(eosNameSet)(B)
-        # return
-        return res
+        return CubicEos.get(self.eosName).coefficients(0, B)[0]
 
     def eos_beta(self, A, B):
         """ calculate parameter beta """
-        # var
-        res = 0
-        # eos name
-        eosNameSet = self.eosName
-
-        # select eos
-        selectEOS = {
-            "VDW": lambda A, B: A,
-            "SKR": lambda A, B: A - B - np.power(B, 2),
-            "PR": lambda A, B: A - 3 * np.power(B, 2) - 2 * B,
-        }
-        # res
-        res = selectEOS.get(eosNameSet)(A, B)
-        # return
-        return res
+        return CubicEos.get(self.eosName).coefficients(A, B)[1]
 
     def eos_gamma(self, A, B):
         """ calculate parameter gamma """
-        # var
-        res = 0
-        # eos name
-        eosNameSet = self.eosName
-
-        # select eos
-        selectEOS = {
-            "VDW": lambda A, B: -A * B,
-            "SKR": lambda A, B: -A * B,
-            "PR": lambda A, B: -A * B + np.power(B, 2) + np.power(B, 3),
-        }
-        # res
-        res = selectEOS.get(eosNameSet)(A, B)
-        # return
-        return res
+        return CubicEos.get(self.eosName).coefficients(A, B)[2]
 
     # f(Z)
     def fZ(self, x, *data):
@@ -114,7 +60,7 @@ class eosClass:
         return fZSet
 
     # find fZ root
-    def findRootfZ(self, alpha, beta, gamma):
+    def findRootfZ(self, alpha, beta, gamma, B=0):
         '''
         roots 
 
@@ -122,7 +68,36 @@ class eosClass:
             2. T<Tc, P>P*, 1 real root (liquid)
             3. T<Tc, P<P*, 1 real root (superheated vapor)
             4. T>Tc, 1 real root (supercritical fluid varies between `vapor-like` and `liquid-like`)
+
+        args:
+            alpha, beta, gamma: f(Z) coefficients
+            B: eos B parameter, physical roots satisfy Z > B
+
+        return:
+            Zs: real roots sorted as liquid -> vapor (an exception if no root is above B)
+
+        hint:
+            the closed-form solver (EOS_ROOT_METHOD: analytic) is used for eos in EOS_ROOT_ANALYTIC_LIST,
+            roots are accurate to double-precision round-off (see cubicRoots),
+            otherwise f(Z) is solved by fsolve from 21 initial guesses
+        '''
+        # check method
+        if EOS_ROOT_METHOD == 'analytic' and CUBIC_EOS_ALIAS.get(self.eosName, self.eosName) in EOS_ROOT_ANALYTIC_LIST:
+            Zs = cubicRealRoots(alpha, beta, gamma, Zmin=B)
+            # check
+            if Zs.size == 0:
+                raise Exception(f"no physical root of f(Z) (Z > B = {B})!")
+            return Zs
+        else:
+            return self.findRootfZSweep(alpha, beta, gamma)
+
+    def findRootfZSweep(self, alpha, beta, gamma):
+        '''
+        find f(Z) roots using fsolve from 21 initial guesses between 0 and 2
         '''
+        # import
+        from scipy.optimize import fsolve
+
         # vars
         data = (alpha, beta, gamma)
         #
@@ -158,31 +133,27 @@ class eosClass:
         """
         # components number
         componentsNo = self.componentNoSet()
-        print(f"componentsNo {componentsNo}")
         # square matrix
         matrixShape = (componentsNo, componentsNo)
         kijMatrix = np.zeros(matrixShape)
-        # set
-        for i in range(componentsNo):
-            for j in range(componentsNo):
-                if i == j:
-                    kijMatrix[i, j] = 0.0
-                else:
-                    kijMatrix[i, j] = 0.0
         # res
         return kijMatrix
 
     # a[i,j]
     def aijFill(self, ai, kij):
-        # components number
-        componentsNo = self.componentNoSet()
+        '''
+        a[i,j] = (1 - k[i,j])*sqrt(a[i]*a[j])
+
+        args:
+            ai: eos a constant *** array *** (N), or (M,N) for many states
+            kij: interaction parameter *** array *** (N,N)
+
+        return:
+            aij: *** array *** (N,N), or (M,N,N)
+        '''
+        ai = np.asarray(ai, dtype=float)
         # square matrix
-        matrixShape = (componentsNo, componentsNo)
-        aijMatrix = np.zeros(matrixShape)
-        # set
-        for i in range(componentsNo):
-            for j in range(componentsNo):
-                aijMatrix[i, j] = (1-kij[i, j])*np.sqrt(ai[i]*ai[j])
+        aijMatrix = (1-kij)*np.sqrt(ai[..., :, None]*ai[..., None, :])
         # res
         return aijMatrix
 
@@ -273,6 +244,41 @@ class eosClass:
         res = (0.07779607 * CONST.R_CONST * Tc) / Pc
         return res
 
+    @staticmethod
+    def aPRArray(Pc, Tc, w, T):
+        '''
+        calculate peng-robinson a constant (vectorized)
+
+        args:
+            Pc: critical pressure [Pa] *** array *** (N)
+            Tc: critical temperature [K] *** array *** (N)
+            w: acentric factors [-] *** array *** (N)
+            T: temperature [K] *** array *** (M)
+
+        output:
+            a: PR constant [Pa.(m3^2)/(mol^2)] *** array *** (M,N)
+        '''
+        Pc = np.asarray(Pc, dtype=float)
+        Tc = np.asarray(Tc, dtype=float)
+        w = np.asarray(w, dtype=float)
+        T = np.asarray(T, dtype=float).reshape(-1, 1)
+        # kappa
+        k = np.where(w < 0.49, 0.37464 + 1.54226*w - 0.26993*np.power(w, 2),
+                     0.379642 + 1.48503*w - 0.164423*np.power(w, 2) + 0.016666*np.power(w, 3))
+        alpha = np.power(1 + k*(1 - np.sqrt(T/Tc)), 2)
+        a0 = (0.45723553*(np.power(CONST.R_CONST, 2)*np.power(Tc, 2)))/Pc
+        return a0*alpha
+
+    @staticmethod
+    def bPRArray(Pc, Tc):
+        '''
+        calculate peng-robinson b constant (vectorized)
+
+        output:
+            b: PR constant [m^3/mol] *** array *** (N)
+        '''
+        return (0.07779607*CONST.R_CONST*np.asarray(Tc, dtype=float))/np.asarray(Pc, dtype=float)
+
     @classmethod
     def aVDW(cls, Pc, Tc):
         '''
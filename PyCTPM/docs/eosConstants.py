@@ -0,0 +1,246 @@
+# EOS CONSTANTS
+# --------------
+
+# packages/modules
+import threading
+from collections import OrderedDict
+import numpy as np
+# local
+from PyCTPM.core.constants import R_CONST
+from PyCTPM.docs.cubicEos import CubicEos, cubicEosName
+
+# temperatures memoised by each store (a(T))
+EOS_CONSTANTS_T_CACHE_SIZE = 256
+# stores kept for component data sets
+EOS_CONSTANTS_STORE_SIZE = 512
+
+
+class EosConstants:
+    '''
+    parsed pure-component eos constants of a component list
+
+    the database strings are parsed once, the temperature-independent pieces are calculated
+    at construction:
+        1. Pc [Pa], Tc [K], w [-], Zc [-]
+        2. cubic eos (PR, SRK, RK, VDW): ac, b, kappa (parsed on first use, see CubicEos)
+
+    a(T) = ac*alpha(T) is memoised per eos and temperature,
+    stores are shared between calls for the same component data (see store)
+    '''
+
+    # shared stores {component data key: EosConstants}
+    _stores = OrderedDict()
+    _lock = threading.RLock()
+
+    def __init__(self, Pc, Tc, w, Zc=None):
+        '''
+        args:
+            Pc: critical pressure [Pa] *** array *** (N)
+            Tc: critical temperature [K] *** array *** (N)
+            w: acentric factor [-] *** array *** (N)
+            Zc: critical compressibility factor [-] *** array *** (N)
+        '''
+        self.Pc = np.atleast_1d(np.asarray(Pc, dtype=float))
+        self.Tc = np.atleast_1d(np.asarray(Tc, dtype=float))
+        self.w = np.atleast_1d(np.asarray(w, dtype=float))
+        self.Zc = None if Zc is None else np.atleast_1d(
+            np.asarray(Zc, dtype=float))
+        self.compNo = self.Pc.size
+
+        # cubic eos constants {eos name: (kernel, ac, b, kappa)}
+        self.__eos = {}
+        # a(T) cache {(eos name, T): a}
+        self.__aCache = OrderedDict()
+
+        # * Peng-Robinson
+        _, self.acPR, self.bPR, self.kappaPR = self.eosParams("PR")
+
+        # * van der Waals
+        _, self.aVDW, self.bVDW, _ = self.eosParams("VDW")
+
+    @classmethod
+    def fromData(cls, compData):
+        '''
+        build from database records
+
+        args:
+            compData: records *** list of dict *** with Pc [bar], Tc [K], w [-], Zc [-]
+        '''
+        # ! Pc [bar] => [Pa]
+        Pc = [float(item['Pc'])*1e5 for item in compData]
+        Tc = [float(item['Tc']) for item in compData]
+        w = [float(item['w']) for item in compData]
+        # Zc (optional)
+        Zc = None
+        if all(item.get('Zc', '') not in ('', None) for item in compData):
+            try:
+                Zc = [float(item['Zc']) for item in compData]
+            except (TypeError, ValueError):
+                Zc = None
+        return cls(Pc, Tc, w, Zc)
+
+    @classmethod
+    def store(cls, compData):
+        '''
+        shared constants of database records (parsed on first use)
+
+        args:
+            compData: records *** list of dict ***
+
+        return:
+            EosConstants
+        '''
+        # key (database strings)
+        key = tuple((item.get('Pc'), item.get('Tc'), item.get('w'), item.get('Zc'))
+                    for item in compData)
+
+        _res = cls._stores.get(key)
+        if _res is None:
+            _res = cls.fromData(compData)
+            with cls._lock:
+                cls._stores[key] = _res
+                # size
+                if len(cls._stores) > EOS_CONSTANTS_STORE_SIZE:
+                    cls._stores.popitem(last=False)
+        return _res
+
+    @classmethod
+    def clear(cls):
+        '''
+        remove all shared stores
+        '''
+        with cls._lock:
+            cls._stores.clear()
+
+    def eosParams(self, eosName):
+        '''
+        temperature-independent constants of a cubic eos
+
+        args:
+            eosName: PR, SRK, RK, VDW (or alias)
+
+        return:
+            kernel: CubicEos
+            ac: a constant at Tc *** array *** (N)
+            b: b constant *** array *** (N)
+            kappa: soave kappa *** array *** (N) or None
+        '''
+        # kernel (alias -> eos name)
+        _kernel = CubicEos.get(eosName)
+        _res = self.__eos.get(_kernel.name)
+        if _res is None:
+            _res = (_kernel, _kernel.ac(self.Pc, self.Tc),
+                    _kernel.b(self.Pc, self.Tc), _kernel.kappa(self.w))
+            self.__eos[_kernel.name] = _res
+        return _res
+
+    def a(self, eosName, T):
+        '''
+        a constant of a cubic eos (memoised per temperature)
+
+        args:
+            eosName: PR, SRK, RK, VDW
+            T: temperature [K] (scalar)
+
+        return:
+            a: [Pa.(m3^2)/(mol^2)] *** array *** (N)
+        '''
+        key = (cubicEosName(eosName), float(T))
+        _res = self.__aCache.get(key)
+        if _res is None:
+            _res = self.aArray(eosName, key[1])[0]
+            _res.flags.writeable = False
+            with self._lock:
+                self.__aCache[key] = _res
+                # size
+                if len(self.__aCache) > EOS_CONSTANTS_T_CACHE_SIZE:
+                    self.__aCache.popitem(last=False)
+        return _res
+
+    def aArray(self, eosName, T):
+        '''
+        a constant of a cubic eos for many temperatures
+
+        args:
+            eosName: PR, SRK, RK, VDW
+            T: temperature [K] *** array *** (M)
+
+        return:
+            a: [Pa.(m3^2)/(mol^2)] *** array *** (M, N)
+        '''
+        _kernel, ac, _, kappa = self.eosParams(eosName)
+        T = np.asarray(T, dtype=float).reshape(-1, 1)
+        return ac*_kernel.alphaT(T, self.Tc, kappa)
+
+    def daArray(self, eosName, T):
+        '''
+        temperature derivative of the a constant for many temperatures
+
+        return:
+            da/dT: [Pa.(m3^2)/(mol^2).K] *** array *** (M, N)
+        '''
+        _kernel, ac, _, kappa = self.eosParams(eosName)
+        T = np.asarray(T, dtype=float).reshape(-1, 1)
+        return ac*_kernel.dalphaT(T, self.Tc, kappa)
+
+    def b(self, eosName):
+        '''
+        b constant of a cubic eos [m^3/mol] *** array *** (N)
+        '''
+        return self.eosParams(eosName)[2]
+
+    def aPR(self, T):
+        '''
+        Peng-Robinson a constant (memoised per temperature)
+
+        args:
+            T: temperature [K] (scalar)
+
+        return:
+            a: [Pa.(m3^2)/(mol^2)] *** array *** (N)
+        '''
+        return self.a("PR", T)
+
+    def aPRArray(self, T):
+        '''
+        Peng-Robinson a constant for many temperatures
+
+        args:
+            T: temperature [K] *** array *** (M)
+
+        return:
+            a: [Pa.(m3^2)/(mol^2)] *** array *** (M, N)
+        '''
+        return self.aArray("PR", T)
+
+    def daPRArray(self, T):
+        '''
+        temperature derivative of the Peng-Robinson a constant for many temperatures
+
+        args:
+            T: temperature [K] *** array *** (M)
+
+        return:
+            da/dT: [Pa.(m3^2)/(mol^2).K] *** array *** (M, N)
+        '''
+        return self.daArray("PR", T)
+
+    def ab(self, eosName, T):
+        '''
+        a and b constants of an eos
+
+        args:
+            eosName: PR, SRK, RK, VDW
+            T: temperature [K] (scalar)
+
+        return:
+            a: *** array *** (N)
+            b: *** array *** (N)
+        '''
+        return self.a(eosName, T), self.b(eosName)
+
+    def criticalMolarVolume(self):
+        '''
+        critical molar-volume Vc = Zc*R*Tc/Pc [m^3/mol]
+        '''
+        return self.Zc * ((R_CONST * self.Tc) / self.Pc)
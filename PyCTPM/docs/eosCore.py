@@ -8,6 +8,19 @@ import math
 import PyCTPM.core.constants as CONST
 from PyCTPM.docs.eos import eosClass
 from PyCTPM.docs.eosData import dbClass
+from PyCTPM.docs.eosConstants import EosConstants
+from PyCTPM.docs.eosFugacity import MixtureFugacity
+from PyCTPM.docs.cubicEos import CubicEos
+from PyCTPM.docs.cubicRoot import cubicRoots
+
+# batch eos result (structured array)
+EOS_BATCH_DTYPE = np.dtype([
+    ("pressure", float), ("temperature", float),
+    ("a", float), ("b", float), ("A", float), ("B", float),
+    ("alpha", float), ("beta", float), ("gamma", float),
+    ("ZL", float), ("ZV", float), ("VL", float), ("VV", float),
+    ("rootNo", int)
+])
 
 
 class eosCoreClass(eosClass):
@@ -15,8 +28,10 @@ class eosCoreClass(eosClass):
     componentsNo = 0
     # init
 
-    def __init__(self, compData, components, eosName, moleFraction, params):
+    def __init__(self, compData, components, eosName, moleFraction, params, eosConstants=None):
         self.compData = compData
+        # parsed eos constants (shared store by default)
+        self.__eosConstants = eosConstants
         self.components = components
         self.eosName = eosName
         self.moleFraction = moleFraction
@@ -28,11 +43,26 @@ class eosCoreClass(eosClass):
         # parent
         super().__init__(self.P, self.T, eosName, moleFraction)
 
+    # component no
+    def componentNoSet(self):
+        return self.componentsNo
+
+    @property
+    def eosConstants(self):
+        '''
+        parsed eos constants of the component data (Pc, Tc, w, b, ac, kappa)
+        '''
+        if self.__eosConstants is None:
+            self.__eosConstants = EosConstants.store(self.compData)
+        return self.__eosConstants
+
     def classDes():
         print("functions used by all equation of states")
 
-    def _eosPR(self):
+    def _eosCubic(self):
         '''
+        cubic eos (PR, SRK, RK, VDW), see CubicEos
+
         find compressibility factor (Z) at specified P and T
         then molar-volume is found.
 
@@ -42,33 +72,8 @@ class eosCoreClass(eosClass):
                 eos-params: a,b,A,B,alpha,beta,gamma
         '''
         try:
-            # component data
-            componentsData = self.compData
-
-            # sorted data
-            # Pc [bar], Tc [K], w [-]
-            # ! Pc [bar] => [Pa]
-            componentsDataSorted = [
-                [float(item['Pc'])*1e5, float(item['Tc']), float(item['w'])] for item in componentsData]
-
-            # set a b matrix
-            a = np.zeros(self.componentsNo)
-            b = np.zeros(self.componentsNo)
-
-            count = 0
-            for item in componentsDataSorted:
-                aLoop = self.aPR(item[0], item[1], item[2])
-                # a.append(aLoop)
-                a[count] = aLoop
-                bLoop = self.bPR(item[0], item[1])
-                # b.append(bLoop)
-                b[count] = bLoop
-
-                # T/Tc ratio
-                T_Tc_ratio = self.T/item[1]
-
-                # set
-                count += 1
+            # a (memoised per temperature), b [SI]
+            a, b = self.eosConstants.ab(self.eosName, self.T)
 
             # check pure, multi-component system
             if self.componentsNo > 1:
@@ -88,9 +93,7 @@ class eosCoreClass(eosClass):
             B = self.eos_B(bSet)
 
             # build polynomial eos equation f(Z)
-            alpha = self.eos_alpha(B)
-            beta = self.eos_beta(A, B)
-            gamma = self.eos_gamma(A, B)
+            alpha, beta, gamma = CubicEos.get(self.eosName).coefficients(A, B)
 
             # eso-params
             esoParams = {
@@ -104,7 +107,7 @@ class eosCoreClass(eosClass):
             }
 
             # find f(Z) root
-            rootList = np.sort(self.findRootfZ(alpha, beta, gamma))
+            rootList = np.sort(self.findRootfZ(alpha, beta, gamma, B))
 
             #! check how many real Z
             ZsNo = len(rootList)
@@ -136,6 +139,12 @@ class eosCoreClass(eosClass):
         except Exception as e:
             raise Exception(e)
 
+    def _eosPR(self):
+        '''
+        Peng-Robinson equation (PR)
+        '''
+        return self._eosCubic()
+
     def _eosMixPR(self):
         '''
         find compressibility factor (Z) at specified P and T
@@ -152,28 +161,8 @@ class eosCoreClass(eosClass):
                 eos-params: a,b,A,B,alpha,beta,gamma
         '''
         try:
-            # component data
-            componentsData = self.compData
-
-            # sorted data
-            # Pc [bar], Tc [K], w [-]
-            # ! Pc [bar] => [Pa]
-            componentsDataSorted = [
-                [float(item['Pc'])*1e5, float(item['Tc']), float(item['w'])] for item in componentsData]
-
-            # set a b matrix
-            a = np.zeros(self.componentsNo)
-            b = np.zeros(self.componentsNo)
-
-            count = 0
-            for item in componentsDataSorted:
-                aLoop = self.aPR(item[0], item[1], item[2])
-                # a.append(aLoop)
-                a[count] = aLoop
-                bLoop = self.bPR(item[0], item[1])
-                # b.append(bLoop)
-                b[count] = bLoop
-                count += 1
+            # a (memoised per temperature), b [SI]
+            a, b = self.eosConstants.ab("PR", self.T)
 
             # check pure, multi-component system
             if self.componentsNo > 1:
@@ -209,7 +198,7 @@ class eosCoreClass(eosClass):
             }
 
             # find f(Z) root
-            rootList = self.findRootfZ(alpha, beta, gamma)
+            rootList = self.findRootfZ(alpha, beta, gamma, B)
 
             # z
             minZ = np.amin(rootList)
@@ -244,107 +233,116 @@ class eosCoreClass(eosClass):
     def _eosVDW(self):
         '''
         van der Waals equation (VDW)
+        '''
+        return self._eosCubic()
 
-        find compressibility factor (Z) at specified P and T
-        then molar-volume is found.
+    def _eosBatch(self, P, T, moleFractions):
+        '''
+        evaluate the eos for many states at once (PR, SRK, RK, VDW)
+
+        args:
+            P: pressure [Pa] *** array *** (M)
+            T: temperature [K] *** array *** (M)
+            moleFractions: mole fraction *** array *** (M,N) or (N) for all states
 
         output:
-            res:
-                Z: compressibility coefficient [-]
-                eos-params: a,b,A,B,alpha,beta,gamma
+            res: structured array (M) with fields:
+                pressure, temperature: state [Pa], [K]
+                a, b, A, B, alpha, beta, gamma: eos-params
+                ZL, ZV: the lowest/highest physical Z (liquid/vapor) [-], nan if rootNo = 0
+                VL, VV: liquid/vapor molar-volume [m^3/mol], nan if rootNo = 0
+                rootNo: number of physical Z (Z > B)
         '''
         try:
-            # component data
-            componentsData = self.compData
-
-            # sorted data
-            # Pc [bar], Tc [K], w [-]
-            # ! Pc [bar] => [Pa]
-            componentsDataSorted = [
-                [float(item['Pc'])*1e5, float(item['Tc']), float(item['w'])] for item in componentsData]
-
-            # set a b matrix
-            a = np.zeros(self.componentsNo)
-            b = np.zeros(self.componentsNo)
-
-            count = 0
-            for item in componentsDataSorted:
-                aLoop = self.aVDW(item[0], item[1])
-                # a.append(aLoop)
-                a[count] = aLoop
-                bLoop = self.bVDW(item[0], item[1])
-                # b.append(bLoop)
-                b[count] = bLoop
-
-                # T/Tc ratio
-                T_Tc_ratio = self.T/item[1]
-
-                # set
-                count += 1
-
-            # FIXME
-            # check pure, multi-component system
-            if self.componentsNo > 1:
-                # mixing rule to calculate a/b
-                # kij
-                kij = self.kijFill()
-                aij = self.aijFill(a, kij)
-                aSet = self.aMixing(aij, self.moleFraction)
-                bSet = self.bMixing(b, self.moleFraction)
-            else:
-                # no change a/b (pure component)
-                aSet = a[0]
-                bSet = b[0]
+            # states
+            P, T = np.broadcast_arrays(np.atleast_1d(np.asarray(P, dtype=float)),
+                                       np.atleast_1d(np.asarray(T, dtype=float)))
+            statesNo = P.size
+            # mole fraction (M,N)
+            xi = np.asarray(moleFractions, dtype=float).reshape(-1, self.componentsNo)
+            xi = np.broadcast_to(xi, (statesNo, self.componentsNo))
+
+            # component data (parsed eos constants)
+            _eosConstants = self.eosConstants
+
+            # a (M,N), b (N)
+            ai = _eosConstants.aArray(self.eosName, T)
+            bi = _eosConstants.b(self.eosName)
+
+            # mixing rule (van der Waals one-fluid)
+            kij = self.kijFill()
+            xSqrtA = xi*np.sqrt(ai)
+            aSet = np.einsum('mi,ij,mj->m', xSqrtA, 1 - kij, xSqrtA)
+            bSet = xi @ bi
 
             # set parameters A,B
-            A = self.eos_A(aSet)
-            B = self.eos_B(bSet)
+            RT = CONST.R_CONST*T
+            A = (aSet*P)/np.power(RT, 2)
+            B = (bSet*P)/RT
 
             # build polynomial eos equation f(Z)
-            alpha = self.eos_alpha(B)
-            beta = self.eos_beta(A, B)
-            gamma = self.eos_gamma(A, B)
-
-            # eso-params
-            esoParams = {
-                "a": aSet,
-                "b": bSet,
-                "A": A,
-                "B": B,
-                "alpha": alpha,
-                "beta": beta,
-                "gamma": gamma
-            }
+            alpha, beta, gamma = CubicEos.get(self.eosName).coefficients(A, B)
 
             # find f(Z) root
-            rootList = np.sort(self.findRootfZ(alpha, beta, gamma))
+            Zs = cubicRoots(alpha, beta, gamma)
+            # physical roots
+            Zs = np.where(Zs > B[:, None], Zs, np.nan)
+            rootNo = np.sum(np.isfinite(Zs), axis=1)
+            # no physical root: nan
+            ZL = np.full(statesNo, np.nan)
+            ZV = np.full(statesNo, np.nan)
+            _m = rootNo > 0
+            ZL[_m] = np.nanmin(Zs[_m], axis=1)
+            ZV[_m] = np.nanmax(Zs[_m], axis=1)
 
-            #! check how many real Z
-            ZsNo = len(rootList)
+            # res
+            res = np.zeros(statesNo, dtype=EOS_BATCH_DTYPE)
+            res["pressure"] = P
+            res["temperature"] = T
+            res["a"] = aSet
+            res["b"] = bSet
+            res["A"] = A
+            res["B"] = B
+            res["alpha"] = alpha
+            res["beta"] = beta
+            res["gamma"] = gamma
+            res["ZL"] = ZL
+            res["ZV"] = ZV
+            # molar-volume [m3/mol]
+            res["VL"] = ZL*RT/P
+            res["VV"] = ZV*RT/P
+            res["rootNo"] = rootNo
 
-            # z
-            minZ = np.amin(rootList)
-            maxZ = np.amax(rootList)
+            return res
 
-            # # molar-volume [m3/mol]
-            # # -> all
-            # molarVolumes = np.sort(self.molarVolume(rootList))
-            # # -> liquid
-            # molarVolumeLiquid = self.molarVolume(minZ)
-            # # -> gas
-            # molarVolumeGas = self.molarVolume(maxZ)
+        except Exception as e:
+            raise Exception(e)
 
-            # REVIEW
-            # calculate specific volume [m^3/kg]
-            # res
-            res = {
-                "Zs": rootList,
-                "eos-params": esoParams,
-                "pressure": self.P,
-                "temperature": self.T
-            }
+    def _fugacityBatch(self, P, T, moleFractions, phase=None, derivatives=False):
+        '''
+        component fugacity coefficients of a mixture for many states at once (PR, SRK, RK, VDW)
 
-            return res
+        args:
+            P: pressure [Pa] *** array *** (M)
+            T: temperature [K] *** array *** (M)
+            moleFractions: mole fraction *** array *** (M,N) or (N) for all states
+            phase: gas, liquid, None (the root with the lowest Gibbs energy)
+            derivatives: calculate d(ln(phi[i]))/dn[j], d(ln(phi[i]))/dP, d(ln(phi[i]))/dT
+
+        output:
+            res:
+                Z: compressibility factor [-] *** array *** (M)
+                ln-phi: ln(phi[i]) *** array *** (M,N)
+                d-ln-phi-dn, d-ln-phi-dP, d-ln-phi-dT (derivatives)
+        '''
+        try:
+            # kij
+            kij = self.kijFill()
+            _mixtureFugacity = MixtureFugacity(
+                self.eosConstants, kij, self.eosName)
+
+            # res
+            return _mixtureFugacity.lnFugacityCoefficient(P, T, moleFractions, phase, derivatives)
 
         except Exception as e:
             raise Exception(e)
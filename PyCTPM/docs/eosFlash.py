@@ -0,0 +1,378 @@
+# EOS ISOTHERMAL FLASH (PHI-PHI)
+# ------------------------------
+
+# packages/modules
+import numpy as np
+# local
+from PyCTPM.core.config import FLASH_TOLERANCE, FLASH_MAX_ITERATION
+from PyCTPM.core.constants import R_CONST
+from PyCTPM.docs.flash import FlashClass
+from PyCTPM.docs.eosFugacity import MixtureFugacity
+from PyCTPM.docs.eosConstants import EosConstants
+from PyCTPM.docs.stability import StabilityTest
+
+# flash settings
+# GDEM extrapolation every n successive substitution steps
+EOS_FLASH_GDEM_STEP = 5
+# switch to Newton when max|ln(f[V]/f[L])| is below
+EOS_FLASH_NEWTON_SWITCH = 1e-3
+# trivial solution: max|ln(K)| is below
+EOS_FLASH_TRIVIAL = 1e-4
+# single phase: liquid-like for V/b below (Pedersen)
+EOS_LIQUID_VOLUME_RATIO = 1.75
+# Newton step halving: min step (then a successive substitution step)
+EOS_FLASH_MIN_STEP = 1e-8
+
+
+class EosFlash:
+    '''
+    isothermal flash using an eos for both phases (phi-phi)
+
+        K[i] = phi[i,L]/phi[i,V]
+
+    steps:
+        0. stability test (tangent plane distance), a stable feed is not flashed
+        1. Wilson K initialization (or K from the stability test)
+        2. successive substitution ln(K[i]) = ln(phi[i,L]) - ln(phi[i,V]) accelerated by
+            the dominant eigenvalue method (GDEM) every EOS_FLASH_GDEM_STEP steps
+        3. Newton steps on the vapor mole numbers v[i] (Gibbs energy Hessian from
+            d(ln(phi[i]))/dn[j]) once max|ln(f[i,V]/f[i,L])| < EOS_FLASH_NEWTON_SWITCH
+
+    V/F is found by the Rachford-Rice solver (negative flash) at each K
+
+    components absent from the feed (z[i] = 0) are removed from the flash, their K ratio
+    is the infinite-dilution ratio phi[i,L]/phi[i,V] of the converged phases
+    '''
+
+    def __init__(self, eosConstants, kij=None, eosName="PR"):
+        '''
+        args:
+            eosConstants: parsed eos constants (EosConstants)
+            kij: interaction parameter *** array *** (N,N), default zero
+            eosName: PR, SRK, RK, VDW
+        '''
+        self.eosConstants = eosConstants
+        # fugacity coefficient (a[i,j] is kept for the flash temperature)
+        self.mixtureFugacity = MixtureFugacity(eosConstants, kij, eosName)
+        # flash of component subsets {mask: EosFlash}
+        self.__subsets = {}
+
+    def subset(self, mask):
+        '''
+        eos flash of a component subset
+
+        args:
+            mask: selected components *** array *** (N)
+
+        return:
+            EosFlash
+        '''
+        key = tuple(bool(item) for item in mask)
+        _res = self.__subsets.get(key)
+        if _res is None:
+            _eosConstants = self.eosConstants
+            _Zc = None if _eosConstants.Zc is None else _eosConstants.Zc[mask]
+            _res = EosFlash(EosConstants(_eosConstants.Pc[mask], _eosConstants.Tc[mask], _eosConstants.w[mask], _Zc),
+                            self.mixtureFugacity.kij[np.ix_(mask, mask)], self.mixtureFugacity.eosName)
+            self.__subsets[key] = _res
+        return _res
+
+    def WilsonK(self, P, T):
+        '''
+        Wilson K-value correlation
+
+            ln(K[i]) = ln(Pc[i]/P) + 5.373*(1 + w[i])*(1 - Tc[i]/T)
+
+        args:
+            P: pressure [Pa]
+            T: temperature [K]
+
+        return:
+            ln(K): *** array *** (N)
+        '''
+        _eosConstants = self.eosConstants
+        return np.log(_eosConstants.Pc/P) + 5.373*(1 + _eosConstants.w)*(1 - _eosConstants.Tc/T)
+
+    def lnFugacityCoefficient(self, P, T, xi, yi, derivatives=False):
+        '''
+        ln(phi) of the liquid and vapor phases (the root with the lowest Gibbs energy)
+
+        return:
+            liquid res, vapor res (see MixtureFugacity.lnFugacityCoefficient)
+        '''
+        _res = self.mixtureFugacity.lnFugacityCoefficient(
+            P, T, np.vstack((xi, yi)), None, derivatives)
+        _resL = {key: value[0] for key, value in _res.items()}
+        _resV = {key: value[1] for key, value in _res.items()}
+        return _resL, _resV
+
+    def stability(self, zi, P, T):
+        '''
+        tangent plane distance stability test of a feed
+
+        trial phases (one call): vapor-like W = z*K, liquid-like W = z/K (Wilson K)
+
+        return:
+            res: StabilityTest.test result and
+                Ki: K ratio initial estimate (unstable feed) or None,
+                    Wilson K for components absent from the feed
+        '''
+        zi = np.asarray(zi, dtype=float)
+        zi = zi/np.sum(zi)
+        Ki = np.exp(self.WilsonK(P, T))
+
+        # ln(phi) (the root with the lowest Gibbs energy)
+        def lnPhiFun(xi):
+            return self.mixtureFugacity.lnFugacityCoefficient(P, T, xi)['ln-phi']
+
+        # test
+        res = StabilityTest(lnPhiFun).test(zi, np.vstack((zi*Ki, zi/Ki)))
+
+        # K ratio (trial phases with a finite tm)
+        res['Ki'] = None
+        if not res['stable']:
+            _m = zi > 0
+            wV, wL = res['wi'][:, _m]
+            usableV, usableL = np.isfinite(res['tm']) & ~res['trivial']
+            if usableV and usableL:
+                Ki[_m] = wV/wL
+            elif usableV:
+                Ki[_m] = wV/zi[_m]
+            elif usableL:
+                Ki[_m] = zi[_m]/wL
+            else:
+                Ki = None
+            res['Ki'] = Ki
+
+        return res
+
+    def singlePhase(self, zi, P, T):
+        '''
+        single phase state (liquid-like for V/b < EOS_LIQUID_VOLUME_RATIO)
+
+        return:
+            V_F_ratio: 0 (liquid), 1 (vapor)
+            Z: compressibility factor
+
+        NOTE: only for a single phase confirmed by the stability test or a converged negative flash
+        '''
+        _res = self.mixtureFugacity.lnFugacityCoefficient(P, T, zi)
+        Z = _res['Z'][0]
+        # V/b = Z/B
+        B = np.dot(zi, self.mixtureFugacity.bi)*P/(R_CONST*T)
+        V_F_ratio = 0.0 if Z/B < EOS_LIQUID_VOLUME_RATIO else 1.0
+        return V_F_ratio, Z
+
+    def flash(self, zi, P, T, guess_V_F_ratio=None, lnKi=None, acceleration=True, stability=True, tol=FLASH_TOLERANCE, maxIter=FLASH_MAX_ITERATION):
+        '''
+        isothermal flash
+
+        args:
+            zi: feed mole fraction *** array *** (N)
+            P: flash pressure [Pa]
+            T: flash temperature [K]
+            guess_V_F_ratio: V/F initial guess
+            lnKi: ln(K) initial guess (default: Wilson)
+            acceleration: GDEM and Newton steps (False: successive substitution only)
+            stability: run the stability test first (a stable feed is a single phase)
+            tol: tolerance of max|ln(f[i,V]/f[i,L])|
+            maxIter: max iteration
+
+        return:
+            res:
+                V_F_ratio: V/F (0/1 for a single phase)
+                xi: liquid mole fraction
+                yi: vapor mole fraction
+                Ki: K ratio
+                ZL, ZV: liquid/vapor compressibility factor
+                two-phase: flash state
+                converged: False for maxIter or a trivial solution of an unstable (or untested) feed,
+                    the other items are the last iterate then
+                iterations: stability, ss (successive substitution), gdem, newton
+                error: max|ln(f[i,V]/f[i,L])|
+        '''
+        try:
+            # set
+            zi = np.asarray(zi, dtype=float)
+            zi = zi/np.sum(zi)
+            V_F_ratio = guess_V_F_ratio
+
+            # components absent from the feed
+            _mask = zi > 0
+            if not np.all(_mask):
+                return self.flashSubset(_mask, zi, P, T, guess_V_F_ratio, lnKi, acceleration, stability, tol, maxIter)
+
+            # iterations
+            stabilityNo = 0
+            error = np.inf
+            # two-phase solve
+            twoPhaseSolve = True
+            # single phase (stability test)
+            stable = False
+            # trivial solution
+            trivial = False
+
+            # stability test
+            if stability:
+                _stability = self.stability(zi, P, T)
+                stabilityNo = _stability['iterNo']
+                if _stability['stable']:
+                    # single phase (no flash)
+                    twoPhaseSolve = False
+                    stable = True
+                    error = np.nan
+                elif lnKi is None and _stability['Ki'] is not None:
+                    lnKi = np.log(_stability['Ki'])
+
+            # Wilson K
+            lnKi = self.WilsonK(P, T) if lnKi is None else np.asarray(
+                lnKi, dtype=float).copy()
+
+            ssNo = 0
+            gdemNo = 0
+            newtonNo = 0
+            # successive substitution steps
+            _dlnK = []
+            # last iterate
+            xi = zi.copy()
+            yi = zi.copy()
+            _resL = None
+
+            iterNo = 0
+            while twoPhaseSolve and iterNo < maxIter:
+                iterNo += 1
+
+                # trivial solution
+                if np.max(np.abs(lnKi)) < EOS_FLASH_TRIVIAL:
+                    trivial = True
+                    break
+
+                # V/F, liquid/vapor mole fraction
+                V_F_ratio, xi, yi, _ = FlashClass.rachfordRice(
+                    zi, np.exp(lnKi), negativeFlash=True, guess=V_F_ratio)
+
+                # ln(phi)
+                _newton = acceleration and error < EOS_FLASH_NEWTON_SWITCH and 0 < V_F_ratio < 1
+                _resL, _resV = self.lnFugacityCoefficient(
+                    P, T, xi, yi, derivatives=_newton)
+
+                # ln(f[V]/f[L])
+                _lnKiSS = _resL['ln-phi'] - _resV['ln-phi']
+                gi = lnKi - _lnKiSS
+                error = np.max(np.abs(gi))
+
+                # check
+                if error < tol:
+                    break
+
+                if _newton:
+                    # * Newton (vapor mole numbers)
+                    vi = V_F_ratio*yi
+                    # Gibbs energy Hessian
+                    H = (np.diag(1/yi) - 1 + _resV['d-ln-phi-dn'])/V_F_ratio + \
+                        (np.diag(1/xi) - 1 + _resL['d-ln-phi-dn'])/(1 - V_F_ratio)
+                    dvi = np.linalg.solve(H, -gi)
+                    # keep 0 < v[i] < z[i]
+                    _step = 1.0
+                    while np.any(vi + _step*dvi <= 0) or np.any(vi + _step*dvi >= zi):
+                        _step *= 0.5
+                        if _step < EOS_FLASH_MIN_STEP:
+                            break
+                    # check (successive substitution step)
+                    _newton = _step >= EOS_FLASH_MIN_STEP and np.all(np.isfinite(dvi))
+
+                if _newton:
+                    newtonNo += 1
+                    vi = vi + _step*dvi
+                    li = zi - vi
+                    V_F_ratio = np.sum(vi)
+                    lnKi = np.log((vi/V_F_ratio)/(li/(1 - V_F_ratio)))
+                    _dlnK = []
+                else:
+                    # * successive substitution
+                    ssNo += 1
+                    _dlnK.append(_lnKiSS - lnKi)
+                    lnKi = _lnKiSS
+
+                    # GDEM (dominant eigenvalue)
+                    if acceleration and len(_dlnK) >= EOS_FLASH_GDEM_STEP:
+                        _d0, _d1 = _dlnK[-2], _dlnK[-1]
+                        _lambda = np.dot(_d1, _d1)/np.dot(_d0, _d1)
+                        if 0 < _lambda < 1:
+                            lnKi = lnKi + _d1*_lambda/(1 - _lambda)
+                            gdemNo += 1
+                        _dlnK = []
+
+            # trivial solution: single phase if the feed is stable
+            if trivial and not stability:
+                _stability = self.stability(zi, P, T)
+                stabilityNo = _stability['iterNo']
+                stable = _stability['stable']
+
+            # flash state
+            converged = stable or error < tol
+            twoPhase = converged and not stable and 0 < V_F_ratio < 1
+
+            if converged and not twoPhase:
+                # single phase (feed composition)
+                V_F_ratio, ZL = self.singlePhase(zi, P, T)
+                ZV = ZL
+                xi = zi.copy()
+                yi = zi.copy()
+                lnKi = np.zeros(zi.size)
+            elif _resL is not None:
+                ZL = _resL['Z']
+                ZV = _resV['Z']
+            else:
+                # no iterate
+                V_F_ratio = np.nan
+                _, ZL = self.singlePhase(zi, P, T)
+                ZV = ZL
+
+            # res
+            return {
+                "V_F_ratio": V_F_ratio,
+                "xi": xi,
+                "yi": yi,
+                "Ki": np.exp(lnKi),
+                "ZL": ZL,
+                "ZV": ZV,
+                "two-phase": twoPhase,
+                "converged": converged,
+                "iterations": {
+                    "stability": stabilityNo,
+                    "ss": ssNo,
+                    "gdem": gdemNo,
+                    "newton": newtonNo
+                },
+                "error": error
+            }
+        except Exception as e:
+            raise Exception("eos flash failed!, ", e)
+
+    def flashSubset(self, mask, zi, P, T, guess_V_F_ratio=None, lnKi=None, acceleration=True, stability=True, tol=FLASH_TOLERANCE, maxIter=FLASH_MAX_ITERATION):
+        '''
+        flash of the feed components (z[i] > 0), results are scattered back (see flash)
+
+        args:
+            mask: components in the feed *** array *** (N)
+        '''
+        res = self.subset(mask).flash(zi[mask], P, T, guess_V_F_ratio,
+                                      None if lnKi is None else np.asarray(lnKi, dtype=float)[mask],
+                                      acceleration, stability, tol, maxIter)
+
+        # liquid/vapor mole fraction
+        for key in ("xi", "yi"):
+            _x = np.zeros(mask.size)
+            _x[mask] = res[key]
+            res[key] = _x
+
+        # K ratio (absent components: phi[i,L]/phi[i,V] at infinite dilution)
+        Ki = np.ones(mask.size)
+        Ki[mask] = res['Ki']
+        if res['two-phase']:
+            _resL, _resV = self.lnFugacityCoefficient(P, T, res['xi'], res['yi'])
+            Ki[~mask] = np.exp(_resL['ln-phi'] - _resV['ln-phi'])[~mask]
+        res['Ki'] = Ki
+
+        return res
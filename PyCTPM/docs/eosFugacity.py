@@ -0,0 +1,345 @@
+# MIXTURE FUGACITY COEFFICIENT (CUBIC EOS)
+# ----------------------------------------
+
+# packages/modules
+import numpy as np
+# local
+from PyCTPM.core.constants import R_CONST
+from PyCTPM.docs.cubicRoot import cubicRoots
+from PyCTPM.docs.cubicEos import CubicEos
+
+# root selection
+FUGACITY_PHASE_VAPOR = ('gas', 'vapor', 'g', 'v')
+FUGACITY_PHASE_LIQUID = ('liquid', 'l')
+
+
+class MixtureFugacity:
+    '''
+    component fugacity coefficients of a mixture using a cubic eos (PR, SRK, RK, VDW)
+    (van der Waals one-fluid mixing rule)
+
+        ln(phi[i]) = (b[i]/b)*(Z-1) - ln(Z-B)
+            - A/(B*(delta1-delta2))*(2*sum(x[j]*a[i,j])/a - b[i]/b)*ln((Z+delta1*B)/(Z+delta2*B))
+
+    all states (P, T, composition) are evaluated at once, composition derivatives and
+    P/T derivatives follow the reduced residual Helmholtz energy F(n,T,V) of Michelsen and Mollerup
+    '''
+
+    def __init__(self, eosConstants, kij=None, eosName="PR"):
+        '''
+        args:
+            eosConstants: parsed eos constants (EosConstants)
+            kij: interaction parameter *** array *** (N,N), default zero
+            eosName: PR, SRK, RK, VDW
+        '''
+        self.eosConstants = eosConstants
+        self.compNo = eosConstants.compNo
+        self.kij = np.zeros((self.compNo, self.compNo)) if kij is None else np.asarray(
+            kij, dtype=float)
+        # eos kernel
+        self.cubicEos = CubicEos.get(eosName)
+        self.eosName = self.cubicEos.name
+        # delta1, delta2
+        self.delta1, self.delta2 = self.cubicEos.delta1, self.cubicEos.delta2
+        # b[i]
+        self.bi = eosConstants.b(self.eosName)
+        # a[i,j] of the last temperature
+        self.__aijT = None
+        self.__aij = None
+
+    def states(self, P, T, xi):
+        '''
+        broadcast states
+
+        return:
+            P: *** array *** (M)
+            T: *** array *** (M)
+            xi: *** array *** (M,N)
+        '''
+        P, T = np.broadcast_arrays(np.atleast_1d(np.asarray(P, dtype=float)),
+                                   np.atleast_1d(np.asarray(T, dtype=float)))
+        xi = np.asarray(xi, dtype=float).reshape(-1, self.compNo)
+        M = max(P.size, xi.shape[0])
+        return np.broadcast_to(P, (M,)), np.broadcast_to(T, (M,)), np.broadcast_to(xi, (M, self.compNo))
+
+    def mixing(self, T, xi):
+        '''
+        mixing rule
+
+        return:
+            aij: *** array *** (M,N,N)
+            ai: sum(x[j]*a[i,j]) *** array *** (M,N)
+            a: mixture a *** array *** (M)
+            b: mixture b *** array *** (M)
+        '''
+        # a[i,j]
+        aij = self.aijSet(T)
+        # sum(x[j]*a[i,j])
+        ai = np.einsum('mij,mj->mi', aij, xi)
+        a = np.sum(xi*ai, axis=1)
+        b = xi @ self.bi
+        return aij, ai, a, b
+
+    def aijSet(self, T):
+        '''
+        a[i,j] = (1 - k[i,j])*sqrt(a[i]*a[j]) of all states
+
+        a[i,j] of the last temperature is kept, so loops at a fixed temperature
+        (flash, stability test) calculate it once
+
+        args:
+            T: temperature [K] *** array *** (M)
+
+        return:
+            aij: *** array *** (M,N,N)
+        '''
+        # check uniform temperature
+        if np.all(T == T[0]):
+            _T = float(T[0])
+            if self.__aijT != _T:
+                _ai = self.eosConstants.a(self.eosName, _T)
+                self.__aij = (1 - self.kij)*np.sqrt(np.multiply.outer(_ai, _ai))
+                self.__aijT = _T
+            return np.broadcast_to(self.__aij, (T.size, self.compNo, self.compNo))
+
+        # a[i] (M,N)
+        _ai = self.eosConstants.aArray(self.eosName, T)
+        return (1 - self.kij)*np.sqrt(_ai[:, :, None]*_ai[:, None, :])
+
+    def compressibilityFactor(self, A, B, phase=None):
+        '''
+        select a physical root of f(Z)
+
+        args:
+            A, B: eos parameters *** array *** (M)
+            phase: gas/vapor (the highest Z), liquid (the lowest Z),
+                None: the root with the lowest Gibbs energy,
+                list: phase of each state
+
+        return:
+            Z: *** array *** (M)
+        '''
+        # f(Z) = Z^3 + alpha*Z^2 + beta*Z + gamma
+        alpha, beta, gamma = self.cubicEos.coefficients(A, B)
+        Zs = cubicRoots(alpha, beta, gamma)
+        # physical roots
+        Zs = np.where(Zs > B[:, None], Zs, np.nan)
+        ZL = np.nanmin(Zs, axis=1)
+        ZV = np.nanmax(Zs, axis=1)
+
+        # check
+        if phase in FUGACITY_PHASE_VAPOR:
+            return ZV
+        elif phase in FUGACITY_PHASE_LIQUID:
+            return ZL
+        elif phase is not None and not isinstance(phase, (list, tuple)):
+            raise Exception(f"phase {phase} is not defined!")
+
+        # residual Gibbs energy of each root
+        GL = self.residualGibbs(ZL, A, B)
+        GV = self.residualGibbs(ZV, A, B)
+        Z = np.where(GL < GV, ZL, ZV)
+
+        # phase of each state
+        if phase is not None:
+            _vapor = np.array([item in FUGACITY_PHASE_VAPOR for item in phase])
+            _liquid = np.array([item in FUGACITY_PHASE_LIQUID for item in phase])
+            Z = np.where(_vapor, ZV, np.where(_liquid, ZL, Z))
+
+        return Z
+
+    def residualGibbs(self, Z, A, B):
+        '''
+        residual Gibbs energy G[R]/RT = sum(x[i]*ln(phi[i]))
+        '''
+        return self.cubicEos.residualGibbs(Z, A, B)
+
+    def lnFugacityCoefficient(self, P, T, xi, phase=None, derivatives=False):
+        '''
+        component fugacity coefficients for many states
+
+        args:
+            P: pressure [Pa] *** array *** (M)
+            T: temperature [K] *** array *** (M)
+            xi: mole fraction *** array *** (M,N) or (N) for all states
+            phase: gas/vapor, liquid, None (the root with the lowest Gibbs energy), or a list (M)
+            derivatives: calculate composition/pressure/temperature derivatives
+
+        return:
+            res:
+                Z: compressibility factor [-] *** array *** (M)
+                ln-phi: ln(phi[i]) *** array *** (M,N)
+                (derivatives)
+                d-ln-phi-dn: n*d(ln(phi[i]))/dn[j] at fixed T, P *** array *** (M,N,N)
+                d-ln-phi-dP: d(ln(phi[i]))/dP [1/Pa] *** array *** (M,N)
+                d-ln-phi-dT: d(ln(phi[i]))/dT [1/K] *** array *** (M,N)
+        '''
+        try:
+            # states
+            P, T, xi = self.states(P, T, xi)
+            bi = self.bi
+
+            # mixing rule
+            aij, ai, a, b = self.mixing(T, xi)
+
+            # set parameters A,B
+            RT = R_CONST*T
+            A = (a*P)/np.power(RT, 2)
+            B = (b*P)/RT
+
+            # Z
+            Z = self.compressibilityFactor(A, B, phase)
+
+            # ln(phi[i])
+            _bi = bi/b[:, None]
+            _attraction = self.cubicEos.attraction(Z, A, B)
+            lnPhi = _bi*(Z - 1)[:, None] - np.log(Z - B)[:, None] - \
+                _attraction[:, None]*(2*ai/a[:, None] - _bi)
+
+            # res
+            res = {
+                "Z": Z,
+                "ln-phi": lnPhi
+            }
+
+            # check
+            if derivatives:
+                res.update(self.derivatives(P, T, xi, Z, aij, ai, a, b))
+
+            return res
+        except Exception as e:
+            raise Exception("mixture fugacity coefficient failed!, ", e)
+
+    def derivatives(self, P, T, xi, Z, aij, ai, a, b):
+        '''
+        derivatives of ln(phi[i]) (n = 1 mol)
+
+        F(n,T,V) = -n*g(V,B) - D(T)/T*f(V,B)
+            g = ln(1 - B/V)
+            f = ln((V + delta1*B)/(V + delta2*B))/(R*B*(delta1 - delta2))
+            B = sum(n[i]*b[i]), D = sum(sum(n[i]*n[j]*a[i,j]))
+        '''
+        d1, d2 = self.delta1, self.delta2
+        bi = self.bi
+        RT = R_CONST*T
+        # total volume [m^3]
+        V = Z*RT/P
+
+        # da[i,j]/dT
+        _dai = self.eosConstants.daArray(
+            self.eosName, T)/self.eosConstants.aArray(self.eosName, T)
+        daij = 0.5*aij*(_dai[:, :, None] + _dai[:, None, :])
+        daiT = np.einsum('mij,mj->mi', daij, xi)
+        DT = np.sum(xi*daiT, axis=1)
+
+        # g
+        _VB = V - b
+        gV = 1/_VB - 1/V
+        gB = -1/_VB
+        gVV = -1/np.power(_VB, 2) + 1/np.power(V, 2)
+        gBV = 1/np.power(_VB, 2)
+        gBB = -1/np.power(_VB, 2)
+
+        # f
+        _V1 = V + d1*b
+        _V2 = V + d2*b
+        f = 1/(R_CONST*_V1) if d1 == d2 else np.log(_V1/_V2) / \
+            (R_CONST*b*(d1 - d2))
+        fV = -1/(R_CONST*_V1*_V2)
+        fB = -(f + V*fV)/b
+        fVV = (2*V + (d1 + d2)*b)/(R_CONST*np.power(_V1*_V2, 2))
+        fBV = -(2*fV + V*fVV)/b
+        fBB = -(2*fB + V*fBV)/b
+
+        # F
+        FnB = -gB
+        FnV = -gV
+        FD = -f/T
+        FBD = -fB/T
+        FDV = -fV/T
+        FBB = -gBB - a/T*fBB
+        FBV = -gBV - a/T*fBV
+        FVV = -gVV - a/T*fVV
+        _DT = a/np.power(T, 2) - DT/T
+        FBT = _DT*fB
+        FDT = f/np.power(T, 2)
+        FVT = _DT*fV
+
+        # D[i], D[i,j], dD[i]/dT
+        Di = 2*ai
+        Dij = 2*aij
+        DiT = 2*daiT
+
+        # dF/dn[i]dn[j]
+        Fij = FnB[:, None, None]*(bi[:, None] + bi[None, :]) + \
+            FBD[:, None, None]*(bi[None, :, None]*Di[:, None, :] + bi[None, None, :]*Di[:, :, None]) + \
+            FBB[:, None, None]*np.multiply.outer(bi, bi) + \
+            FD[:, None, None]*Dij
+        FiV = FnV[:, None] + FBV[:, None]*bi + FDV[:, None]*Di
+        FiT = FBT[:, None]*bi + FDT[:, None]*Di + FD[:, None]*DiT
+
+        # pressure derivatives
+        dPdV = -RT*FVV - RT/np.power(V, 2)
+        dPdn = -RT[:, None]*FiV + (RT/V)[:, None]
+        dPdT = P/T - RT*FVT
+        # partial molar volume [m^3/mol]
+        vi = -dPdn/dPdV[:, None]
+
+        # res
+        return {
+            "d-ln-phi-dn": Fij + 1 + (dPdn[:, :, None]*dPdn[:, None, :])/(RT*dPdV)[:, None, None],
+            "d-ln-phi-dP": vi/RT[:, None] - (1/P)[:, None],
+            "d-ln-phi-dT": FiT + (1/T)[:, None] - vi*(dPdT/RT)[:, None]
+        }
+
+    def departure(self, P, T, xi, phase=None):
+        '''
+        departure (residual) functions for many states
+
+        args:
+            P: pressure [Pa] *** array *** (M)
+            T: temperature [K] *** array *** (M)
+            xi: mole fraction *** array *** (M,N) or (N) for all states
+            phase: gas/vapor, liquid, None (the root with the lowest Gibbs energy), or a list (M)
+
+        return:
+            res:
+                Z: compressibility factor [-] *** array *** (M)
+                H-R: residual enthalpy H[R]/RT [-] *** array *** (M)
+                S-R: residual entropy S[R]/R [-] *** array *** (M)
+                G-R: residual Gibbs energy G[R]/RT [-] *** array *** (M)
+        '''
+        try:
+            # states
+            P, T, xi = self.states(P, T, xi)
+
+            # mixing rule
+            aij, _, a, b = self.mixing(T, xi)
+
+            # T*(da/dT)/a
+            _dai = self.eosConstants.daArray(
+                self.eosName, T)/self.eosConstants.aArray(self.eosName, T)
+            daij = 0.5*aij*(_dai[:, :, None] + _dai[:, None, :])
+            dlnadlnT = T*np.einsum('mi,mij,mj->m', xi, daij, xi)/a
+
+            # set parameters A,B
+            RT = R_CONST*T
+            A = (a*P)/np.power(RT, 2)
+            B = (b*P)/RT
+
+            # Z
+            Z = self.compressibilityFactor(A, B, phase)
+
+            # departure functions
+            GR = self.cubicEos.residualGibbs(Z, A, B)
+            HR = self.cubicEos.residualEnthalpy(Z, A, B, dlnadlnT)
+
+            # res
+            return {
+                "Z": Z,
+                "H-R": HR,
+                "S-R": HR - GR,
+                "G-R": GR
+            }
+        except Exception as e:
+            raise Exception("departure functions failed!, ", e)
@@ -4,11 +4,15 @@
 
 # packages/modules
 import numpy as np
-from scipy import optimize
 # local
 from PyCTPM.docs.eosCore import eosCoreClass
 from PyCTPM.docs.fugacity import FugacityClass
-from PyCTPM.docs.dThermo import calMolarVolume, calVaporPressureV2, calVapourPressure
+from PyCTPM.docs.dThermo import calMolarVolume, calVaporPressureV2, VaporPressureEngine
+from PyCTPM.core.cache import LRUCache, memoize
+from PyCTPM.core.constants import R_CONST
+from PyCTPM.docs.eosConstants import EosConstants
+from PyCTPM.docs.cubicRoot import cubicRoots
+from PyCTPM.docs.cubicEos import CubicEos
 
 
 class EquilibriumClass:
@@ -32,8 +36,26 @@ class EquilibriumClass:
         self.__thermoPropData = compData['thermo']
         # -> vapor-pressure
         self.__vaporPressureData = compData['vapor-pressure']
+        # vapor-pressure engine (polynomial)
+        self.__vaporPressureEngine = VaporPressureEngine(
+            [self.symbol], [self.__vaporPressureData])
 
         self.componentsNo = len(self.id)
+        # eos constants (parsed on first use)
+        self.__eosConstants = None
+
+        # memoization cache
+        self.cache = LRUCache.create()
+
+    @property
+    def eosConstants(self):
+        '''
+        parsed eos constants: Pc [Pa], Tc [K], w, b, ac, kappa and a(T) (memoised)
+        '''
+        if self.__eosConstants is None:
+            self.__eosConstants = EosConstants.fromData(
+                [self.__thermoPropData])
+        return self.__eosConstants
 
     def __database_set(self, id):
         '''
@@ -50,6 +72,7 @@ class EquilibriumClass:
             pass
         return
 
+    @memoize('vaporPressure')
     def vaporPressure(self, T, mode, eos_model):
         '''
         calculate vapor pressure at T using:
@@ -65,15 +88,15 @@ class EquilibriumClass:
         try:
             # check
             if mode == 'polynomial':
-                _Vp = calVapourPressure(
-                    [self.symbol], T, [self.__vaporPressureData])
+                _Vp = self.__vaporPressureEngine.calculate(T)[0]
+                _Vp = _Vp[0] if np.ndim(T) == 0 else _Vp
             elif mode == 'eos':
                 _Vp = self.vaporPressureEOS(T, eos_model)
             elif mode == 'shortcut':
                 # input
-                Tc = self.__thermoPropData['Tc']
-                w = self.__thermoPropData['w']
-                _Vp = calVaporPressureV2(T, Tc, w)
+                _eosConstants = self.eosConstants
+                _Vp = calVaporPressureV2(
+                    T, _eosConstants.Pc[0], _eosConstants.Tc[0], _eosConstants.w[0])
 
             # res
             return _Vp
@@ -83,36 +106,130 @@ class EquilibriumClass:
     def vaporPressureEOS(self, T, eos_model):
         '''
         find vapor-pressure of a fluid using eos
+
+        args:
+            T: temperature [K] (scalar/array)
+            eos_model: name of eos model
+
+        return:
+            P*: vapor-pressure [Pa] (nan at/above the critical temperature)
         '''
         try:
-            # set params
-            params = (T, eos_model)
+            # saturation pressure
+            res, _ = self.saturationPressureEOS(T, eos_model)
 
-            # solver set
-            solverConfig = 1
+            # res
+            return res[0] if np.ndim(T) == 0 else res
 
-            # function set
-            funSet = self.vpEOS
+        except Exception as e:
+            raise Exception("vapor-pressure estimation by eos failed!, ", e)
 
-            # initial guess
-            p0 = 1e5
+    def saturationPressureEOS(self, T, eos_model, tol=1e-10, maxIter=50):
+        '''
+        pure-component saturation pressure from a cubic eos (vectorized over T)
 
-            # bounds
-            boundSet = (0.1, 50e5)
+        residual:
+            g(ln P) = ln(phi[L]) - ln(phi[V]) = 0
+            dg/d(ln P) = Z[L] - Z[V]
 
-            # root finding
-            _res = optimize.fsolve(funSet, p0, args=(params,), xtol=1e-5)
-            # ->
-            if len(_res) == 1:
-                res = _res[0]
-            else:
-                res = 0
+        both phases share one cubic solve per iteration, the initial guess is the shortcut
+        equation, newton steps in ln P are limited to one unit and replaced by bisection if they
+        leave the bracket. If only one root exists the pressure moves toward the missing phase
+        (vapor-like root: increase P, liquid-like root: decrease P).
 
-            # res
-            return res
+        args:
+            T: temperature [K] (scalar/array)
+            eos_model: name of eos model (PR, SRK, RK, VDW)
+            tol: tolerance of g
+            maxIter: max iteration
 
-        except Exception as e:
-            raise Exception("vapor-pressure estimation by eos failed!, ", e)
+        return:
+            P*: vapor-pressure [Pa] *** array *** (nan: supercritical/not converged)
+            iterNo: iteration number
+        '''
+        # eos kernel
+        _cubicEos = CubicEos.get(eos_model)
+
+        # component data
+        _eosConstants = self.eosConstants
+        Pc = _eosConstants.Pc[0]
+        Tc = _eosConstants.Tc[0]
+        w = _eosConstants.w[0]
+
+        # set
+        T = np.atleast_1d(np.asarray(T, dtype=float))
+        M = T.size
+        RT = R_CONST*T
+        # eos constants
+        a = _eosConstants.aArray(eos_model, T)[:, 0]
+        b = _eosConstants.b(eos_model)[0]
+
+        # initial guess (shortcut)
+        lnP = np.log(calVaporPressureV2(np.minimum(T, Tc), Pc, Tc, w))
+        lnP = np.atleast_1d(lnP)
+        # bracket
+        lo = np.full(M, -np.inf)
+        hi = np.full(M, np.log(Pc))
+
+        # supercritical
+        active = T < Tc
+        lnP = np.where(active, lnP, np.nan)
+        converged = np.zeros(M, dtype=bool)
+
+        iterNo = 0
+        while np.any(active) and iterNo < maxIter:
+            iterNo += 1
+            _i = np.flatnonzero(active)
+            _P = np.exp(lnP[_i])
+            A = a[_i]*_P/np.power(RT[_i], 2)
+            B = b*_P/RT[_i]
+
+            # f(Z) roots
+            alpha, beta, gamma = _cubicEos.coefficients(A, B)
+            Zs = cubicRoots(alpha, beta, gamma)
+            Zs = np.where(Zs > B[:, None], Zs, np.nan)
+            rootNo = np.sum(np.isfinite(Zs), axis=1)
+            ZL = np.nanmin(np.where(rootNo[:, None] > 0, Zs, 1.0), axis=1)
+            ZV = np.nanmax(np.where(rootNo[:, None] > 0, Zs, 1.0), axis=1)
+
+            # fugacity coefficient (both phases)
+            g = _cubicEos.residualGibbs(ZL, A, B) - \
+                _cubicEos.residualGibbs(ZV, A, B)
+            dg = ZL - ZV
+
+            # one root: vapor-like (above inflection point) or liquid-like
+            _one = (ZV - ZL) <= 1e-10*np.maximum(1.0, ZV)
+            _vaporLike = ZL > -alpha/3
+            # ! g > 0: P below P*
+            _up = np.where(_one, _vaporLike, g > 0)
+
+            # bracket
+            _lnP = lnP[_i]
+            lo[_i] = np.where(_up, _lnP, lo[_i])
+            hi[_i] = np.where(_up, hi[_i], _lnP)
+
+            # newton step
+            _step = np.where(_one, np.where(_vaporLike, 0.5, -0.5),
+                             -g/np.where(dg == 0, -1.0, dg))
+            _step = np.clip(_step, -1.0, 1.0)
+            _lnPNew = _lnP + _step
+            # bisection
+            _out = (_lnPNew <= lo[_i]) | (_lnPNew >= hi[_i])
+            _mid = np.where(np.isfinite(lo[_i]), 0.5 *
+                            (lo[_i] + hi[_i]), hi[_i] - 1.0)
+            _lnPNew = np.where(_out, _mid, _lnPNew)
+
+            # convergence
+            _conv = ~_one & (np.abs(g) <= tol)
+            lnP[_i] = np.where(_conv, _lnP, _lnPNew)
+            converged[_i[_conv]] = True
+            # ! bracket collapsed (trivial solution near the critical point)
+            _stop = _conv | ((hi[_i] - lo[_i]) <= 1e-14)
+            active[_i[_stop]] = False
+
+        # res
+        P = np.where(converged, np.exp(lnP), np.nan)
+        return P, iterNo
 
     def vpEOS(self, p, params):
         '''
@@ -142,6 +259,7 @@ class EquilibriumClass:
         except Exception as e:
             raise Exception("vapor-pressure function failed!, ", e)
 
+    @memoize('compressibilityFactor')
     def compressibilityFactor(self, P, T, eos_model):
         '''
         find the roots of Z=f(P,T)
@@ -150,8 +268,8 @@ class EquilibriumClass:
             P: pressure [Pa]
             T: temperature [K]
             eos_model: name of eos model
-                1. van der Waals (VW)
-                2. Redlich-Kwong and Soave (RKS)
+                1. van der Waals (VDW/VW)
+                2. Redlich-Kwong (RK), Soave-Redlich-Kwong (SRK/RKS)
                 3. Peng-Robinson (PR)
 
         return:
@@ -167,19 +285,14 @@ class EquilibriumClass:
 
             # * init eos class
             _eosCoreClass = eosCoreClass(
-                [self.__thermoPropData], [self.symbol], eos_model, [1], params)
+                [self.__thermoPropData], [self.symbol], eos_model, [1], params, self.eosConstants)
 
-            # * select method
-            selectEOS = {
-                "PR": lambda: _eosCoreClass._eosPR(),
-                "VW": 1,
-                "RKS": 1
-            }
-
-            return selectEOS.get(eos_model)()
+            # res (PR, SRK/RKS, RK, VDW/VW)
+            return _eosCoreClass._eosCubic()
         except Exception as e:
             raise Exception("compressibility factor failed!")
 
+    @memoize('molarVolume')
     def molarVolume(self, P, T, eos_model):
         '''
         estimate molar-volume at specified pressure and temperature
@@ -188,8 +301,8 @@ class EquilibriumClass:
             P: pressure [Pa]
             T: temperature [K]
             eos_model: name of eos model
-                1. van der Waals (VW)
-                2. Redlich-Kwong and Soave (RKS)
+                1. van der Waals (VDW/VW)
+                2. Redlich-Kwong (RK), Soave-Redlich-Kwong (SRK/RKS)
                 3. Peng-Robinson (PR)
 
         return:
@@ -217,6 +330,7 @@ class EquilibriumClass:
         except Exception as e:
             raise Exception("molar-volume failed! ", e)
 
+    @memoize('fugacities')
     def fugacities(self, P, T, phase, eos_model, pressure_correction):
         '''
         estimate fugacity at specified pressure and temperature
@@ -225,8 +339,8 @@ class EquilibriumClass:
             P: pressure [Pa]
             T: temperature [K]
             eos_model: name of eos model
-                1. van der Waals (VW)
-                2. Redlich-Kwong and Soave (RKS)
+                1. van der Waals (VDW/VW)
+                2. Redlich-Kwong (RK), Soave-Redlich-Kwong (SRK/RKS)
                 3. Peng-Robinson (PR)
             pressure_correction: estimate liquid/solid fugacity with:
                 1. equation of state 
@@ -238,14 +352,15 @@ class EquilibriumClass:
         '''
         try:
             # T/Tc ratio
-            T_Tc_ratio = T/float(self.__thermoPropData['Tc'])
-            # P/Pc ratio
-            P_Pc_ratio = P/float(self.__thermoPropData['Pc'])
+            T_Tc_ratio = T/self.eosConstants.Tc[0]
+            # P/Pc ratio (Pc [bar])
+            P_Pc_ratio = P/(self.eosConstants.Pc[0]/1e5)
 
             # eos params
             params = {
                 "pressure": P,
                 "temperature": T,
+                "eos-model": eos_model,
                 "pressure_correction": pressure_correction,
                 "T_Tc_ratio": T_Tc_ratio,
                 "P_Pc_ratio": P_Pc_ratio
@@ -255,10 +370,11 @@ class EquilibriumClass:
             if phase == 'liquid' and pressure_correction == True:
                 # REVIEW
                 # vapor-pressure [Pa]
-                _vaporPressure = self.vaporPressure(T, mode=1)
+                _vaporPressure = self.vaporPressure(
+                    T, 'polynomial', eos_model)
 
                 # eos calculation
-                _eosRes = self.molar_volume(_vaporPressure, T, eos_model)
+                _eosRes = self.molarVolume(_vaporPressure, T, eos_model)
 
                 _eosResSet = {
                     "molar-volumes": _eosRes[0],
@@ -268,14 +384,14 @@ class EquilibriumClass:
 
                 # * init fugacity class
                 _fugacityClass = FugacityClass([self.__thermoPropData], [
-                    self.symbol], _eosResSet, params)
+                    self.symbol], _eosResSet, params, self.eosConstants)
 
                 # res
                 _fugacityRes = _fugacityClass.liquidFugacity()
 
             else:
                 # eos calculation
-                _eosRes = self.molar_volume(P, T, eos_model)
+                _eosRes = self.molarVolume(P, T, eos_model)
 
                 _eosResSet = {
                     "molar-volumes": _eosRes[0],
@@ -284,17 +400,10 @@ class EquilibriumClass:
 
                 # * init fugacity class
                 _fugacityClass = FugacityClass([self.__thermoPropData], [
-                    self.symbol], _eosResSet, params)
-
-                # select method
-                selectFugacity = {
-                    "PR": _fugacityClass.FugacityPR,
-                    "VW": 1,
-                    "RKS": 1
-                }
+                    self.symbol], _eosResSet, params, self.eosConstants)
 
                 # res
-                _fugacityRes = selectFugacity.get(eos_model)(phase)
+                _fugacityRes = _fugacityClass.FugacityEOS(phase)
 
             # return
             return _fugacityRes
@@ -2,10 +2,11 @@
 # ------------------
 
 # packages/modules
-from math import pow, sqrt, exp, log
+from math import pow, sqrt
 import numpy as np
 # local
 from PyCTPM.core import R_CONST
+from PyCTPM.docs.activityModel import VanLaarModel
 
 
 class ExcessProperties:
@@ -76,44 +77,30 @@ class ExcessProperties:
             xi: mole fraction 
             ai: van der Waals a constant
             bi: van der Waals b constant 
+            T: temperature [K]
         '''
-        # gamma
-        AcCo = np.zeros(self.compNo)
-
-        # am/bm
-        # am, bm = self.VanLaar_am_bm(ai, bi)
-
-        # L
-        Lij = self.VanLaar_L(ai, bi, T)
-
-        for i in range(self.compNo):
-            for j in range(self.compNo):
-                if i != j:
-                    _res0 = Lij[i, j] * \
-                        pow(1+((Lij[i, j]*xi[i])/(Lij[j, i]*xi[j])), -2)
-                    _res1 = exp(_res0)
-                    # res
-                    AcCo[i] = _res1
+        # gamma (multi-component form, reduces to L[i,j] for a binary system)
+        AcCo = VanLaarModel(ai, bi).activityCoefficient(xi, T)
 
         # res
-        return AcCo
+        return AcCo[0]
 
     def ExcessMolarGibbsFreeEnergy(self, xi, AcCoi):
         '''
         calculate excess molar Gibbs free energy from activity coefficient of each component in a system
 
         args:
-            xi: liquid mole fraction
-            AcCoi: activity coefficient
-        '''
-        # G(E)/RT
-        c0 = np.zeros(self.compNo)
+            xi: liquid mole fraction (N) or (M, N)
+            AcCoi: activity coefficient (N) or (M, N)
 
-        for i in range(self.compNo):
-            c0[i] = xi[i]*log(AcCoi[i])
+        return:
+            G(E)/RT: scalar or *** array *** (M)
+        '''
+        # G(E)/RT = sum(x[i]*ln(gamma[i]))
+        c0 = np.asarray(xi, dtype=float)*np.log(np.asarray(AcCoi, dtype=float))
 
         # excess molar gibbs energy
-        c1 = np.sum(c0)
+        c1 = np.sum(c0, axis=-1)
 
         # res
         return c1
@@ -0,0 +1,233 @@
+# BATCH EXECUTOR
+# ---------------
+
+# packages/modules
+import os
+import itertools
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+# local
+from PyCTPM.database.registry import ComponentRegistry
+
+# api functions (ctpm) available to jobs
+BATCH_FUNCTIONS = ('thermo', 'eos', 'eos_batch', 'fugacity',
+                   'fugacity_batch', 'is_component_available')
+
+# components/pools kept by each worker (reused by jobs of the same system)
+BATCH_OBJECT_CACHE_SIZE = 128
+
+# worker objects
+_objects = OrderedDict()
+
+
+class BatchExecutor:
+    '''
+    run many independent thermodynamic jobs over a process pool
+
+    job spec (dict):
+        function: api function name
+            1. ctpm function: thermo, eos, eos_batch, fugacity, fugacity_batch, is_component_available
+            2. component method: component.<method> such as component.fugacity
+            3. pool method: pool.<method> such as pool.bubble_temperature
+        args: positional arguments (list) or keyword arguments (dict)
+        component: component id (component.<method>)
+        components: component id list (pool.<method>)
+        state: component state (g, l, s) or a state list for a pool
+
+    result (dict, in job order):
+        index: job index
+        success: job status
+        res: job result (None for failed jobs)
+        error: error message (None for successful jobs)
+
+    the database is loaded once and shipped to each worker by the pool initializer,
+    jobs are sent in chunks, a bounded number of chunks is in flight so a job iterable
+    (generator) is consumed as results are streamed
+    '''
+
+    def __init__(self, workers=None, chunk_size=64, max_pending=None):
+        '''
+        args:
+            workers: number of processes (default: cpu count), 0/1 runs in the current process
+            chunk_size: number of jobs sent to a worker at once
+            max_pending: number of chunks in flight (default: 2*workers)
+        '''
+        self.workers = (os.cpu_count() or 1) if workers is None else int(workers)
+        self.chunkSize = max(1, int(chunk_size))
+        self.maxPending = max(1, int(max_pending or 2*max(self.workers, 1)))
+
+    def chunks(self, jobs):
+        '''
+        split jobs into (start index, job list)
+        '''
+        _it = iter(jobs)
+        start = 0
+        while True:
+            _chunk = list(itertools.islice(_it, self.chunkSize))
+            if len(_chunk) == 0:
+                return
+            yield start, _chunk
+            start += len(_chunk)
+
+    def run(self, jobs):
+        '''
+        run jobs
+
+        args:
+            jobs: iterable of job specs
+
+        return:
+            results: generator of result dicts (job order)
+        '''
+        # serial
+        if self.workers <= 1:
+            for start, _chunk in self.chunks(jobs):
+                yield from runChunk(start, _chunk)
+            return
+
+        # database (shipped once per worker)
+        tables = ComponentRegistry.loadAll()
+
+        # chunks
+        _chunks = self.chunks(jobs)
+        pending = deque()
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=workerInit,
+                                 initargs=(tables,)) as executor:
+            # fill
+            for start, _chunk in itertools.islice(_chunks, self.maxPending):
+                pending.append(
+                    (start, len(_chunk), executor.submit(runChunk, start, _chunk)))
+
+            while len(pending) > 0:
+                start, size, future = pending.popleft()
+                try:
+                    _res = future.result()
+                except Exception as e:
+                    # worker failure (all jobs of the chunk)
+                    _res = [jobResult(start + i, error=e) for i in range(size)]
+
+                # next chunk
+                _next = next(_chunks, None)
+                if _next is not None:
+                    pending.append(
+                        (_next[0], len(_next[1]), executor.submit(runChunk, *_next)))
+
+                # stream
+                yield from _res
+
+    def map(self, jobs):
+        '''
+        run jobs and collect all results
+
+        return:
+            results: result dicts *** list *** (job order)
+        '''
+        return list(self.run(jobs))
+
+
+def workerInit(tables):
+    '''
+    process pool initializer: install the shipped database
+    '''
+    ComponentRegistry.install(tables)
+    _objects.clear()
+
+
+def runChunk(start, jobs):
+    '''
+    run a chunk of jobs (process pool task)
+
+    return:
+        results *** list of dict ***
+    '''
+    return [runJob(start + i, job) for i, job in enumerate(jobs)]
+
+
+def runJob(index, job):
+    '''
+    run one job, errors are returned as a failed result
+    '''
+    try:
+        # function
+        fun = jobFunction(job)
+
+        # args
+        args = job.get('args', [])
+        if isinstance(args, dict):
+            res = fun(**args)
+        else:
+            res = fun(*args)
+
+        # res
+        return jobResult(index, res=res)
+    except Exception as e:
+        return jobResult(index, error=e)
+
+
+def jobResult(index, res=None, error=None):
+    '''
+    result dict of a job
+    '''
+    return {
+        "index": index,
+        "success": error is None,
+        "res": res,
+        "error": None if error is None else f"{type(error).__name__}: {error}"
+    }
+
+
+def jobFunction(job):
+    '''
+    find the callable of a job spec
+    '''
+    # import
+    from PyCTPM import ctpm
+
+    name = str(job.get('function', ''))
+    owner, _, method = name.rpartition('.')
+
+    # check
+    if method == '' or method.startswith('_'):
+        raise Exception(f"batch function {name} is not defined!")
+
+    if owner == '':
+        if method not in BATCH_FUNCTIONS:
+            raise Exception(f"batch function {name} is not defined!")
+        return getattr(ctpm, method)
+    elif owner == 'component':
+        _id = job.get('component')
+        _state = job.get('state', '')
+        obj = workerObject(
+            ('component', _id, _state), lambda: ctpm.component(_id, _state))
+    elif owner == 'pool':
+        _ids = tuple(job.get('components', []))
+        _states = job.get('state', '')
+        _states = tuple(_states) if isinstance(
+            _states, (list, tuple)) else (_states,)*len(_ids)
+        obj = workerObject(('pool', _ids, _states), lambda: ctpm.pool(
+            [ctpm.component(i, s) for i, s in zip(_ids, _states)]))
+    else:
+        raise Exception(f"batch function {name} is not defined!")
+
+    # method
+    fun = getattr(obj, method, None)
+    if not callable(fun):
+        raise Exception(f"batch function {name} is not defined!")
+    return fun
+
+
+def workerObject(key, build):
+    '''
+    a component/pool of the worker (built once for the same system)
+    '''
+    obj = _objects.get(key)
+    if obj is None:
+        obj = build()
+        _objects[key] = obj
+        # size
+        if len(_objects) > BATCH_OBJECT_CACHE_SIZE:
+            _objects.popitem(last=False)
+    else:
+        _objects.move_to_end(key)
+    return obj
@@ -200,7 +200,7 @@ class ExtCoreClass:
             # load data
             setData = self.dataSet(DATABASE_INFO[3]['name'])
             setData_2 = self.dataSet()
-            # temp [K]
+            # temp [K] (scalar or array of states)
             T = self.modelInput['params']['T']
 
             # REVIEW
@@ -221,7 +221,7 @@ class ExtCoreClass:
             MWi = np.array(
                 propFunList['general-data'](setData_2, "MW"))
 
-            # mole fraction
+            # mole fraction (N), or (M,N) for many states
             MoFri = np.array(self.modelInput.get('MoFri'))
 
             # params
@@ -253,7 +253,7 @@ class ExtCoreClass:
             # load data
             setData = self.dataSet(DATABASE_INFO[2]['name'])
             setData_2 = self.dataSet()
-            # temp [K]
+            # temp [K] (scalar or array of states)
             T = self.modelInput['params']['T']
 
             # REVIEW
@@ -274,7 +274,7 @@ class ExtCoreClass:
             MWi = np.array(
                 propFunList['general-data'](setData_2, "MW"))
 
-            # mole fraction
+            # mole fraction (N), or (M,N) for many states
             MoFri = np.array(self.modelInput.get('MoFri'))
 
             # params
@@ -3,9 +3,168 @@
 
 # packages/modules
 import numpy as np
-from scipy import optimize
+# internals
+from PyCTPM.core.config import FLASH_TOLERANCE, FLASH_MAX_ITERATION
 
 
 class FlashClass:
+    '''
+    Rachford-Rice flash solver (vectorized over feeds)
+
+    f(beta) = sum(zi*(Ki-1)/(1 + beta*(Ki-1))) = 0, beta = V/F
+
+    f is monotonically decreasing between the asymptotes 1/(1-Kmax) and 1/(1-Kmin),
+    the root is bracketed by (Whitson-Michelsen):
+        beta[min] = max((Ki*zi-1)/(Ki-1)) for Ki > 1
+        beta[max] = min((1-zi)/(1-Ki)) for Ki < 1
+    and found by Newton steps with analytic derivative, a step leaving the bracket
+    is replaced by bisection
+    '''
+
     def __init__(self):
         pass
+
+    @staticmethod
+    def rachfordRiceFunction(beta, zi, Ki):
+        '''
+        Rachford-Rice function and its derivative
+
+        args:
+            beta: V/F *** array *** (M)
+            zi: feed mole fraction *** array *** (M, N)
+            Ki: K ratio *** array *** (M, N)
+
+        return:
+            f: function value (M)
+            df: derivative df/dbeta (M)
+        '''
+        _Ki1 = Ki - 1
+        _t = _Ki1/(1 + beta[:, None]*_Ki1)
+        f = np.sum(zi*_t, axis=1)
+        df = -np.sum(zi*_t*_t, axis=1)
+        return f, df
+
+    @staticmethod
+    def rachfordRiceBounds(zi, Ki):
+        '''
+        V/F bounds of the Rachford-Rice root
+
+        return:
+            betaMin, betaMax *** array *** (M)
+        '''
+        _Ki1 = Ki - 1
+        _safe = np.where(_Ki1 == 0, 1.0, _Ki1)
+        # lower bound (Ki > 1)
+        _lo = np.where(Ki > 1, (Ki*zi - 1)/_safe, -np.inf)
+        # upper bound (Ki < 1)
+        _up = np.where(Ki < 1, (1 - zi)/(-_safe), np.inf)
+        return np.max(_lo, axis=1), np.min(_up, axis=1)
+
+    @staticmethod
+    def rachfordRice(zi, Ki, negativeFlash=False, guess=None, tol=FLASH_TOLERANCE, maxIter=FLASH_MAX_ITERATION):
+        '''
+        solve Rachford-Rice equation
+
+        args:
+            zi: feed mole fraction *** array *** (N) or (M, N)
+            Ki: K ratio *** array *** (N) or (M, N)
+            negativeFlash: allow V/F outside [0, 1] (single-phase feed)
+            guess: V/F initial guess (optional)
+            tol: tolerance
+            maxIter: max iteration
+
+        return:
+            V_F_ratio: V/F (scalar or M)
+            xi: liquid mole fraction (N) or (M, N)
+            yi: vapor mole fraction (N) or (M, N)
+            iterNo: iteration number
+
+        bracket (both modes start from the Whitson-Michelsen bounds, see rachfordRiceBounds):
+            1. standard flash: the bounds clipped to [0, 1], f(0) <= 0 gives V/F = 0 (subcooled)
+                and f(1) >= 0 gives V/F = 1 (superheated)
+            2. negative flash: the bounds as they are (V/F may be < 0 or > 1), they lie inside
+                the asymptotes 1/(1-Kmax), 1/(1-Kmin)
+            all Ki >= 1 (or <= 1): no root, V/F = 1 (or 0)
+        '''
+        try:
+            # set
+            zi = np.asarray(zi, dtype=float)
+            Ki = np.asarray(Ki, dtype=float)
+            single = zi.ndim == 1
+            zi, Ki = np.broadcast_arrays(np.atleast_2d(zi), np.atleast_2d(Ki))
+            M = zi.shape[0]
+
+            # bounds
+            a, b = FlashClass.rachfordRiceBounds(zi, Ki)
+
+            # one phase (all Ki > 1 or all Ki < 1)
+            _allVapor = np.all(Ki >= 1, axis=1)
+            _allLiquid = np.all(Ki <= 1, axis=1)
+
+            # standard flash
+            if not negativeFlash:
+                f0, _ = FlashClass.rachfordRiceFunction(np.zeros(M), zi, Ki)
+                f1, _ = FlashClass.rachfordRiceFunction(np.ones(M), zi, Ki)
+                # f(0) <= 0: subcooled liquid, f(1) >= 0: superheated vapor
+                _allLiquid = _allLiquid | (f0 <= 0)
+                _allVapor = (_allVapor | (f1 >= 0)) & ~_allLiquid
+                a = np.maximum(a, 0.0)
+                b = np.minimum(b, 1.0)
+
+            # solve
+            _solve = ~(_allLiquid | _allVapor)
+            beta = np.where(_allVapor, 1.0, 0.0)
+            a = np.where(_solve, a, 0.0)
+            b = np.where(_solve, b, 1.0)
+
+            # initial guess
+            if guess is None:
+                _beta = 0.5*(a + b)
+            else:
+                _beta = np.clip(np.broadcast_to(
+                    np.asarray(guess, dtype=float), (M,)), a, b)
+            beta = np.where(_solve, _beta, beta)
+
+            # safeguarded newton
+            active = _solve.copy()
+            iterNo = 0
+            while np.any(active) and iterNo < maxIter:
+                iterNo += 1
+                _i = np.flatnonzero(active)
+                _beta = beta[_i]
+                f, df = FlashClass.rachfordRiceFunction(_beta, zi[_i], Ki[_i])
+
+                # bracket (f decreasing)
+                _a = np.where(f > 0, _beta, a[_i])
+                _b = np.where(f > 0, b[_i], _beta)
+                a[_i] = _a
+                b[_i] = _b
+
+                # newton step
+                _dfSafe = np.where(df == 0, -1.0, df)
+                _betaNew = _beta - f/_dfSafe
+                # bisection (outside bracket)
+                _out = (_betaNew <= _a) | (_betaNew >= _b) | (df == 0)
+                _betaNew = np.where(_out, 0.5*(_a + _b), _betaNew)
+
+                # convergence
+                _fConv = np.abs(f) <= tol
+                _betaNew = np.where(_fConv, _beta, _betaNew)
+                beta[_i] = _betaNew
+                _conv = _fConv | (np.abs(_betaNew - _beta) <= tol*np.maximum(1.0, np.abs(_beta))) | \
+                    ((_b - _a) <= tol*np.maximum(1.0, np.abs(_beta)))
+                active[_i[_conv]] = False
+
+            # liquid/vapor mole fraction
+            xi = zi/(1 + beta[:, None]*(Ki - 1))
+            yi = Ki*xi
+            # one phase: incipient phase composition
+            xi = xi/np.sum(xi, axis=1, keepdims=True)
+            yi = yi/np.sum(yi, axis=1, keepdims=True)
+
+            # res
+            if single:
+                return beta[0], xi[0], yi[0], iterNo
+            return beta, xi, yi, iterNo
+        except Exception as e:
+            raise Exception("Rachford-Rice calculation failed!, ", e)
@@ -8,6 +8,8 @@ import math
 from PyCTPM.core import Tref, R_CONST
 from PyCTPM.docs.dThermo import RackettEquation
 from PyCTPM.docs.eosCore import eosCoreClass
+from PyCTPM.docs.eosConstants import EosConstants
+from PyCTPM.docs.cubicEos import CubicEos
 
 
 class FugacityClass():
@@ -17,27 +19,39 @@ class FugacityClass():
     for a liquid phase, the Poynting correction factor is used 
     '''
 
-    def __init__(self, compData, components, eosRes, params):
+    def __init__(self, compData, components, eosRes, params, eosConstants=None):
         self.compData = compData
+        # parsed eos constants (shared store by default)
+        self.__eosConstants = eosConstants
         self.components = components
         self.eosRes = eosRes
         # set
         self.P = params.get("pressure", 0)
         self.T = params.get("temperature", 0)
+        self.eosModel = params.get("eos-model", "PR")
         self.Zs = eosRes.get("eos-res")['Zs']
         self.vaporPressure = eosRes.get("vapor-pressure", 0)
         # comp no
         self.componentsNo = len(self.components)
 
-    def FugacityPR(self, phase):
+    @property
+    def eosConstants(self):
+        '''
+        parsed eos constants of the component data (Pc, Tc, Zc)
+        '''
+        if self.__eosConstants is None:
+            self.__eosConstants = EosConstants.store(self.compData)
+        return self.__eosConstants
+
+    def FugacityEOS(self, phase):
         '''
         set fugacity equation based on a phase (gas/liquid/solid)
         '''
         try:
             # phase equation selection
             phaseEqSelection = {
-                'gas': self._glFugacityPR,
-                'liquid': self._glFugacityPR
+                'gas': self._glFugacityEOS,
+                'liquid': self._glFugacityEOS
             }
 
             # set
@@ -46,11 +60,17 @@ class FugacityClass():
             # res
             return res
         except Exception as e:
-            raise Exception("PR fugacity failed!")
+            raise Exception(f"{self.eosModel} fugacity failed!")
+
+    def FugacityPR(self, phase):
+        '''
+        fugacity (Peng-Robinson)
+        '''
+        return self.FugacityEOS(phase)
 
-    def _eqPR(self, Z):
+    def _eqEOS(self, Z):
         '''
-        calculate PR fugacity coefficient
+        calculate fugacity coefficient (cubic eos, see CubicEos)
 
         args:
             Z: compressibility coefficient
@@ -63,16 +83,15 @@ class FugacityClass():
             B = eosParams.get("B")
 
             # fugacity coefficient
-            phi0 = (Z-1) - np.log(Z-B) - (A/(2*B*np.sqrt(2))) * \
-                np.log((Z+(1+np.sqrt(2))*B)/(Z+(1-np.sqrt(2))*B))
+            phi0 = CubicEos.get(self.eosModel).residualGibbs(Z, A, B)
             phi = np.exp(phi0)
 
             # res
             return phi
         except Exception as e:
-            raise Exception("PR fugacity failed! ", e)
+            raise Exception(f"{self.eosModel} fugacity failed! ", e)
 
-    def _glFugacityPR(self, phase):
+    def _glFugacityEOS(self, phase):
         '''
         estimation of gas/liquid fugacity using a EOS
 
@@ -90,7 +109,7 @@ class FugacityClass():
                 Z = np.amin(self.Zs)
 
             # calculate fugacity coefficient
-            _fugCoefficient = self._eqPR(Z)
+            _fugCoefficient = self._eqEOS(Z)
             # fugacity
             fugacity = _fugCoefficient*self.P
 
@@ -132,7 +151,7 @@ class FugacityClass():
             Z = np.amax(self.Zs)
 
             # calculate fugacity coefficient at saturated state
-            _fugCoefficientSaturated = self._eqPR(Z)
+            _fugCoefficientSaturated = self._eqEOS(Z)
             # fugacity at saturated state
             fugacitySaturated = _fugCoefficientSaturated*self.vaporPressure
 
@@ -157,24 +176,8 @@ class FugacityClass():
         estimate critical molar-volume [m^3/mol]
         '''
         try:
-            # component data
-            componentsData = self.compData
-
-            # sorted data
-            # Pc [bar], Tc [K], w [-]
-            # ! Pc [bar] => [Pa]
-            componentsDataSorted = [
-                [float(item['Pc'])*1e5, float(item['Tc']), float(item['Zc'])] for item in componentsData]
-
             # critical molar-volume [m^3/mol]
-            Vc = np.zeros(self.componentsNo)
-
-            count = 0
-            for item in componentsDataSorted:
-                # Pc,Tc,Zc
-                # item[0], item[1], item[2]
-                Vc[count] = item[2] * ((R_CONST * item[1]) / item[0])
-                count += 1
+            Vc = self.eosConstants.criticalMolarVolume()
 
             # res
             return Vc
@@ -187,27 +190,17 @@ class FugacityClass():
         estimate saturated liquid volume using the Rackett equation
         '''
         try:
-            # component data
-            componentsData = self.compData
-
-            # sorted data
-            # Pc [bar], Tc [K], w [-]
-            # ! Pc [bar] => [Pa]
-            componentsDataSorted = [
-                [float(item['Pc'])*1e5, float(item['Tc']), float(item['Zc'])] for item in componentsData]
+            # Tc [K], Zc [-]
+            _eosConstants = self.eosConstants
 
             # saturated molar-volume [m^3/mol]
             Vsat = np.zeros(self.componentsNo)
 
-            i = 0
-            for item in componentsDataSorted:
-                # Pc,Tc,Zc
-                # item[0], item[1], item[2]
+            for i in range(self.componentsNo):
                 # Tr
-                _Tr = self.T/item[1]
+                _Tr = self.T/_eosConstants.Tc[i]
                 # saturated molar-volume
-                Vsat[i] = RackettEquation(Vc[i], item[2], _Tr)
-                i += 1
+                Vsat[i] = RackettEquation(Vc[i], _eosConstants.Zc[i], _Tr)
 
             # res
             return Vsat
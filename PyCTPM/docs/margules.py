@@ -2,9 +2,9 @@
 # ----------------
 
 # packages/modules
-from math import pow, sqrt, exp
 import numpy as np
 # local
+from PyCTPM.docs.activityModel import MargulesModel
 
 
 class Margules:
@@ -26,27 +26,7 @@ class Margules:
             return [0, 0]
 
         # activity coefficient
-        AcCo = []
-
-        # ! check method
-        if Aij.size == 1:
-            # 1-parameter
-            for i in range(self.compNo):
-                AcCo.append(exp(Aij[0]*pow(1-xi[i], 2)))
-        elif Aij.size == 2:
-            # 2-parameter
-            # set
-            A12 = Aij[0]
-            A21 = Aij[1]
-            for i in range(self.compNo):
-                if i == 0:
-                    _AcCo = exp(pow(1-xi[i], 2) *
-                                (A12 + 2*(A21 - A12)*xi[i]))
-                elif i == 1:
-                    _AcCo = exp(pow(1-xi[i], 2) *
-                                (A21 + 2*(A12 - A21)*xi[i]))
-
-                AcCo.append(_AcCo)
+        AcCo = MargulesModel(Aij).activityCoefficient(xi)
 
         # res
-        return AcCo
+        return list(AcCo[0])
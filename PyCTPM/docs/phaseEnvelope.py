@@ -0,0 +1,364 @@
+# PHASE ENVELOPE (EOS)
+# --------------------
+
+# packages/modules
+import numpy as np
+# local
+from PyCTPM.docs.eosFugacity import MixtureFugacity
+
+# envelope settings
+# newton tolerance of max|dX|
+ENVELOPE_TOLERANCE = 1e-10
+# newton max iteration of a point
+ENVELOPE_NEWTON_MAX_ITERATION = 15
+# step of the specified variable (initial, min, max)
+ENVELOPE_STEP = (0.05, 1e-4, 0.25)
+# critical point jump: |ln(K)| of the specified variable below
+ENVELOPE_CRITICAL_LNK = 0.05
+
+
+class PhaseEnvelope:
+    '''
+    phase envelope of a mixture using a cubic eos (Michelsen)
+
+    the saturation curve (incipient phase fraction = 0) is traced in a single pass:
+        bubble curve (low pressure) -> cricondenbar -> critical point -> cricondentherm -> dew curve
+
+    variables: X = [ln(K[i]), ln(T), ln(P)]
+
+        F[i] = ln(K[i]) + ln(phi[i,y]) - ln(phi[i,z]) = 0
+        F[N+1] = sum(y[i] - z[i]) = 0, y[i] = K[i]*z[i]
+        F[N+2] = X[s] - S = 0
+
+    continuation:
+        1. the specified variable s has the largest sensitivity dX/dS
+        2. the next point is predicted by a cubic extrapolation of the last two points and
+            their tangents dX/dS
+        3. Newton corrector with analytic jacobian (d(ln(phi))/dn, dP, dT)
+        4. step is increased after a fast convergence, reduced after a slow/failed one
+        5. the critical point (ln(K) = 0) is crossed by a symmetric ln(K) step of at most
+            2*step and interpolated
+    '''
+
+    def __init__(self, eosConstants, kij=None, eosName="PR"):
+        '''
+        args:
+            eosConstants: parsed eos constants (EosConstants)
+            kij: interaction parameter *** array *** (N,N), default zero
+            eosName: PR, SRK, RK, VDW
+        '''
+        self.eosConstants = eosConstants
+        self.compNo = eosConstants.compNo
+        self.mixtureFugacity = MixtureFugacity(eosConstants, kij, eosName)
+
+    def WilsonBubbleTemperature(self, zi, P, T0=None, maxIter=50):
+        '''
+        bubble temperature from Wilson K, sum(z[i]*K[i]) = 1
+
+        return:
+            T: temperature [K]
+            ln(K): *** array *** (N)
+        '''
+        _eosConstants = self.eosConstants
+        _c = 5.373*(1 + _eosConstants.w)*_eosConstants.Tc
+        T = np.dot(zi, _eosConstants.Tc) if T0 is None else T0
+        for i in range(maxIter):
+            lnKi = np.log(_eosConstants.Pc/P) + 5.373 * \
+                (1 + _eosConstants.w) - _c/T
+            _zK = zi*np.exp(lnKi)
+            # f = ln(sum(z*K)), df/dT
+            f = np.log(np.sum(_zK))
+            df = np.sum(_zK*_c)/(np.sum(_zK)*T*T)
+            dT = np.clip(-f/df, -0.2*T, 0.2*T)
+            T = T + dT
+            if abs(dT) < 1e-10*T:
+                break
+        lnKi = np.log(_eosConstants.Pc/P) + 5.373*(1 + _eosConstants.w) - _c/T
+        return T, lnKi
+
+    def equations(self, X, zi, s, S):
+        '''
+        envelope equations and jacobian
+
+        args:
+            X: variables [ln(K), ln(T), ln(P)] *** array *** (N+2)
+            zi: feed mole fraction *** array *** (N)
+            s: index of the specified variable
+            S: specified value
+
+        return:
+            F: *** array *** (N+2)
+            J: dF/dX *** array *** (N+2,N+2)
+        '''
+        N = self.compNo
+        lnKi = X[:N]
+        T = np.exp(X[N])
+        P = np.exp(X[N+1])
+
+        # incipient phase
+        yi = np.exp(lnKi)*zi
+        _ySum = np.sum(yi)
+
+        # phase (the incipient phase with the smaller co-volume is vapor-like)
+        _bi = self.mixtureFugacity.bi
+        _phase = ['liquid', 'vapor'] if np.dot(yi, _bi) < _ySum*np.dot(zi, _bi) else [
+            'vapor', 'liquid']
+
+        # ln(phi) of the feed and incipient phase (one call)
+        _res = self.mixtureFugacity.lnFugacityCoefficient(
+            P, T, np.vstack((zi, yi/_ySum)), _phase, derivatives=True)
+        lnPhi = _res['ln-phi']
+        dlnPhidn = _res['d-ln-phi-dn']
+        dlnPhidT = _res['d-ln-phi-dT']
+        dlnPhidP = _res['d-ln-phi-dP']
+
+        # F
+        F = np.zeros(N + 2)
+        F[:N] = lnKi + lnPhi[1] - lnPhi[0]
+        F[N] = _ySum - 1
+        F[N+1] = X[s] - S
+
+        # J
+        J = np.zeros((N + 2, N + 2))
+        J[:N, :N] = np.eye(N) + dlnPhidn[1]*(yi/_ySum)[None, :]
+        J[:N, N] = T*(dlnPhidT[1] - dlnPhidT[0])
+        J[:N, N+1] = P*(dlnPhidP[1] - dlnPhidP[0])
+        J[N, :N] = yi
+        J[N+1, s] = 1
+
+        return F, J
+
+    def newton(self, X, zi, s, S, tol=ENVELOPE_TOLERANCE, maxIter=ENVELOPE_NEWTON_MAX_ITERATION):
+        '''
+        solve a point of the envelope
+
+        return:
+            X: variables
+            J: jacobian at the solution
+            iterNo: iteration number (None: not converged)
+        '''
+        X = X.copy()
+        for iterNo in range(1, maxIter + 1):
+            F, J = self.equations(X, zi, s, S)
+            dX = np.linalg.solve(J, -F)
+            # check
+            if not np.all(np.isfinite(dX)):
+                return X, J, None
+            # step limit (ln(T), ln(P))
+            _max = np.max(np.abs(dX[-2:]))
+            if _max > 0.2:
+                dX = dX*(0.2/_max)
+            X = X + dX
+            # check (J of the last iteration is kept for the next prediction)
+            if np.max(np.abs(dX)) < tol:
+                return X, J, iterNo
+        return X, J, None
+
+    @staticmethod
+    def tangent(J):
+        '''
+        sensitivity dX/dS of the specified variable (J: jacobian at a solution)
+        '''
+        _e = np.zeros(J.shape[0])
+        _e[-1] = 1
+        return np.linalg.solve(J, _e)
+
+    @staticmethod
+    def predictor(X, dXdS, dS, s, XPrev=None, tangentPrev=None):
+        '''
+        initial guess of the next point
+
+        cubic (Hermite) extrapolation through the last two points and their tangents,
+        first-order extrapolation for the first point or a large step
+
+        args:
+            X: current point
+            dXdS: tangent of the current point (dX[s]/dS = 1)
+            dS: step of the specified variable s
+            XPrev, tangentPrev: previous point and tangent
+        '''
+        # first-order
+        _X = X + dXdS*dS
+        # check
+        if XPrev is None or tangentPrev[s] == 0:
+            return _X
+        _h = X[s] - XPrev[s]
+        if _h == 0:
+            return _X
+        u = 1 + dS/_h
+        if not 1 < u <= 3:
+            return _X
+        # hermite basis on [XPrev, X]
+        h00 = 2*u**3 - 3*u**2 + 1
+        h10 = u**3 - 2*u**2 + u
+        h01 = -2*u**3 + 3*u**2
+        h11 = u**3 - u**2
+        return h00*XPrev + h10*_h*tangentPrev/tangentPrev[s] + h01*X + h11*_h*dXdS
+
+    def trace(self, zi, P0=1e5, maxPoints=500, Pmin=None):
+        '''
+        trace the phase envelope
+
+        args:
+            zi: feed mole fraction *** array *** (N)
+            P0: pressure of the first bubble point [Pa]
+            maxPoints: max number of points
+            Pmin: the dew curve is traced down to Pmin [Pa] (default: P0)
+
+        return:
+            res:
+                T: temperature [K] *** array *** (points)
+                P: pressure [Pa] *** array *** (points)
+                Ki: K ratio of the incipient phase *** array *** (points,N)
+                branch: bubble/dew *** array *** (points)
+                critical: {T, P} (None if not found)
+                cricondenbar: {T, P}
+                cricondentherm: {T, P}
+                complete: the dew curve reached Pmin (False: maxPoints)
+                iterations: total Newton iterations
+        '''
+        try:
+            # set
+            zi = np.asarray(zi, dtype=float)
+            zi = zi/np.sum(zi)
+            N = self.compNo
+            Pmin = P0 if Pmin is None else Pmin
+            _lnPmin = np.log(Pmin)
+
+            # ! first point (bubble point at P0)
+            T0, lnKi = self.WilsonBubbleTemperature(zi, P0)
+            s = N + 1
+            X = np.concatenate((lnKi, [np.log(T0), np.log(P0)]))
+            X, J, iterNo = self.newton(X, zi, s, X[s])
+            if iterNo is None:
+                raise Exception("the first bubble point not converged!")
+            iterTotal = iterNo
+
+            # points
+            points = [X]
+            critical = None
+            complete = False
+            # step
+            h, hMin, hMax = ENVELOPE_STEP
+            # tangent dX/dS (increasing ln(P) on the bubble curve)
+            tangent = self.tangent(J)
+            tangent = tangent*np.sign(tangent[N+1])
+            # previous point and tangent
+            XPrev, tangentPrev = None, None
+
+            while len(points) < maxPoints:
+                # specified variable (the largest sensitivity)
+                s = int(np.argmax(np.abs(tangent)))
+                dXdS = tangent/tangent[s]
+
+                # step
+                dS = np.sign(tangent[s])*h
+                # critical point ahead: symmetric ln(K) step across ln(K) = 0
+                if s < N and np.sign(dS) != np.sign(X[s]) and \
+                        (np.abs(X[s] + dS) < ENVELOPE_CRITICAL_LNK or np.sign(X[s] + dS) != np.sign(X[s])):
+                    # the jump is limited by the step (approach ln(K) = +-h first)
+                    if np.abs(X[s]) <= h:
+                        dS = -2*X[s]
+                    else:
+                        dS = np.sign(X[s])*h - X[s]
+
+                # predictor
+                _X = self.predictor(X, dXdS, dS, s, XPrev, tangentPrev)
+                # corrector
+                _X, _J, iterNo = self.newton(_X, zi, s, X[s] + dS)
+
+                # check
+                if iterNo is None or np.abs(_X[N] - X[N]) > 0.5:
+                    # step reduction
+                    h = 0.5*h
+                    if h < hMin:
+                        raise Exception(
+                            f"tracing stopped at T: {np.exp(X[N])} K, P: {np.exp(X[N+1])} Pa (step below {hMin})!")
+                    continue
+
+                iterTotal += iterNo
+                # critical point (sign change of ln(K))
+                _light = np.argmax(np.abs(X[:N]))
+                if critical is None and np.sign(_X[_light]) != np.sign(X[_light]):
+                    _w = X[_light]/(X[_light] - _X[_light])
+                    _Xc = X + _w*(_X - X)
+                    critical = {"T": np.exp(_Xc[N]), "P": np.exp(_Xc[N+1])}
+
+                # next (tangent in the direction of the step)
+                XPrev, tangentPrev = X, tangent
+                X = _X
+                tangent = self.tangent(_J)
+                tangent = tangent*np.sign(tangent[s]*dS)
+                points.append(X)
+
+                # adaptive step
+                if iterNo <= 3:
+                    h = min(1.5*h, hMax)
+                elif iterNo > 5:
+                    h = max(0.7*h, hMin)
+
+                # end of the dew curve
+                if critical is not None and X[N+1] < _lnPmin:
+                    complete = True
+                    break
+
+            # res
+            _X = np.array(points)
+            T = np.exp(_X[:, N])
+            P = np.exp(_X[:, N+1])
+            Ki = np.exp(_X[:, :N])
+            # branch
+            _light = np.argmax(np.abs(_X[0, :N]))
+            branch = np.where(np.sign(_X[:, _light]) == np.sign(
+                _X[0, _light]), 'bubble', 'dew')
+
+            return {
+                "T": T,
+                "P": P,
+                "Ki": Ki,
+                "branch": branch,
+                "critical": critical,
+                "cricondenbar": dict(zip(("T", "P"), self.extremum(T, P))),
+                "cricondentherm": dict(zip(("P", "T"), self.extremum(P, T))),
+                "complete": complete,
+                "iterations": iterTotal
+            }
+        except Exception as e:
+            raise Exception("phase envelope failed!, ", e)
+
+    @staticmethod
+    def extremum(x, y):
+        '''
+        max of y(x) along the curve (parabola through the highest point and its neighbors)
+
+        return:
+            x, y at the max
+        '''
+        k = int(np.argmax(y))
+        if 0 < k < y.size - 1:
+            _x = x[k-1:k+2]
+            _y = y[k-1:k+2]
+            a, b, c = np.polyfit(_x - _x[1], _y, 2)
+            if a < 0:
+                _dx = -b/(2*a)
+                if abs(_dx) <= np.max(np.abs(_x - _x[1])):
+                    return _x[1] + _dx, c - b*b/(4*a)
+        return x[k], y[k]
+
+    @staticmethod
+    def plot(res):
+        '''
+        plot the phase envelope (P-T)
+        '''
+        # import
+        from matplotlib import pyplot as plt
+
+        _bubble = res['branch'] == 'bubble'
+        plt.plot(res['T'][_bubble], res['P'][_bubble], 'b-', label='bubble')
+        plt.plot(res['T'][~_bubble], res['P'][~_bubble], 'r-', label='dew')
+        if res['critical'] is not None:
+            plt.plot(res['critical']['T'], res['critical']['P'], 'ko')
+        plt.xlabel('T [K]')
+        plt.ylabel('P [Pa]')
+        plt.legend()
+        plt.show()
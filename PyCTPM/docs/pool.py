@@ -4,16 +4,20 @@
 # packages/modules
 from typing import List
 import numpy as np
-from matplotlib import pyplot as plt
 # local
 from PyCTPM.docs.vle import VLEClass
+from PyCTPM.docs.diagram import DiagramClass
+from PyCTPM.docs.poolData import PoolData
+from PyCTPM.docs.phaseEnvelope import PhaseEnvelope
+from PyCTPM.docs.activityModel import MargulesModel, WilsonModel, NRTLModel
 from PyCTPM.results import Display
 from PyCTPM.core import roundNum
+from PyCTPM.core.constants import EOS_MODEL
 from PyCTPM.results import Visual
 from PyCTPM.core import LoaddataClass
 
 
-class Pool(VLEClass, Display):
+class Pool(VLEClass, DiagramClass, Display):
     '''
     define a multi-component system 
     '''
@@ -21,14 +25,21 @@ class Pool(VLEClass, Display):
     def __init__(self, componentList):
         self.componentList = componentList
         self.compNo = len(componentList)
+        # struct-of-arrays (component constants)
+        self.poolData = PoolData(componentList)
         #
         VLEClass.__init__(self, componentList)
+        DiagramClass.__init__(self)
         Display.__init__(self)
 
     @property
     def component_list(self):
         return self.componentList
 
+    @property
+    def pool_data(self):
+        return self.poolData
+
     def bubble_pressure(self, mole_fractions, temperature, vapor_pressure_method='polynomial', model='raoult', activity_coefficient_model='van-laar'):
         '''
         bubble pressure calculation
@@ -118,7 +129,142 @@ class Pool(VLEClass, Display):
         # res
         return _res
 
-    def flash_isothermal(self, mole_fractions, flash_pressure, flash_temperature, feed_pressure, feed_flowrate=1, guess_V_F_ratio=0.5, vapor_pressure_method='polynomial', model="raoult", activity_coefficient_model='van-laar'):
+    def bubble_pressure_batch(self, mole_fractions, temperature, vapor_pressure_method='polynomial', model='raoult', activity_coefficient_model='van-laar'):
+        '''
+        bubble pressure calculation for many liquid compositions
+
+        args:
+            mole_fractions: liquid mole fraction *** array *** (M, N)
+            temperature: temperature [K] (scalar or M)
+            vapor_pressure_method: vapor-pressure method (default: polynomial)
+            model: vle thermodynamic model
+                1. raoult
+                2. modified-raoult
+            activity_coefficient_model: model name or {name, params}
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo *** arrays ***
+        '''
+        # params
+        params = {
+            "zi": np.array(mole_fractions),
+            "T": temperature
+        }
+
+        # config
+        config = {
+            "VaPeCal": vapor_pressure_method,
+            "model": model,
+            "AcCoModel": self.activityModelSet(activity_coefficient_model)
+        }
+
+        # res
+        return self.bubblePressureBatch(params, config)
+
+    def dew_pressure_batch(self, mole_fractions, temperature, vapor_pressure_method='polynomial', model='raoult', activity_coefficient_model='van-laar'):
+        '''
+        dew pressure calculation for many vapor compositions
+
+        args:
+            mole_fractions: vapor mole fraction *** array *** (M, N)
+            temperature: temperature [K] (scalar or M)
+            vapor_pressure_method: vapor-pressure method (default: polynomial)
+            model: vle thermodynamic model
+            activity_coefficient_model: model name or {name, params}
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo *** arrays ***
+        '''
+        # params
+        params = {
+            "zi": np.array(mole_fractions),
+            "T": temperature
+        }
+
+        # config
+        config = {
+            "VaPeCal": vapor_pressure_method,
+            "model": model,
+            "AcCoModel": self.activityModelSet(activity_coefficient_model)
+        }
+
+        # res
+        return self.dewPressureBatch(params, config)
+
+    def bubble_temperature_batch(self, mole_fractions, pressure, guess_temperature=350, vapor_pressure_method='polynomial', model='raoult', activity_coefficient_model='van-laar'):
+        '''
+        bubble temperature calculation for many liquid compositions
+
+        args:
+            mole_fractions: liquid mole fraction *** array *** (M, N)
+            pressure: pressure [Pa] (scalar or M)
+            guess_temperature: initial guess [K] (scalar or M)
+            vapor_pressure_method: vapor-pressure method (default: polynomial)
+            model: vle thermodynamic model
+            activity_coefficient_model: model name or {name, params}
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo, iterNo *** arrays ***
+        '''
+        # params
+        params = {
+            "zi": np.array(mole_fractions),
+            "P": pressure
+        }
+
+        # config
+        config = {
+            "Tg0": guess_temperature,
+            "VaPeCal": vapor_pressure_method,
+            "model": model,
+            "AcCoModel": self.activityModelSet(activity_coefficient_model)
+        }
+
+        # res
+        return self.bubbleTemperatureBatch(params, config)
+
+    def dew_temperature_batch(self, mole_fractions, pressure, guess_temperature=350, vapor_pressure_method='polynomial', model='raoult', activity_coefficient_model='van-laar'):
+        '''
+        dew temperature calculation for many vapor compositions
+
+        args:
+            mole_fractions: vapor mole fraction *** array *** (M, N)
+            pressure: pressure [Pa] (scalar or M)
+            guess_temperature: initial guess [K] (scalar or M)
+            vapor_pressure_method: vapor-pressure method (default: polynomial)
+            model: vle thermodynamic model
+            activity_coefficient_model: model name or {name, params}
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo, iterNo *** arrays ***
+        '''
+        # params
+        params = {
+            "zi": np.array(mole_fractions),
+            "P": pressure
+        }
+
+        # config
+        config = {
+            "Tg0": guess_temperature,
+            "VaPeCal": vapor_pressure_method,
+            "model": model,
+            "AcCoModel": self.activityModelSet(activity_coefficient_model)
+        }
+
+        # res
+        return self.dewTemperatureBatch(params, config)
+
+    @staticmethod
+    def activityModelSet(activity_coefficient_model):
+        '''
+        activity coefficient model config {name, params}
+        '''
+        if isinstance(activity_coefficient_model, dict):
+            return activity_coefficient_model
+        return {"name": activity_coefficient_model}
+
+    def flash_isothermal(self, mole_fractions, flash_pressure, flash_temperature, feed_pressure, feed_flowrate=1, guess_V_F_ratio=0.5, vapor_pressure_method='polynomial', model="raoult", activity_coefficient_model='van-laar', solver='rachford-rice', negative_flash=False):
         '''
         isothermal flash calculation
 
@@ -131,12 +277,20 @@ class Pool(VLEClass, Display):
             guess_V_F_ratio: 
             vapor_pressure_method: 
             model: "raoult"
+                1. raoult: K[i] = P*[i]/P
+                2. eos: K[i] = phi[i,L]/phi[i,V] (Peng-Robinson), solver is not used,
+                    a feed found stable by the stability test is not flashed
+            solver: flash solver
+                1. rachford-rice (default)
+                2. least-squares
+            negative_flash: allow V/F outside [0, 1] (rachford-rice)
 
         notes:
             flash case: P[bubble]>P[flash]>P[dew]
             cases:
                 1. P[bubble]<P[flash] results in the liquid phase feed
                 2. P[dew]>P[flash] results in the vapor phase feed
+            eos model: the flash state is set by the eos flash, bubble/dew pressures are Raoult estimates
         '''
         # vapor pressure at inlet temperature
         VaPr = self.vaporPressureMixture(
@@ -175,11 +329,22 @@ class Pool(VLEClass, Display):
         config = {
             "guess_V_F_ratio": guess_V_F_ratio,
             "VaPeCal": vapor_pressure_method,
-            "model": model
+            "model": model,
+            "negative_flash": negative_flash
         }
 
         # flash calculation
-        V_F_ratio, L_F_ratio, xi, yi = self.flashIsothermalV2(params, config)
+        if model == EOS_MODEL:
+            V_F_ratio, L_F_ratio, xi, yi, _eosRes = self.flashIsothermalEOS(
+                params, config)
+            flashState = _eosRes['two-phase']
+        elif solver == 'rachford-rice':
+            V_F_ratio, L_F_ratio, xi, yi = self.flashIsothermal(params, config)
+        elif solver == 'least-squares':
+            V_F_ratio, L_F_ratio, xi, yi = self.flashIsothermalV2(
+                params, config)
+        else:
+            raise Exception(f"flash solver {solver} is not defined!")
 
         # NOTE
         # ! display results
@@ -216,74 +381,139 @@ class Pool(VLEClass, Display):
         # res
         return flashState, BuPr, DePr, VaPr, V_F_ratio, L_F_ratio, xi, yi
 
-    def Txy_binary(self, pressure, guess_temperature=350, vapor_pressure_method='polynomial', model="raoult", zi_no=10):
+    def stability_test(self, mole_fractions, pressure, temperature, model='eos', activity_coefficient_model='van-laar'):
         '''
-        bubble temperature calculation
+        phase stability test (tangent plane distance)
 
         args:
-            mole_fraction: feed mole fraction (zi=xi)
-            pressure: system pressure [Pa]
+            mole_fractions: feed mole fraction [-]
+            pressure: pressure [Pa]
+            temperature: temperature [K]
+            model: 
+                1. eos: vapor/liquid stability (Peng-Robinson)
+                2. modified-raoult: liquid/liquid stability (activity model)
+            activity_coefficient_model: model name or {name, params}
+
+        return:
+            res:
+                stable: feed state (True: single phase)
+                tm: tangent plane distance of the trial phases
+                wi: trial phase mole fraction
+                Ki: K ratio initial estimate (unstable feed) or None
+        '''
+        # params
+        params = {
+            "zi": np.array(mole_fractions),
+            "P": pressure,
+            "T": temperature
+        }
+
+        # config
+        config = {
+            "model": model,
+            "AcCoModel": self.activityModelSet(activity_coefficient_model)
+        }
+
+        # res
+        return self.stabilityTest(params, config)
+
+    def phase_envelope(self, mole_fractions, start_pressure=1e5, max_points=500, plot=False):
+        '''
+        phase envelope of a feed (Peng-Robinson)
+
+        the bubble curve is traced from start_pressure through the cricondenbar and
+        the critical point, then the dew curve through the cricondentherm down to start_pressure
+
+        args:
+            mole_fractions: feed mole fraction [-]
+            start_pressure: pressure of the first bubble point [Pa]
+            max_points: max number of points
+            plot: plot the envelope (P-T)
+
+        return:
+            res:
+                T: temperature [K]
+                P: pressure [Pa]
+                Ki: K ratio of the incipient phase
+                branch: bubble/dew
+                critical: {T, P} (None if not found)
+                cricondenbar: {T, P}
+                cricondentherm: {T, P}
+                complete: the dew curve reached start_pressure (False: max_points)
+                iterations: total Newton iterations
+        '''
+        # params
+        params = {
+            "zi": np.array(mole_fractions)
+        }
+
+        # config
+        config = {
+            "P0": start_pressure,
+            "maxPoints": max_points
+        }
+
+        # cal
+        _res = self.phaseEnvelope(params, config)
+
+        # plot
+        if plot is True:
+            PhaseEnvelope.plot(_res)
+
+        # res
+        return _res
+
+    def Txy_binary(self, pressure, guess_temperature=350, vapor_pressure_method='polynomial', model="raoult", zi_no=10, activity_coefficient_model='van-laar', plot=False, workers=None):
+        '''
+        Txy diagram of a binary system
+
+        args:
+            pressure: system pressure [Pa] (scalar or list)
             guess_temperature: 
             vapor_pressure_method: vapor-pressure calculation method (default: polynomial)
             model: thermodynamic model for equilibrium system (default: raoult)
             zi_no: number of mole fractions
+            activity_coefficient_model: model name or {name, params}
+            plot: plot bubble/dew lines
+            workers: number of processes (split pressures)
+
+        return:
+            res: P, T, x1, y1, xi, yi *** arrays *** (one row per pressure)
+                P: (K), T, x1, y1: (K, zi_no), xi, yi: (K, zi_no, 2), K: number of pressures
+
+        NOTE: breaking change, a dict of arrays is returned (formerly a list of bubble temperature
+        dicts, one per mole fraction), a scalar pressure gives K = 1
         '''
-        #  feed mole fraction
-        x1 = np.linspace(0.001, 0.999, zi_no)
-        x2 = 1 - x1
-        #
-        mole_fractions = np.array([x1, x2])
+        # params
+        params = {
+            "P": pressure,
+            "zi_no": zi_no
+        }
 
-        # res
-        _res = []
-
-        for i in range(zi_no):
-            # params
-            params = {
-                "zi": np.array(mole_fractions[:, i]),
-                "P": pressure
-            }
-
-            # config
-            config = {
-                "Tg0": guess_temperature,
-                "VaPeCal": vapor_pressure_method
-            }
-
-            # cal
-            _btRes = self.bubbleTemperature(params, config)
-            _res.append(_btRes)
-
-        # Ts
-        Ts = [item['T'] for item in _res]
-        # xi
-        xi = [item['xi'][0] for item in _res]
-        # yi
-        yi = [item['yi'][0] for item in _res]
-        # set
-        bubbleLine = [[xi], [Ts]]
-        dewLine = [[yi], [Ts]]
+        # config
+        config = {
+            "Tg0": guess_temperature,
+            "VaPeCal": vapor_pressure_method,
+            "model": model,
+            "AcCoModel": self.activityModelSet(activity_coefficient_model)
+        }
 
-        # ! plot setting
-        # XYList = Visual.plots2DSetXYList(dataX, dataYs)
-        # -> label
-        # dataList = Visual.plots2DSetDataList(XYList, labelList)
-        # Visual.plot2D(xi, Ts)
-        # Visual.plot2D(yi, Ts)
+        # cal
+        _res = self.diagramParallel('Txy', params, config, workers)
 
-        plt.plot(xi, Ts, 'r-', yi, Ts, 'b-')
-        plt.show()
+        # plot
+        if plot is True:
+            self.diagramPlot(_res, 'Txy')
 
         # res
         return _res
 
-    def Pxy_binary(self, temperature,  vapor_pressure_method='polynomial', model="modified-raoult", activity_coefficient_model={}, zi_no=10):
+    def Pxy_binary(self, temperature,  vapor_pressure_method='polynomial', model="modified-raoult", activity_coefficient_model={}, zi_no=10, plot=False, workers=None):
         '''
-        bubble temperature calculation
+        Pxy diagram of a binary system
 
         args:
-            mole_fraction: feed mole fraction (zi=xi)
-            temperature: system (fixed) temperature [K]
+            temperature: system (fixed) temperature [K] (scalar or list)
             vapor_pressure_method: vapor-pressure calculation method (default: polynomial)
             model: thermodynamic model for equilibrium system (default: raoult)
             activity_coefficient_model: 
@@ -291,54 +521,35 @@ class Pool(VLEClass, Display):
                     1. 
                 2. parameters
             zi_no: number of mole fractions
+            plot: plot bubble/dew lines
+            workers: number of processes (split temperatures)
+
+        return:
+            res: T, P, x1, y1, xi, yi *** arrays *** (one row per temperature)
+                T: (K), P, x1, y1: (K, zi_no), xi, yi: (K, zi_no, 2), K: number of temperatures
+
+        NOTE: breaking change, a dict of arrays is returned (formerly a list of bubble pressure
+        dicts, one per mole fraction), a scalar temperature gives K = 1
         '''
-        #  feed mole fraction
-        x1 = np.linspace(0.001, 0.999, zi_no)
-        x2 = 1 - x1
-        #
-        mole_fractions = np.array([x1, x2])
+        # params
+        params = {
+            "T": temperature,
+            "zi_no": zi_no
+        }
 
-        # res
-        _res = []
-
-        for i in range(zi_no):
-            # params
-            params = {
-                "zi": np.array(mole_fractions[:, i]),
-                "T": temperature
-            }
-
-            # config
-            config = {
-                "VaPeCal": vapor_pressure_method,
-                "model": model,
-                "AcCoModel": activity_coefficient_model
-            }
-
-            # ! check vle model
-            # cal
-            _btRes = self.bubblePressure(params, config)
-            _res.append(_btRes)
-
-        # pressure series (Ps)
-        Ps = [item['P'] for item in _res]
-        # xi
-        xi = [item['xi'][0] for item in _res]
-        # yi
-        yi = [item['yi'][0] for item in _res]
-        # set
-        bubbleLine = [[xi], [Ps]]
-        dewLine = [[yi], [Ps]]
+        # config
+        config = {
+            "VaPeCal": vapor_pressure_method,
+            "model": model,
+            "AcCoModel": self.activityModelSet(activity_coefficient_model)
+        }
 
-        # ! plot setting
-        # XYList = Visual.plots2DSetXYList(dataX, dataYs)
-        # -> label
-        # dataList = Visual.plots2DSetDataList(XYList, labelList)
-        # Visual.plot2D(xi, Ts)
-        # Visual.plot2D(yi, Ts)
+        # cal
+        _res = self.diagramParallel('Pxy', params, config, workers)
 
-        plt.plot(xi, Ps, 'r-', yi, Ps, 'b-')
-        plt.show()
+        # plot
+        if plot is True:
+            self.diagramPlot(_res, 'Pxy')
 
         # res
         return _res
@@ -417,12 +628,10 @@ class Pool(VLEClass, Display):
         AcCo, xi = LoaddataClass.Pxy_BinarySystemInterpretData(
             self.pool, np_data, rowNo, vapor_pressure_method)
 
-        for i in range(rowNo):
-            # check for x1=0, activity coefficient is not defined
-            if i > 0 and i < rowNo-1:
-                # calculate excess molar gibbs energy
-                ExMoGiEn[i] = self.ExcessMolarGibbsFreeEnergy(
-                    xi[i, :], AcCo[i, :])
+        # check for x1=0, activity coefficient is not defined
+        # calculate excess molar gibbs energy
+        ExMoGiEn[1:-1] = self.ExcessMolarGibbsFreeEnergy(
+            xi[1:-1, :], AcCo[1:-1, :])
 
         #! call optimizer fun
         # params
@@ -437,17 +646,14 @@ class Pool(VLEClass, Display):
             ExMoGiEn_model = np.zeros(rowNo)
             AcCo_model = np.zeros((rowNo, 2))
 
-            for i in range(rowNo):
-                if i > 0 and i < rowNo-1:
-                    # activity coefficient using the model
-                    AcCo_model[i, :] = self.Margules_activity_coefficient(
-                        xi[i, :], Aij)
-
-                    ExMoGiEn_model[i] = self.ExcessMolarGibbsFreeEnergy(
-                        xi[i, :], AcCo_model[i, :])
+            # activity coefficient and excess molar gibbs energy using the model (all compositions)
+            AcCo_model[1:-1, :], ExMoGiEn_model[1:-1] = MargulesModel(Aij).calculate(
+                xi[1:-1, :])
 
         # plot
         if plot_result is True:
+            # import
+            from matplotlib import pyplot as plt
             plt.plot(xi[1:-1, 0], ExMoGiEn[1:-1], 'o')
             plt.plot(xi[1:-1, 0], ExMoGiEn_model[1:-1], 'b-')
             plt.show()
@@ -485,12 +691,10 @@ class Pool(VLEClass, Display):
         AcCo, xi, T = LoaddataClass.Pxy_BinarySystemInterpretData(
             self.pool, np_data, rowNo, vapor_pressure_method)
 
-        for i in range(rowNo):
-            # check for x1=0, activity coefficient is not defined
-            if i > 0 and i < rowNo-1:
-                # calculate excess molar gibbs energy
-                ExMoGiEn[i] = self.ExcessMolarGibbsFreeEnergy(
-                    xi[i, :], AcCo[i, :])
+        # check for x1=0, activity coefficient is not defined
+        # calculate excess molar gibbs energy
+        ExMoGiEn[1:-1] = self.ExcessMolarGibbsFreeEnergy(
+            xi[1:-1, :], AcCo[1:-1, :])
 
         #! call optimizer fun
         # params
@@ -503,17 +707,14 @@ class Pool(VLEClass, Display):
         ExMoGiEn_model = np.zeros(rowNo)
         AcCo_model = np.zeros((rowNo, 2))
 
-        for i in range(rowNo):
-            if i > 0 and i < rowNo-1:
-                # activity coefficient using the model
-                AcCo_model[i, :] = self.Wilson_activity_coefficient(
-                    xi[i, :], T, aij)
-
-                ExMoGiEn_model[i] = self.ExcessMolarGibbsFreeEnergy(
-                    xi[i, :], AcCo_model[i, :])
+        # activity coefficient and excess molar gibbs energy using the model (all compositions)
+        AcCo_model[1:-1, :], ExMoGiEn_model[1:-1] = WilsonModel(aij, self.poolData.molarVolumeRackett).calculate(
+            xi[1:-1, :], T)
 
         # plot
         if plot_result is True:
+            # import
+            from matplotlib import pyplot as plt
             plt.plot(xi[1:-1, 0], ExMoGiEn[1:-1], 'o')
             plt.plot(xi[1:-1, 0], ExMoGiEn_model[1:-1], 'b-')
             plt.show()
@@ -555,12 +756,10 @@ class Pool(VLEClass, Display):
         AcCo, xi, T = LoaddataClass.Pxy_BinarySystemInterpretData(
             self.pool, np_data, rowNo, vapor_pressure_method)
 
-        for i in range(rowNo):
-            # check for x1=0, activity coefficient is not defined
-            if i > 0 and i < rowNo-1:
-                # calculate excess molar gibbs energy
-                ExMoGiEn[i] = self.ExcessMolarGibbsFreeEnergy(
-                    xi[i, :], AcCo[i, :])
+        # check for x1=0, activity coefficient is not defined
+        # calculate excess molar gibbs energy
+        ExMoGiEn[1:-1] = self.ExcessMolarGibbsFreeEnergy(
+            xi[1:-1, :], AcCo[1:-1, :])
 
         #! call optimizer fun
         # params
@@ -577,17 +776,14 @@ class Pool(VLEClass, Display):
         ExMoGiEn_model = np.zeros(rowNo)
         AcCo_model = np.zeros((rowNo, 2))
 
-        for i in range(rowNo):
-            if i > 0 and i < rowNo-1:
-                # activity coefficient using the model
-                AcCo_model[i, :] = self.NRTL_activity_coefficient(
-                    xi[i, :], T, aij, gij)
-
-                ExMoGiEn_model[i] = self.ExcessMolarGibbsFreeEnergy(
-                    xi[i, :], AcCo_model[i, :])
+        # activity coefficient and excess molar gibbs energy using the model (all compositions)
+        AcCo_model[1:-1, :], ExMoGiEn_model[1:-1] = NRTLModel(aij, gij).calculate(
+            xi[1:-1, :], T)
 
         # plot
         if plot_result is True:
+            # import
+            from matplotlib import pyplot as plt
             plt.plot(xi[1:-1, 0], ExMoGiEn[1:-1], 'o')
             plt.plot(xi[1:-1, 0], ExMoGiEn_model[1:-1], 'b-')
             plt.show()
@@ -0,0 +1,119 @@
+# POOL DATA
+# ----------
+
+# packages/modules
+import numpy as np
+# local
+from PyCTPM.docs.dThermo import ModifiedRackettEquation, calVaporPressureV2, VaporPressureEngine
+from PyCTPM.docs.eosConstants import EosConstants
+
+
+class PoolData:
+    '''
+    struct-of-arrays view of a component list
+
+    all constants are parsed once (at construction) into contiguous arrays (N),
+    mixture calculations then run as array operations over components:
+        1. MW, Tc, Pc, Vc, Zc, w
+        2. vapor-pressure equation id (mask) and coefficients
+        3. eos constants: van der Waals a/b, Peng-Robinson b/ac/kappa
+
+    units:
+        MW [g/mol], Tc [K], Pc [Pa], Vc [cm^3/mol]
+    '''
+
+    def __init__(self, componentList):
+        # component no
+        self.compNo = len(componentList)
+        # symbols
+        self.symbol = [item.symbol for item in componentList]
+
+        # * critical constants
+        self.MW = self.__toArray(componentList, 'MW')
+        self.Tc = self.__toArray(componentList, 'Tc')
+        # bar -> Pa
+        self.Pc = self.__toArray(componentList, 'Pc')*1e5
+        self.Vc = self.__toArray(componentList, 'Vc')
+        self.Zc = self.__toArray(componentList, 'Zc')
+        self.w = self.__toArray(componentList, 'w')
+
+        # * vapor-pressure equations (grouped by equation id)
+        self.VaPeEngine = VaporPressureEngine(
+            self.symbol, [getattr(item, 'vaporPressureData', None) for item in componentList])
+        self.VaPeEqId = self.VaPeEngine.eqId
+
+        # * eos constants
+        self.eosConstants = EosConstants(self.Pc, self.Tc, self.w, self.Zc)
+        # van der Waals (a is temperature-independent)
+        self.aVDW = self.eosConstants.aVDW
+        self.bVDW = self.eosConstants.bVDW
+        # Peng-Robinson
+        self.acPR = self.eosConstants.acPR
+        self.bPR = self.eosConstants.bPR
+        self.kappaPR = self.eosConstants.kappaPR
+
+    @staticmethod
+    def __toArray(componentList, name):
+        '''
+        a component property as float64 array
+        '''
+        return np.array([float(getattr(item, name)) for item in componentList], dtype=float)
+
+    def aPR(self, T):
+        '''
+        Peng-Robinson a constant
+
+        args:
+            T: temperature [K] (scalar/array M)
+
+        return:
+            a: [Pa.(m3^2)/(mol^2)] *** array *** (M, N)
+        '''
+        return self.eosConstants.aPRArray(T)
+
+    def vaporPressure(self, T, derivative=False):
+        '''
+        vapor-pressure of all components from the polynomial (Antoine/DIPPR) equations
+
+        args:
+            T: temperature [K] (scalar/array M)
+            derivative: calculate dP*/dT
+
+        return:
+            VaPe: vapor-pressure [Pa] *** array *** (M, N)
+            dVaPe: dP*/dT [Pa/K] *** array *** (M, N) (derivative=True)
+        '''
+        _res = self.VaPeEngine.calculate(T, derivative)
+        # check
+        if derivative is False:
+            return _res.T
+        # res
+        return _res[0].T, _res[1].T
+
+    def vaporPressureShortcut(self, T, derivative=False):
+        '''
+        vapor-pressure of all components from the shortcut equation
+
+        return:
+            VaPe: vapor-pressure [Pa] *** array *** (M, N)
+            dVaPe: dP*/dT [Pa/K] *** array *** (M, N) (derivative=True)
+        '''
+        T = np.asarray(T, dtype=float).reshape(-1, 1)
+        VaPe = calVaporPressureV2(T, self.Pc, self.Tc, self.w)
+        # check
+        if derivative is False:
+            return VaPe
+        # log10(P*/Pc) = 7/3*(1+w)*(1-Tc/T)
+        dlnVaPe = np.log(10)*(7/3)*(1+self.w)*self.Tc/np.power(T, 2)
+        # res
+        return VaPe, VaPe*dlnVaPe
+
+    def molarVolumeRackett(self, T):
+        '''
+        saturated liquid molar volume (modified Rackett equation)
+
+        return:
+            MoVo: molar volume [m^3/mol] *** array *** (M, N)
+        '''
+        T = np.asarray(T, dtype=float).reshape(-1, 1)
+        return ModifiedRackettEquation(T, self.Pc, self.Tc, self.w)
@@ -0,0 +1,310 @@
+# PURE-COMPONENT PROPERTY TABLE
+# ------------------------------
+
+# packages/modules
+import math
+from bisect import bisect_right
+import numpy as np
+# internals
+import PyCTPM.core.constants as CONST
+from PyCTPM.docs.eosCore import eosCoreClass
+from PyCTPM.docs.cubicEos import CubicEos
+
+# validation: sub-intervals per grid interval
+# vapor-pressure: ends, quarter points
+PROPTABLE_VAPOR_PRESSURE_DIVISION = 4
+# eos: corners, edge midpoints, center
+PROPTABLE_EOS_DIVISION = 2
+# validation: a cell is valid for a sub-grid error below tolerance*safety factor
+PROPTABLE_CHECK_SAFETY = 0.5
+
+
+class PropertyTable:
+    '''
+    tabulated pure-component properties on a (P, T) grid
+
+    tables:
+        1. vapor-pressure: ln(P*) vs 1/T (monotone cubic, pchip)
+        2. compressibility factor and ln(phi) of the component phase (state): bicubic spline on (ln P, T)
+
+    validation:
+        each interval/cell is checked against the direct calculation on a sub-grid
+        (vapor-pressure: ends and quarter points, eos: corners, edge midpoints and center),
+        a cell is valid for an error below PROPTABLE_CHECK_SAFETY*tolerance (the error between
+        the sub-grid points is larger), queries outside the grid or in an invalid cell use the direct path
+    '''
+
+    def __init__(self, component, T_range, P_range, T_no=64, P_no=64, eos_model='PR', vapor_pressure_method='polynomial', tolerance=1e-6):
+        '''
+        args:
+            component: Component
+            T_range: temperature range [K] [Tmin, Tmax]
+            P_range: pressure range [Pa] [Pmin, Pmax]
+            T_no, P_no: number of grid points
+            eos_model: eos model (PR, SRK, RK, VDW)
+            vapor_pressure_method: vapor-pressure method of the table
+            tolerance: max relative error (Z, P*) and absolute error (ln(phi)) of a cell on
+                the validation sub-grid
+        '''
+        self.component = component
+        self.eosModel = eos_model
+        # eos kernel (check)
+        self.cubicEos = CubicEos.get(eos_model)
+        self.vaporPressureMethod = vapor_pressure_method
+        self.tolerance = tolerance
+        # phase root: gas (highest Z), liquid (lowest Z)
+        self.state = component.state
+
+        # grid
+        self.T = np.linspace(float(T_range[0]), float(T_range[1]), T_no)
+        self.lnP = np.linspace(np.log(float(P_range[0])),
+                               np.log(float(P_range[1])), P_no)
+
+        # usage
+        self.stats = {"table": 0, "direct": 0}
+
+        # build
+        self.buildVaporPressure()
+        self.buildEOS()
+
+    # NOTE
+    # ! build
+
+    def _vaporPressureDirect(self, T):
+        '''
+        direct vapor-pressure [Pa] *** array ***
+        '''
+        T = np.atleast_1d(np.asarray(T, dtype=float))
+        if self.vaporPressureMethod == 'polynomial':
+            return np.broadcast_to(self.component.vaporPressure(
+                T, self.vaporPressureMethod, self.eosModel), T.shape).astype(float)
+        return np.array([self.component.vaporPressure(item, self.vaporPressureMethod, self.eosModel) for item in T], dtype=float)
+
+    def _eosDirect(self, P, T):
+        '''
+        direct Z and ln(phi) of the component phase *** arrays ***
+        '''
+        _eos = eosCoreClass([self.component.thermoPropData], [
+                            self.component.symbol], self.eosModel, [1], {})
+        res = _eos._eosBatch(P, T, [1.0])
+        # phase root
+        Z = res['ZV'] if self.state == 'g' else res['ZL']
+        A = res['A']
+        B = res['B']
+        # fugacity coefficient
+        lnPhi = self.cubicEos.residualGibbs(Z, A, B)
+        return Z, lnPhi
+
+    def buildVaporPressure(self):
+        '''
+        ln(P*) vs 1/T table
+        '''
+        # import
+        from scipy.interpolate import PchipInterpolator
+
+        # grid (1/T increasing)
+        u = 1/self.T[::-1]
+        lnVaPe = np.log(self._vaporPressureDirect(self.T[::-1]))
+        self.lnVaPeTable = PchipInterpolator(u, lnVaPe, extrapolate=False)
+        # piecewise polynomial (scalar evaluation)
+        self._u = u.tolist()
+        self._uCoeff = self.lnVaPeTable.c.T.tolist()
+
+        # validation (interval sub-grid)
+        _Tm = self._subGrid(self.T, PROPTABLE_VAPOR_PRESSURE_DIVISION)
+        _direct = self._vaporPressureDirect(_Tm)
+        _table = np.exp(self.lnVaPeTable(1/_Tm))
+        _err = self._cellError(np.abs(_table/_direct - 1),
+                               PROPTABLE_VAPOR_PRESSURE_DIVISION)
+        self.vaporPressureValid = _err <= PROPTABLE_CHECK_SAFETY*self.tolerance
+
+    def buildEOS(self):
+        '''
+        Z(ln P, T) and ln(phi)(ln P, T) tables
+        '''
+        # import
+        from scipy.interpolate import RectBivariateSpline
+
+        # grid
+        _lnP, _T = np.meshgrid(self.lnP, self.T, indexing='ij')
+        Z, lnPhi = self._eosDirect(np.exp(_lnP.ravel()), _T.ravel())
+        Z = Z.reshape(_lnP.shape)
+        lnPhi = lnPhi.reshape(_lnP.shape)
+        self.ZTable = RectBivariateSpline(self.lnP, self.T, Z)
+        self.lnPhiTable = RectBivariateSpline(self.lnP, self.T, lnPhi)
+
+        # validation (cell sub-grid)
+        _lnP, _T = np.meshgrid(self._subGrid(self.lnP, PROPTABLE_EOS_DIVISION),
+                               self._subGrid(self.T, PROPTABLE_EOS_DIVISION), indexing='ij')
+        _Z, _lnPhi = self._eosDirect(np.exp(_lnP.ravel()), _T.ravel())
+        _errZ = np.abs(self.ZTable.ev(_lnP.ravel(), _T.ravel())/_Z - 1)
+        _errPhi = np.abs(self.lnPhiTable.ev(
+            _lnP.ravel(), _T.ravel()) - _lnPhi)
+        _err = self._cellError(np.maximum(_errZ, _errPhi).reshape(_lnP.shape),
+                               PROPTABLE_EOS_DIVISION)
+        self.eosValid = _err <= PROPTABLE_CHECK_SAFETY*self.tolerance
+
+    @staticmethod
+    def _subGrid(grid, k):
+        '''
+        grid points and k - 1 points inside each interval
+        '''
+        return np.linspace(grid[0], grid[-1], k*(grid.size - 1) + 1)
+
+    @staticmethod
+    def _cellError(err, k):
+        '''
+        max error of each interval/cell from the sub-grid errors (nan: inf)
+
+        args:
+            err: error on the sub-grid *** array *** (n) or (n,m)
+            k: sub-intervals per grid interval
+        '''
+        err = np.where(np.isfinite(err), err, np.inf)
+        # max over the k + 1 points of each interval (every axis)
+        for axis in range(err.ndim):
+            _n = (err.shape[axis] - 1)//k
+            _res = None
+            for o in range(k + 1):
+                _item = np.take(err, np.arange(o, o + k*_n, k), axis=axis)
+                _res = _item if _res is None else np.maximum(_res, _item)
+            err = _res
+        return err
+
+    # NOTE
+    # ! query
+
+    @staticmethod
+    def _cellIndex(grid, x):
+        '''
+        interval index of a scalar x on a uniform grid (-1 outside the grid)
+        '''
+        if not (grid[0] <= x <= grid[-1]):
+            return -1
+        return min(int((x - grid[0])/(grid[1] - grid[0])), grid.size - 2)
+
+    def _intervalIndex(self, grid, x):
+        '''
+        interval index of x (-1 outside the grid)
+        '''
+        i = np.searchsorted(grid, x, side='right') - 1
+        i = np.where(x == grid[-1], grid.size - 2, i)
+        return np.where((x >= grid[0]) & (x <= grid[-1]), i, -1)
+
+    def vaporPressureMask(self, T):
+        '''
+        temperatures served by the table
+        '''
+        i = self._intervalIndex(self.T, T)
+        return (i >= 0) & self.vaporPressureValid[np.maximum(i, 0)]
+
+    def eosMask(self, lnP, T):
+        '''
+        states served by the table
+        '''
+        i = self._intervalIndex(self.lnP, lnP)
+        j = self._intervalIndex(self.T, T)
+        return (i >= 0) & (j >= 0) & self.eosValid[np.maximum(i, 0), np.maximum(j, 0)]
+
+    def vapor_pressure(self, T):
+        '''
+        vapor-pressure [Pa]
+
+        args:
+            T: temperature [K] (scalar/array)
+        '''
+        # scalar
+        if np.ndim(T) == 0:
+            i = self._cellIndex(self.T, T)
+            if i >= 0 and self.vaporPressureValid[i]:
+                self.stats['table'] += 1
+                u = 1/T
+                k = min(max(bisect_right(self._u, u) - 1, 0), len(self._uCoeff) - 1)
+                c0, c1, c2, c3 = self._uCoeff[k]
+                du = u - self._u[k]
+                return math.exp(((c0*du + c1)*du + c2)*du + c3)
+
+        _T = np.atleast_1d(np.asarray(T, dtype=float))
+        mask = self.vaporPressureMask(_T)
+        res = np.zeros(_T.shape)
+        res[mask] = np.exp(self.lnVaPeTable(1/_T[mask]))
+        # direct
+        if not np.all(mask):
+            res[~mask] = self._vaporPressureDirect(_T[~mask])
+        self.stats['table'] += int(np.sum(mask))
+        self.stats['direct'] += int(np.sum(~mask))
+        return res[0] if np.ndim(T) == 0 else res
+
+    def compressibility_factor(self, P, T):
+        '''
+        compressibility factor of the component phase
+
+        args:
+            P: pressure [Pa] (scalar/array)
+            T: temperature [K] (scalar/array)
+        '''
+        Z, _ = self._eos(P, T)
+        return Z
+
+    def molar_volume(self, P, T):
+        '''
+        molar-volume [m^3/mol]
+        '''
+        Z, _ = self._eos(P, T)
+        return Z*CONST.R_CONST*T/P
+
+    def fugacity(self, P, T):
+        '''
+        fugacity of the component phase (eos)
+
+        return:
+            f: fugacity [Pa]
+            phi: fugacity coefficient [-]
+        '''
+        _, lnPhi = self._eos(P, T)
+        phi = np.exp(lnPhi)
+        return P*phi, phi
+
+    def _eos(self, P, T):
+        '''
+        Z and ln(phi) from the table (direct path outside the grid/invalid cells)
+        '''
+        # scalar
+        if np.ndim(P) == 0 and np.ndim(T) == 0:
+            _lnP = math.log(P)
+            i = self._cellIndex(self.lnP, _lnP)
+            j = self._cellIndex(self.T, T)
+            if i >= 0 and j >= 0 and self.eosValid[i, j]:
+                self.stats['table'] += 1
+                return float(self.ZTable(_lnP, T, grid=False)), float(self.lnPhiTable(_lnP, T, grid=False))
+
+        _P, _T = np.broadcast_arrays(np.atleast_1d(np.asarray(P, dtype=float)),
+                                     np.atleast_1d(np.asarray(T, dtype=float)))
+        _lnP = np.log(_P)
+        mask = self.eosMask(_lnP, _T)
+
+        Z = np.zeros(_P.shape)
+        lnPhi = np.zeros(_P.shape)
+        if np.any(mask):
+            Z[mask] = self.ZTable.ev(_lnP[mask], _T[mask])
+            lnPhi[mask] = self.lnPhiTable.ev(_lnP[mask], _T[mask])
+        # direct
+        if not np.all(mask):
+            Z[~mask], lnPhi[~mask] = self._eosDirect(_P[~mask], _T[~mask])
+
+        self.stats['table'] += int(np.sum(mask))
+        self.stats['direct'] += int(np.sum(~mask))
+
+        # res
+        if np.ndim(P) == 0 and np.ndim(T) == 0:
+            return Z[0], lnPhi[0]
+        return Z, lnPhi
+
+    def coverage(self):
+        '''
+        fraction of the grid served by the table
+        '''
+        return {
+            "vapor-pressure": float(np.mean(self.vaporPressureValid)),
+            "eos": float(np.mean(self.eosValid))
+        }
@@ -0,0 +1,161 @@
+# PHASE STABILITY (TANGENT PLANE DISTANCE)
+# ----------------------------------------
+
+# packages/modules
+import numpy as np
+
+# stability settings
+# tolerance of max|ln(W[i]) change| (trial phase)
+STABILITY_TOLERANCE = 1e-10
+# max iteration
+STABILITY_MAX_ITERATION = 200
+# tm < -STABILITY_TM_TOLERANCE: unstable
+STABILITY_TM_TOLERANCE = 1e-8
+# trivial solution: max|ln(w[i]/z[i])| is below
+STABILITY_TRIVIAL = 1e-4
+# GDEM extrapolation every n steps
+STABILITY_GDEM_STEP = 5
+
+
+class StabilityTest:
+    '''
+    Michelsen tangent plane distance stability test
+
+        d[i] = ln(z[i]) + ln(phi[i](z))
+        tm(W) = 1 + sum(W[i]*(ln(W[i]) + ln(phi[i](w)) - d[i] - 1)), w = W/sum(W)
+
+    W (trial phase mole numbers) is found by successive substitution
+        ln(W[i]) = d[i] - ln(phi[i](w))
+    accelerated by the dominant eigenvalue method (GDEM) every STABILITY_GDEM_STEP steps
+
+    the feed is unstable when tm < 0 for a trial phase, the iteration stops at the first
+    negative tm (any W with tm(W) < 0 is a proof of instability)
+
+    phi is a fugacity coefficient (eos) or an activity coefficient (activity model),
+    all trial phases are evaluated in one call of lnPhiFun
+
+    components absent from the feed (z[i] = 0) are removed from the test (w[i] = 0),
+    a trial phase with a non-finite tm is never taken as a proof of stability
+    '''
+
+    def __init__(self, lnPhiFun):
+        '''
+        args:
+            lnPhiFun: ln(phi[i]) of compositions *** array *** (M,N) -> (M,N)
+        '''
+        self.lnPhiFun = lnPhiFun
+
+    def test(self, zi, Wi, tol=STABILITY_TOLERANCE, maxIter=STABILITY_MAX_ITERATION):
+        '''
+        stability test of a feed
+
+        args:
+            zi: feed mole fraction *** array *** (N)
+            Wi: trial phase initial guess *** array *** (T,N)
+
+        return:
+            res:
+                stable: feed state
+                tm: tangent plane distance of the trial phases *** array *** (T)
+                wi: trial phase mole fraction *** array *** (T,N)
+                trivial: trial phase converged to the feed *** array *** (T)
+                iterNo: iteration number
+        '''
+        try:
+            # set
+            zi = np.asarray(zi, dtype=float)
+            zi = zi/np.sum(zi)
+            Wi = np.atleast_2d(np.asarray(Wi, dtype=float))
+
+            # components in the feed
+            _mask = zi > 0
+            if not np.all(_mask):
+                return self.testSubset(_mask, zi, Wi, tol, maxIter)
+
+            lnWi = np.log(Wi)
+            trialNo = lnWi.shape[0]
+
+            # d[i]
+            _lnzi = np.log(zi)
+            di = _lnzi + self.lnPhiFun(zi[None, :])[0]
+
+            # trial phases
+            tm = np.full(trialNo, np.inf)
+            trivial = np.zeros(trialNo, dtype=bool)
+            active = np.ones(trialNo, dtype=bool)
+            # successive substitution step
+            dlnWi = np.zeros(lnWi.shape)
+
+            iterNo = 0
+            while np.any(active) and iterNo < maxIter:
+                iterNo += 1
+                _i = np.flatnonzero(active)
+                _lnW = lnWi[_i]
+                _W = np.exp(_lnW)
+
+                # ln(phi) of the trial phases
+                _wi = _W/np.sum(_W, axis=1, keepdims=True)
+                _lnWNew = di - self.lnPhiFun(_wi)
+
+                # tm
+                tm[_i] = 1 + np.sum(_W*(_lnW - _lnWNew - 1), axis=1)
+
+                # check
+                _trivial = np.max(np.abs(np.log(_wi) - _lnzi), axis=1) < STABILITY_TRIVIAL
+                _conv = np.max(np.abs(_lnWNew - _lnW), axis=1) < tol
+                trivial[_i] = _trivial
+
+                # GDEM (dominant eigenvalue)
+                _dlnW = _lnWNew - _lnW
+                if iterNo % STABILITY_GDEM_STEP == 0:
+                    _d01 = np.sum(dlnWi[_i]*_dlnW, axis=1)
+                    _lambda = np.sum(_dlnW*_dlnW, axis=1) / \
+                        np.where(_d01 == 0, np.inf, _d01)
+                    _gdem = (_lambda > 0) & (_lambda < 1) & ~_conv
+                    _lnWNew[_gdem] += _dlnW[_gdem] * \
+                        (_lambda[_gdem]/(1 - _lambda[_gdem]))[:, None]
+                dlnWi[_i] = _dlnW
+                lnWi[_i] = _lnWNew
+                active[_i[_trivial | _conv]] = False
+
+                # unstable
+                if np.any(tm[_i] < -STABILITY_TM_TOLERANCE):
+                    break
+
+            # trial phase mole fraction
+            _W = np.exp(lnWi)
+            wi = _W/np.sum(_W, axis=1, keepdims=True)
+
+            # res (nan tm: not stable)
+            return {
+                "stable": bool(np.all(np.isfinite(tm) & (trivial | (tm >= -STABILITY_TM_TOLERANCE)))),
+                "tm": tm,
+                "wi": wi,
+                "trivial": trivial,
+                "iterNo": iterNo
+            }
+        except Exception as e:
+            raise Exception("stability test failed!, ", e)
+
+    def testSubset(self, mask, zi, Wi, tol=STABILITY_TOLERANCE, maxIter=STABILITY_MAX_ITERATION):
+        '''
+        stability test of the feed components (z[i] > 0), trial phases are scattered back
+
+        args:
+            mask: components in the feed *** array *** (N)
+        '''
+        _lnPhiFun = self.lnPhiFun
+
+        # ln(phi) of the feed components
+        def lnPhiFun(xi):
+            _xi = np.zeros((xi.shape[0], mask.size))
+            _xi[:, mask] = xi
+            return _lnPhiFun(_xi)[:, mask]
+
+        res = StabilityTest(lnPhiFun).test(zi[mask], Wi[:, mask], tol, maxIter)
+
+        # trial phase mole fraction (N)
+        wi = np.zeros((res['wi'].shape[0], mask.size))
+        wi[:, mask] = res['wi']
+        res['wi'] = wi
+        return res
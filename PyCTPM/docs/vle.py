@@ -5,17 +5,19 @@
 from ast import arg
 from math import exp, log
 import numpy as np
-from scipy import optimize
 # local
-from PyCTPM.core.constants import MODIFIED_RAOULT_MODEL, R_CONST, VAN_LAAR_ACTIVITY_MODEL, WILSON_ACTIVITY_MODEL
-from PyCTPM.docs.dThermo import ModifiedRackettEquation
+from PyCTPM.core.constants import EOS_MODEL, MODIFIED_RAOULT_MODEL, R_CONST, VAN_LAAR_ACTIVITY_MODEL, WILSON_ACTIVITY_MODEL
+from PyCTPM.docs.activityModel import activityModel, MargulesModel
 from PyCTPM.docs.excessproperties import ExcessProperties
-from PyCTPM.docs.eos import eosClass
 from PyCTPM.docs.margules import Margules
 from PyCTPM.docs.activity import ActivityClass
+from PyCTPM.docs.flash import FlashClass
+from PyCTPM.docs.eosFlash import EosFlash
+from PyCTPM.docs.stability import StabilityTest
+from PyCTPM.docs.phaseEnvelope import PhaseEnvelope
 
 
-class VLEClass(ExcessProperties, Margules, ActivityClass):
+class VLEClass(ExcessProperties, Margules, ActivityClass, FlashClass):
     '''
     vapor-liquid equilibrium calculation
     '''
@@ -29,6 +31,7 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         ExcessProperties.__init__(self, pool)
         Margules.__init__(self, pool)
         ActivityClass.__init__(self, pool)
+        FlashClass.__init__(self)
 
     def bubblePressure(self, params, config):
         '''
@@ -78,8 +81,8 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
                 # !check
                 if AcCoModelName == VAN_LAAR_ACTIVITY_MODEL:
                     # ! using eos to calculate activity-model
-                    # set eos class
-                    ai, bi = eosClass.abVDM(self.pool)
+                    # van der Waals constants
+                    ai, bi = self.poolData.aVDW, self.poolData.bVDW
                     # set excess properties class
                     # ExcessPropertiesClass = ExcessProperties(self.pool)
                     # activity coefficient
@@ -93,18 +96,13 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
                 AcCo = np.ones(self.compNo)
 
             # vapor pressure [Pa]
-            VaPe = np.zeros(self.compNo)
-            for i in range(self.compNo):
-                # REVIEW
-                VaPe[i] = self.pool[i].vapor_pressure(T, mode=VaPeCal)
+            VaPe = self.vaporPressureMixture(T, VaPeCal)
 
             # bubble pressure [Pa]
             BuPr = np.sum(AcCo*zi*VaPe)
 
             # vapor mole fraction
-            yi = np.zeros(self.compNo)
-            for i in range(self.compNo):
-                yi[i] = zi[i]*VaPe[i]*AcCo[i]/BuPr
+            yi = zi*VaPe*AcCo/BuPr
 
             # Ki ratio
             Ki = np.multiply(yi, 1/zi)
@@ -208,6 +206,9 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
             # params
             _params = (self.compNo, zi, P, VaPeCal)
             # bubble temperature [K]
+            # import
+            from scipy import optimize
+
             _res0 = optimize.fsolve(self.btFunction, Tg0, args=(_params,))
             # ->
             # REVIEW
@@ -215,15 +216,10 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
 
             # vapor pressure [Pa]
             # at T (Tg)
-            VaPe = np.zeros(self.compNo)
-            for i in range(self.compNo):
-                # REVIEW
-                VaPe[i] = self.pool[i].vapor_pressure(T, VaPeCal)
+            VaPe = self.vaporPressureMixture(T, VaPeCal)
 
             # vapor mole fraction
-            yi = np.zeros(self.compNo)
-            for i in range(self.compNo):
-                yi[i] = zi[i]*VaPe[i]/P
+            yi = zi*VaPe/P
 
             _res = {
                 "T": T,
@@ -249,10 +245,7 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         # calculate vapor-pressure
 
         # vapor pressure [Pa]
-        VaPe = np.zeros(compNo)
-        for i in range(compNo):
-            # REVIEW
-            VaPe[i] = self.pool[i].vapor_pressure(Tg, VaPeCal)
+        VaPe = self.vaporPressureMixture(Tg, VaPeCal)
 
         # bubble pressure [Pa]
         BuPr = np.dot(zi, VaPe)
@@ -301,6 +294,9 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
             # params
             _params = (self.compNo, zi, P, VaPeCal)
             # bubble pressure [Pa]
+            # import
+            from scipy import optimize
+
             _res0 = optimize.fsolve(self.dtFunction, Tg0, args=(_params,))
             # ->
             # REVIEW
@@ -308,15 +304,10 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
 
             # vapor pressure [Pa]
             # at T (Tg)
-            VaPe = np.zeros(self.compNo)
-            for i in range(self.compNo):
-                # REVIEW
-                VaPe[i] = self.pool[i].vapor_pressure(Tg, VaPeCal)
+            VaPe = self.vaporPressureMixture(Tg, VaPeCal)
 
             # vapor mole fraction
-            xi = np.zeros(self.compNo)
-            for i in range(self.compNo):
-                xi[i] = zi[i]*P/VaPe[i]
+            xi = zi*P/VaPe
 
             # res
             return Tg, xi, VaPe
@@ -333,10 +324,7 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         # calculate vapor-pressure
 
         # vapor pressure [Pa]
-        VaPe = np.zeros(compNo)
-        for i in range(compNo):
-            # REVIEW
-            VaPe[i] = self.pool[i].vapor_pressure(Tg, VaPeCal)
+        VaPe = self.vaporPressureMixture(Tg, VaPeCal)
 
         # dew pressure [Pa]
         DePr = np.dot(zi, VaPe)
@@ -349,15 +337,19 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
     def vaporPressureMixture(self, T, mode):
         '''
         calculate mixture vapor-pressure
+
+        args:
+            T: temperature [K]
+            mode: vapor-pressure calculation method
+
+        return:
+            VaPe: vapor-pressure [Pa] *** array *** (N)
         '''
         # vapor pressure [Pa]
-        VaPe = np.zeros(self.compNo)
-        for i in range(self.compNo):
-            # REVIEW
-            VaPe[i] = self.pool[i].vapor_pressure(T, mode)
+        VaPe = self.vaporPressureMixtureBatch(np.ravel(T)[:1], mode)
 
         # res
-        return VaPe
+        return VaPe[0]
 
     def calBubblePressure(self, xi, VaPe):
         '''
@@ -383,9 +375,460 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         # res
         return DePr
 
+    # NOTE
+    # ! batch calculation (M compositions)
+
+    def vaporPressureMixtureBatch(self, T, mode, derivative=False):
+        '''
+        calculate vapor-pressure of all components at many temperatures
+
+        args:
+            T: temperature [K] *** array *** (M)
+            mode: vapor-pressure calculation method
+            derivative: calculate dln(P*)/dT
+                1. polynomial/shortcut: analytic (same pass)
+                2. eos: central difference
+
+        return:
+            VaPe: vapor-pressure [Pa] *** array *** (M, N)
+            dlnVaPe: dln(P*)/dT [1/K] *** array *** (M, N) (derivative=True)
+        '''
+        # set
+        T = np.atleast_1d(np.asarray(T, dtype=float))
+
+        # analytic
+        if mode in ('polynomial', 'shortcut'):
+            _fun = self.poolData.vaporPressure if mode == 'polynomial' else \
+                self.poolData.vaporPressureShortcut
+            # check
+            if derivative is False:
+                return _fun(T)
+            VaPe, dVaPe = _fun(T, True)
+            return VaPe, dVaPe/VaPe
+
+        def _VaPe(_T):
+            # vapor pressure [Pa] (eos, vectorized over temperature)
+            _res = np.zeros((_T.size, self.compNo))
+            for i in range(self.compNo):
+                _res[:, i] = self.pool[i].vapor_pressure(_T, mode)
+            return _res
+
+        VaPe = _VaPe(T)
+
+        # check
+        if derivative is False:
+            return VaPe
+
+        # dln(P*)/dT
+        h = 1e-3
+        dlnVaPe = (np.log(_VaPe(T + h)) - np.log(_VaPe(T - h)))/(2*h)
+
+        # res
+        return VaPe, dlnVaPe
+
+    def activityCoefficientBatch(self, xi, T, model, AcCoModel):
+        '''
+        calculate activity coefficient of many liquid compositions
+
+        args:
+            xi: liquid mole fraction *** array *** (M, N)
+            T: temperature [K] *** array *** (M)
+            model: vle model (raoult, modified-raoult)
+            AcCoModel: activity coefficient model
+                1. name: van-laar, wilson, nrtl, margules
+                2. params: model parameters (wilson: aij, nrtl: {aij, gij}, margules: Aij)
+
+        return:
+            AcCo: activity coefficient *** array *** (M, N)
+        '''
+        # check
+        if model != MODIFIED_RAOULT_MODEL:
+            # equals unity for ideal solution
+            return np.ones(xi.shape)
+
+        # set
+        AcCoModel = AcCoModel or {}
+        AcCoModelName = AcCoModel.get('name', VAN_LAAR_ACTIVITY_MODEL)
+        AcCoModelParameters = AcCoModel.get('params', 0)
+
+        # activity coefficient (all compositions at once)
+        AcCo = activityModel(AcCoModelName, AcCoModelParameters,
+                             self.poolData).activityCoefficient(xi, T)
+
+        # res
+        return AcCo
+
+    def bubblePressureBatch(self, params, config):
+        '''
+        bubble pressure calculation (many compositions)
+
+        args:
+            params:
+                1. zi: liquid mole fraction *** array *** (M, N)
+                2. T: temperature [K] (scalar or M)
+            config:
+                1. VaPeCal: vapor pressure calculation method
+                2. model: vle model
+                3. AcCoModel: activity coefficient model
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo *** arrays ***
+        '''
+        try:
+            # params
+            zi = np.atleast_2d(np.asarray(params.get('zi', []), dtype=float))
+            M = zi.shape[0]
+            T = np.broadcast_to(np.asarray(
+                params.get('T', 0), dtype=float), (M,)).copy()
+
+            # config
+            VaPeCal = config.get('VaPeCal', 'polynomial')
+            model = config.get('model', 'raoult')
+            AcCoModel = config.get('AcCoModel', {})
+
+            # vapor pressure [Pa]
+            VaPe = self.vaporPressureMixtureBatch(T, VaPeCal)
+            # activity coefficient
+            AcCo = self.activityCoefficientBatch(zi, T, model, AcCoModel)
+
+            # bubble pressure [Pa]
+            _yiP = AcCo*zi*VaPe
+            BuPr = np.sum(_yiP, axis=1)
+
+            # vapor mole fraction
+            yi = _yiP/BuPr[:, None]
+
+            # res
+            return {
+                "P": BuPr,
+                "T": T,
+                "xi": zi,
+                "yi": yi,
+                "Ki": AcCo*VaPe/BuPr[:, None],
+                "VaPe": VaPe,
+                "AcCo": AcCo
+            }
+        except Exception as e:
+            raise Exception("bubble pressure calculation failed!, ", e)
+
+    def dewPressureBatch(self, params, config):
+        '''
+        dew pressure calculation (many compositions)
+
+        args:
+            params:
+                1. zi: vapor mole fraction *** array *** (M, N)
+                2. T: temperature [K] (scalar or M)
+            config:
+                1. VaPeCal: vapor pressure calculation method
+                2. model: vle model
+                3. AcCoModel: activity coefficient model
+                4. tol: activity coefficient tolerance
+                5. maxIter: max iteration
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo *** arrays ***
+        '''
+        try:
+            # params
+            zi = np.atleast_2d(np.asarray(params.get('zi', []), dtype=float))
+            M = zi.shape[0]
+            T = np.broadcast_to(np.asarray(
+                params.get('T', 0), dtype=float), (M,)).copy()
+
+            # config
+            VaPeCal = config.get('VaPeCal', 'polynomial')
+            model = config.get('model', 'raoult')
+            AcCoModel = config.get('AcCoModel', {})
+            tol = config.get('tol', 1e-10)
+            maxIter = config.get('maxIter', 100)
+
+            # vapor pressure [Pa]
+            VaPe = self.vaporPressureMixtureBatch(T, VaPeCal)
+
+            # activity coefficient (liquid composition is unknown)
+            AcCo = np.ones(zi.shape)
+            for _ in range(maxIter):
+                # dew pressure [Pa]
+                _xiP = zi/(AcCo*VaPe)
+                DePr = 1/np.sum(_xiP, axis=1)
+                # liquid mole fraction
+                xi = _xiP*DePr[:, None]
+
+                # check
+                if model != MODIFIED_RAOULT_MODEL:
+                    break
+
+                # update activity coefficient
+                _AcCo = self.activityCoefficientBatch(xi, T, model, AcCoModel)
+                _err = np.max(np.abs(_AcCo - AcCo))
+                AcCo = _AcCo
+                if _err <= tol:
+                    break
+
+            # res
+            return {
+                "P": DePr,
+                "T": T,
+                "xi": xi,
+                "yi": zi,
+                "Ki": AcCo*VaPe/DePr[:, None],
+                "VaPe": VaPe,
+                "AcCo": AcCo
+            }
+        except Exception as e:
+            raise Exception("dew pressure calculation failed!, ", e)
+
+    def saturationTemperatureBatch(self, resFun, T0, tol=1e-10, maxIter=100):
+        '''
+        solve g(T) = 0 for many rows, g is increasing in T
+
+        newton steps in 1/T (ln P* is nearly linear in 1/T), a step is limited to
+        [T/1.5, 2T] and replaced by bisection if it leaves the bracket [T(g<0), T(g>0)]
+
+        args:
+            resFun: fun(T, rows) -> g, dg/dT *** arrays ***
+            T0: initial guess [K] *** array *** (M)
+
+        return:
+            T: temperature [K] *** array *** (M)
+            iterNo: iteration number
+        '''
+        # set
+        T = np.array(T0, dtype=float)
+        M = T.size
+        # bracket
+        Tlo = np.zeros(M)
+        Thi = np.full(M, np.inf)
+
+        active = np.ones(M, dtype=bool)
+        iterNo = 0
+        while np.any(active) and iterNo < maxIter:
+            iterNo += 1
+            _i = np.flatnonzero(active)
+            _T = T[_i]
+            g, dg = resFun(_T, _i)
+
+            # non-finite residual: step back
+            _bad = ~np.isfinite(g) | ~np.isfinite(dg)
+            g = np.where(_bad, 0.0, g)
+
+            # bracket
+            Tlo[_i] = np.where(~_bad & (g < 0), _T, Tlo[_i])
+            Thi[_i] = np.where(~_bad & (g > 0), _T, Thi[_i])
+            _lo = Tlo[_i]
+            _hi = Thi[_i]
+
+            # newton step in u = 1/T
+            u = 1/_T
+            dgdu = -dg*_T*_T
+            du = np.where(dgdu != 0, -g/np.where(dgdu == 0, 1.0, dgdu), 0.0)
+            du = np.clip(du, -u/3, u/2)
+            _TNew = 1/(u + du)
+
+            # bisection
+            _out = ((_TNew <= _lo) | (_TNew >= _hi)) & (_lo > 0) & np.isfinite(_hi)
+            _TNew = np.where(_out, 0.5*(_lo + _hi), _TNew)
+            # step back (non-finite residual)
+            _TNew = np.where(_bad, np.where(_lo > 0, 0.5*(_lo + _T), 0.8*_T), _TNew)
+
+            # convergence
+            _conv = ~_bad & ((np.abs(g) <= tol) |
+                             (np.abs(_TNew - _T) <= tol*_T))
+            T[_i] = np.where(_conv & (np.abs(g) <= tol), _T, _TNew)
+            active[_i[_conv]] = False
+
+        # res
+        return T, iterNo
+
+    def bubbleTemperatureBatch(self, params, config):
+        '''
+        bubble temperature calculation (many compositions)
+
+        residual:
+            g(T) = ln(sum(AcCo[i]*x[i]*P*[i](T))/P)
+
+        args:
+            params:
+                1. zi: liquid mole fraction *** array *** (M, N)
+                2. P: pressure [Pa] (scalar or M)
+            config:
+                1. Tg0: initial guess temperature [K] (scalar or M)
+                2. VaPeCal: vapor pressure calculation method
+                3. model: vle model
+                4. AcCoModel: activity coefficient model
+                5. tol: tolerance
+                6. maxIter: max iteration
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo, iterNo *** arrays ***
+        '''
+        try:
+            # params
+            zi = np.atleast_2d(np.asarray(params.get('zi', []), dtype=float))
+            M = zi.shape[0]
+            P = np.broadcast_to(np.asarray(
+                params.get('P', 0), dtype=float), (M,)).copy()
+
+            # config
+            Tg0 = config.get('Tg0', 350)
+            VaPeCal = config.get('VaPeCal', 'polynomial')
+            model = config.get('model', 'raoult')
+            AcCoModel = config.get('AcCoModel', {})
+            tol = config.get('tol', 1e-10)
+            maxIter = config.get('maxIter', 100)
+
+            # initial guess
+            T = np.broadcast_to(np.asarray(Tg0, dtype=float), (M,)).copy()
+            # activity coefficient
+            AcCo = np.ones(zi.shape)
+
+            iterNo = 0
+            for _ in range(maxIter):
+                # residual
+                def resFun(_T, _i):
+                    _VaPe, _dlnVaPe = self.vaporPressureMixtureBatch(
+                        _T, VaPeCal, derivative=True)
+                    _s = AcCo[_i]*zi[_i]*_VaPe
+                    _S = np.sum(_s, axis=1)
+                    g = np.log(_S/P[_i])
+                    dg = np.sum(_s*_dlnVaPe, axis=1)/_S
+                    return g, dg
+
+                # bubble temperature [K]
+                T, _iterNo = self.saturationTemperatureBatch(
+                    resFun, T, tol, maxIter)
+                iterNo += _iterNo
+
+                # check
+                if model != MODIFIED_RAOULT_MODEL:
+                    break
+
+                # update activity coefficient
+                _AcCo = self.activityCoefficientBatch(zi, T, model, AcCoModel)
+                _err = np.max(np.abs(_AcCo - AcCo))
+                AcCo = _AcCo
+                if _err <= tol:
+                    break
+
+            # vapor pressure [Pa]
+            VaPe = self.vaporPressureMixtureBatch(T, VaPeCal)
+            # vapor mole fraction
+            Ki = AcCo*VaPe/P[:, None]
+            yi = Ki*zi
+
+            # res
+            return {
+                "P": P,
+                "T": T,
+                "xi": zi,
+                "yi": yi,
+                "Ki": Ki,
+                "VaPe": VaPe,
+                "AcCo": AcCo,
+                "iterNo": iterNo
+            }
+        except Exception as e:
+            raise Exception("bubble temperature calculation failed!, ", e)
+
+    def dewTemperatureBatch(self, params, config):
+        '''
+        dew temperature calculation (many compositions)
+
+        residual:
+            g(T) = -ln(P*sum(y[i]/(AcCo[i]*P*[i](T))))
+
+        args:
+            params:
+                1. zi: vapor mole fraction *** array *** (M, N)
+                2. P: pressure [Pa] (scalar or M)
+            config:
+                1. Tg0: initial guess temperature [K] (scalar or M)
+                2. VaPeCal: vapor pressure calculation method
+                3. model: vle model
+                4. AcCoModel: activity coefficient model
+                5. tol: tolerance
+                6. maxIter: max iteration
+
+        return:
+            res: P, T, xi, yi, Ki, VaPe, AcCo, iterNo *** arrays ***
+        '''
+        try:
+            # params
+            zi = np.atleast_2d(np.asarray(params.get('zi', []), dtype=float))
+            M = zi.shape[0]
+            P = np.broadcast_to(np.asarray(
+                params.get('P', 0), dtype=float), (M,)).copy()
+
+            # config
+            Tg0 = config.get('Tg0', 350)
+            VaPeCal = config.get('VaPeCal', 'polynomial')
+            model = config.get('model', 'raoult')
+            AcCoModel = config.get('AcCoModel', {})
+            tol = config.get('tol', 1e-10)
+            maxIter = config.get('maxIter', 100)
+
+            # initial guess
+            T = np.broadcast_to(np.asarray(Tg0, dtype=float), (M,)).copy()
+            # activity coefficient
+            AcCo = np.ones(zi.shape)
+
+            iterNo = 0
+            for _ in range(maxIter):
+                # residual
+                def resFun(_T, _i):
+                    _VaPe, _dlnVaPe = self.vaporPressureMixtureBatch(
+                        _T, VaPeCal, derivative=True)
+                    _s = zi[_i]/(AcCo[_i]*_VaPe)
+                    _S = np.sum(_s, axis=1)
+                    g = -np.log(P[_i]*_S)
+                    dg = np.sum(_s*_dlnVaPe, axis=1)/_S
+                    return g, dg
+
+                # dew temperature [K]
+                T, _iterNo = self.saturationTemperatureBatch(
+                    resFun, T, tol, maxIter)
+                iterNo += _iterNo
+
+                # liquid mole fraction
+                VaPe = self.vaporPressureMixtureBatch(T, VaPeCal)
+                xi = zi*P[:, None]/(AcCo*VaPe)
+
+                # check
+                if model != MODIFIED_RAOULT_MODEL:
+                    break
+
+                # update activity coefficient
+                xi = xi/np.sum(xi, axis=1, keepdims=True)
+                _AcCo = self.activityCoefficientBatch(xi, T, model, AcCoModel)
+                _err = np.max(np.abs(_AcCo - AcCo))
+                AcCo = _AcCo
+                if _err <= tol:
+                    break
+
+            # vapor pressure [Pa]
+            VaPe = self.vaporPressureMixtureBatch(T, VaPeCal)
+            # liquid mole fraction
+            Ki = AcCo*VaPe/P[:, None]
+            xi = zi/Ki
+
+            # res
+            return {
+                "P": P,
+                "T": T,
+                "xi": xi,
+                "yi": zi,
+                "Ki": Ki,
+                "VaPe": VaPe,
+                "AcCo": AcCo,
+                "iterNo": iterNo
+            }
+        except Exception as e:
+            raise Exception("dew temperature calculation failed!, ", e)
+
     def flashIsothermal(self, params, config):
         '''
-        isothermal flash calculation
+        isothermal flash calculation (Rachford-Rice)
 
         knowns:
             1. zi
@@ -397,6 +840,10 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
             2. yi
             3. V
             4. L
+
+        config:
+            guess_V_F_ratio: V/F initial guess
+            negative_flash: allow V/F outside [0, 1]
         '''
         try:
             # params
@@ -408,29 +855,170 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
             # config
             VaPeCal = config.get('VaPeCal', 'polynomial')
             V_F_ratio_g0 = config.get('guess_V_F_ratio', 0.5)
+            negativeFlash = config.get('negative_flash', False)
 
             # ki ratio (Raoult's law)
-            Ki = VaPri/P_flash
+            Ki = np.array(VaPri)/P_flash
+
+            # V/F, liquid/vapor mole fraction
+            V_F_ratio, xi, yi, _ = self.rachfordRice(
+                zi, Ki, negativeFlash=negativeFlash, guess=V_F_ratio_g0)
 
+            # L/F
+            L_F_ratio = 1 - V_F_ratio
+
+            # res
+            return V_F_ratio, L_F_ratio, xi, yi
+
+        except Exception as e:
+            raise Exception("flash isothermal failed!, ", e)
+
+    def eosFlashSet(self):
+        '''
+        eos flash of the pool (a[i,j] is kept for the last temperature)
+        '''
+        if getattr(self, '_eosFlash', None) is None:
+            self._eosFlash = EosFlash(self.poolData.eosConstants)
+        return self._eosFlash
+
+    def stabilityTest(self, params, config):
+        '''
+        tangent plane distance stability test of a feed
+
+        knowns:
+            1. zi
+            2. P
+            3. T
+
+        config:
+            model:
+                1. eos: vapor/liquid stability (PR), trial phases from Wilson K
+                2. modified-raoult: liquid/liquid stability (activity model), pure-like trial phases
+            AcCoModel: activity coefficient model {name, params}
+
+        return:
+            res:
+                stable: feed state
+                tm: tangent plane distance of the trial phases
+                wi: trial phase mole fraction
+                Ki: K ratio initial estimate (unstable feed) or None
+        '''
+        try:
             # params
-            _params = (self.compNo, zi, Ki)
-            # V/F
-            _res0 = optimize.fsolve(
-                self.fitFunction, V_F_ratio_g0, args=(_params,))
-            # ->
-            V_F_ratio = _res0[0]
+            zi = np.asarray(params.get('zi', []), dtype=float)
+            zi = zi/np.sum(zi)
+            P = params.get('P', 0)
+            T = params.get('T', 0)
 
-            # liquid/vapor mole fraction
-            xi, yi = self.xyFlash(self.compNo, V_F_ratio, zi, Ki)
+            # config
+            model = config.get('model', EOS_MODEL)
+
+            # check
+            if model == EOS_MODEL:
+                return self.eosFlashSet().stability(zi, P, T)
+            elif model == MODIFIED_RAOULT_MODEL:
+                # activity model
+                AcCoModel = config.get('AcCoModel', None) or {}
+                _activityModel = activityModel(AcCoModel.get('name', VAN_LAAR_ACTIVITY_MODEL),
+                                               AcCoModel.get('params', 0), self.poolData)
+
+                # ln(gamma)
+                def lnPhiFun(xi):
+                    return np.log(_activityModel.activityCoefficient(xi, T))
+
+                # trial phases (pure-like, components in the feed)
+                _m = zi > 0
+                Wi = (0.99*np.eye(self.compNo) + 0.01*zi)[_m]
+                res = StabilityTest(lnPhiFun).test(zi, Wi)
+
+                # K ratio (trial phase with the lowest tm), 1 for components absent from the feed
+                res['Ki'] = None
+                if not res['stable'] and np.any(np.isfinite(res['tm'])):
+                    Ki = np.ones(self.compNo)
+                    Ki[_m] = res['wi'][np.nanargmin(res['tm'])][_m]/zi[_m]
+                    res['Ki'] = Ki
+                return res
+            else:
+                raise Exception(f"model {model} is not defined!")
+
+        except Exception as e:
+            raise Exception("stability test failed!, ", e)
+
+    def phaseEnvelope(self, params, config):
+        '''
+        phase envelope (bubble/dew curves) of a feed using the PR eos
+
+        knowns:
+            1. zi
+
+        config:
+            P0: pressure of the first bubble point [Pa]
+            maxPoints: max number of points
+
+        return:
+            res: T, P, Ki, branch, critical, cricondenbar, cricondentherm, complete, iterations
+        '''
+        try:
+            # params
+            zi = np.asarray(params.get('zi', []), dtype=float)
+
+            # config
+            P0 = config.get('P0', 1e5)
+            maxPoints = config.get('maxPoints', 500)
+
+            # res
+            return PhaseEnvelope(self.poolData.eosConstants).trace(zi, P0, maxPoints)
+        except Exception as e:
+            raise Exception("phase envelope failed!, ", e)
+
+    def flashIsothermalEOS(self, params, config):
+        '''
+        isothermal flash calculation using the PR eos for both phases (phi-phi)
+
+            K[i] = phi[i,L]/phi[i,V]
+
+        knowns:
+            1. zi
+            2. P
+            3. T
+
+        config:
+            guess_V_F_ratio: V/F initial guess
+
+        return:
+            V_F_ratio, L_F_ratio, xi, yi
+            res: eos flash result (two-phase, converged, Ki, ZL, ZV, iterations)
+        '''
+        try:
+            # params
+            zi = params.get('zi', [])
+            P_flash = params.get('P_flash', 0)
+            T_flash = params.get('T_flash', 0)
+
+            # config
+            V_F_ratio_g0 = config.get('guess_V_F_ratio', 0.5)
+
+            # cal
+            res = self.eosFlashSet().flash(zi, P_flash, T_flash, V_F_ratio_g0)
+
+            # check
+            if not res['converged']:
+                raise Exception(
+                    f"flash did not converge (max|ln(f[V]/f[L])|: {res['error']})")
+
+            # V/F, liquid/vapor mole fraction
+            V_F_ratio = res['V_F_ratio']
+            xi = res['xi']
+            yi = res['yi']
 
             # L/F
             L_F_ratio = 1 - V_F_ratio
 
             # res
-            return V_F_ratio, L_F_ratio, xi, yi
+            return V_F_ratio, L_F_ratio, xi, yi, res
 
         except Exception as e:
-            raise Exception("flash isothermal failed!")
+            raise Exception("eos flash isothermal failed!, ", e)
 
     def fitFunction(self, x, params):
         '''
@@ -448,9 +1036,7 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         # params
         compNo, zi, Ki = params
 
-        fi = np.zeros(compNo)
-        for i in range(compNo):
-            fi[i] = (zi[i]*(1-Ki[i]))/(1+(V_F_ratio)*(Ki[i]-1))
+        fi = (zi*(1-Ki))/(1+(V_F_ratio)*(Ki-1))
 
         f = np.sum(fi)
 
@@ -460,12 +1046,8 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         '''
         calculate liquid/vapor mole fraction
         '''
-        xi = np.zeros(compNo)
-        yi = np.zeros(compNo)
-
-        for i in range(compNo):
-            xi[i] = (zi[i])/(1+(V_F_ratio)*(Ki[i]-1))
-            yi[i] = Ki[i]*xi[i]
+        xi = np.asarray(zi)/(1+(V_F_ratio)*(np.asarray(Ki)-1))
+        yi = Ki*xi
 
         # res
         return xi, yi
@@ -533,6 +1115,9 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
             # _res0 = optimize.fsolve(
             #     self.fitSystemFunction, _var0, args=(_params,))
 
+            # import
+            from scipy import optimize
+
             _res0 = optimize.least_squares(
                 self.fitSystemFunction, _var0, args=(_params,), bounds=bounds)
 
@@ -633,19 +1218,8 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         # params
         xi_exp, ExMoGiEn_exp, parameterNo = params
 
-        # number of experimental data
-        expDataNo = xi_exp.shape[0]
-
-        # calculate excess molar gibbs energy
-        ExMoGiEn_cal = np.zeros(expDataNo)
-        for i in range(expDataNo):
-            # xi
-            _xi = xi_exp[i, :]
-
-            # calculate activity coefficient
-            _AcCo = self.Margules_activity_coefficient(_xi, x)
-
-            ExMoGiEn_cal[i] = self.ExcessMolarGibbsFreeEnergy(_xi, _AcCo)
+        # calculate excess molar gibbs energy (all experimental points)
+        ExMoGiEn_cal = MargulesModel(x).excessGibbs(xi_exp)
 
         # obj function
         return ExMoGiEn_exp - ExMoGiEn_cal
@@ -673,40 +1247,76 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
             A0 = 0
             raise Exception("check A0")
 
+        # import
+        from scipy import optimize
+
         res = optimize.least_squares(
             self.MargulesParameterObjectiveFunction, A0, args=(params,))
 
         return res
 
+    def WilsonParameterMatrix(self, x):
+        '''
+        set Aij (A[i,i] = 1) from the unknown vector (row-major, i != j)
+
+        return:
+            Aij: temperature-dependent parameters *** array *** (N, N)
+            I, J: indices of the unknowns
+        '''
+        # off-diagonal indices
+        I, J = np.nonzero(~np.eye(self.compNo, dtype=bool))
+        Aij = np.ones((self.compNo, self.compNo))
+        Aij[I, J] = x
+
+        # res
+        return Aij, I, J
+
     def WilsonParameterObjectiveFunction(self, x, params):
         '''
-        Wilson function
+        Wilson function (vectorized over experimental data)
+
+        G(E)/RT = -sum(x[i]*ln(S[i])), S[i] = sum(x[j]*A[i,j])
 
             args:
                 x: Aij *** array ***
                 params:
+                    1. xi_exp: liquid mole fraction *** array *** (M, N)
+                    2. ExMoGiEn_exp: excess molar gibbs energy (G(E)/RT) *** array *** (M)
         '''
         # params
         xi_exp, ExMoGiEn_exp = params
+        xi_exp = np.asarray(xi_exp, dtype=float)
 
-        # number of experimental data
-        expDataNo = xi_exp.shape[0]
+        # parameters
+        Aij, _, _ = self.WilsonParameterMatrix(x)
 
         # calculate excess molar gibbs energy
-        ExMoGiEn_cal = np.zeros(expDataNo)
-        for i in range(expDataNo):
-            # xi
-            _xi = xi_exp[i, :]
-
-            # calculate activity coefficient
-            _AcCo = self.wilson_activity_coefficient_parameter_estimation(
-                _xi, x)
-
-            ExMoGiEn_cal[i] = self.ExcessMolarGibbsFreeEnergy(_xi, _AcCo)
+        S = xi_exp @ Aij.T
+        ExMoGiEn_cal = -np.sum(xi_exp*np.log(S), axis=1)
 
         # obj function
         return ExMoGiEn_exp - ExMoGiEn_cal
 
+    def WilsonParameterJacobian(self, x, params):
+        '''
+        jacobian of WilsonParameterObjectiveFunction
+
+        d(res)/dA[i,j] = x[i]*x[j]/S[i]
+
+        return:
+            jac: *** array *** (M, unknownNo)
+        '''
+        # params
+        xi_exp, _ = params
+        xi_exp = np.asarray(xi_exp, dtype=float)
+
+        # parameters
+        Aij, I, J = self.WilsonParameterMatrix(x)
+        S = xi_exp @ Aij.T
+
+        # res
+        return xi_exp[:, I]*xi_exp[:, J]/S[:, I]
+
     def WilsonTemperatureIndependentParametersFunction(self, x, params):
         '''
         find temperature-independent parameters (alpha)
@@ -763,28 +1373,22 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
         # ! check
         xi_exp, ExMoGiEn, T = params
 
-        # vars
-        MoVoi = np.zeros(self.compNo)
-
         # molar volume [m^3/mol]
-        for i in range(self.compNo):
-            _comp = self.components[i]
-            _Pc = float(_comp.Pc)*1e5
-            _Tc = _comp.Tc
-            _w = _comp.w
-            MoVoi[i] = ModifiedRackettEquation(T, _Pc, _Tc, _w)
+        MoVoi = self.poolData.molarVolumeRackett(T)[0]
 
         #! least-square function for Aij
         fun1 = self.WilsonParameterObjectiveFunction
 
-        # initial guess (number of unknown parameters)
-        A0 = 0.1*np.ones(self.compNo)
+        # number of unknown parameters (A[i,j], i != j)
+        unknownNo = self.compNo*(self.compNo - 1)
+
+        # initial guess
+        A0 = 0.1*np.ones(unknownNo)
 
         # params
         params1 = (xi_exp, ExMoGiEn)
 
         # bounds
-        unknownNo = self.compNo
         bU = []
         bL = []
         bounds = []
@@ -800,28 +1404,23 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
 
         bounds = [bL, bU]
 
-        res0 = optimize.least_squares(
-            fun1, A0, args=(params1,), bounds=bounds)
+        # import
+        from scipy import optimize
 
-        # temperature-dependent parameters
-        Aij = np.ones((self.compNo, self.compNo))
+        res0 = optimize.least_squares(
+            fun1, A0, jac=self.WilsonParameterJacobian, args=(params1,), bounds=bounds)
 
         # * check
         if res0.success is True:
-            X = res0.x
-            k = 0
-            for i in range(self.compNo):
-                for j in range(self.compNo):
-                    if i != j:
-                        Aij[i, j] = X[k]
-                        k += 1
+            # temperature-dependent parameters
+            Aij, _, _ = self.WilsonParameterMatrix(res0.x)
         else:
             return []
 
         #! solve nonlinear equation for alpha_ij
         fun2 = self.WilsonTemperatureIndependentParametersFunction
         # initial guess
-        alpha0_ij = 0.1*np.ones(self.compNo)
+        alpha0_ij = 0.1*np.ones(unknownNo)
         # params
         params2 = (MoVoi, Aij, T)
         res = optimize.fsolve(fun2, alpha0_ij, args=(params2,), )
@@ -839,53 +1438,100 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
 
 # ! NRTL
 
+    def NRTLParameterMatrix(self, x):
+        '''
+        set taij (ta[i,i] = 0) and aij (a[i,j] = a[j,i]) from the unknown vector
+
+        the unknowns are:
+            1. taij (row-major, i != j)
+            2. aij (upper triangle, i < j)
+
+        return:
+            taij, aij: *** array *** (N, N)
+            I, J: taij indices
+            P, Q: aij indices
+        '''
+        # indices
+        I, J = np.nonzero(~np.eye(self.compNo, dtype=bool))
+        P, Q = np.triu_indices(self.compNo, 1)
+        taijNo = I.size
+
+        # temperature-dependent parameters
+        taij = np.zeros((self.compNo, self.compNo))
+        taij[I, J] = x[:taijNo]
+
+        # non-randomness parameters
+        aij = np.zeros((self.compNo, self.compNo))
+        aij[P, Q] = x[taijNo:taijNo+P.size]
+        aij[Q, P] = x[taijNo:taijNo+P.size]
+
+        # res
+        return taij, aij, (I, J), (P, Q)
+
     def NRTLParameterObjectiveFunction(self, x, params):
         '''
-        Non-random two-liquid model (NRTL) function
+        Non-random two-liquid model (NRTL) function (vectorized over experimental data)
+
+        G(E)/RT = sum(x[i]*N[i]/D[i])
+            N[i] = sum(x[j]*ta[j,i]*G[j,i])
+            D[i] = sum(x[j]*G[j,i])
+            G[i,j] = exp(-a[i,j]*ta[i,j])
 
             args:
                 x: parameters *** array ***
                 params:
+                    1. xi_exp: liquid mole fraction *** array *** (M, N)
+                    2. ExMoGiEn_exp: excess molar gibbs energy (G(E)/RT) *** array *** (M)
         '''
         # params
         xi_exp, ExMoGiEn_exp = params
+        xi_exp = np.asarray(xi_exp, dtype=float)
 
         # parameters
-        k = 0
-        # temperature-dependent parameters
-        taij = np.zeros((self.compNo, self.compNo))
-        for i in range(self.compNo):
-            for j in range(self.compNo):
-                if j != i:
-                    taij[i, j] = x[k]
-                    k += 1
+        taij, aij, _, _ = self.NRTLParameterMatrix(x)
+        Gij = np.exp(-1*aij*taij)
 
-        # non-randomness parameters
-        aij = np.zeros((self.compNo, self.compNo))
-        for i in range(self.compNo):
-            for j in range(self.compNo-i):
-                if i != j+i:
-                    aij[i, j+i] = x[k]
-                    aij[j+i, i] = x[k]
-                    k += 1
+        # calculate excess molar gibbs energy
+        N = xi_exp @ (taij*Gij)
+        D = xi_exp @ Gij
+        ExMoGiEn_cal = np.sum(xi_exp*N/D, axis=1)
+
+        # obj function
+        return ExMoGiEn_exp - ExMoGiEn_cal
 
-        # number of experimental data
-        expDataNo = xi_exp.shape[0]
+    def NRTLParameterJacobian(self, x, params):
+        '''
+        jacobian of NRTLParameterObjectiveFunction
 
-        # calculate excess molar gibbs energy
-        ExMoGiEn_cal = np.zeros(expDataNo)
-        for i in range(expDataNo):
-            # xi
-            _xi = xi_exp[i, :]
+        d(G(E)/RT)/d(ta[i,j]) = x[i]*x[j]*G[i,j]*((1 - a[i,j]*ta[i,j])/D[j] + a[i,j]*N[j]/D[j]^2)
+        d(G(E)/RT)/d(a[i,j]) = t(i,j) + t(j,i), t(i,j) = x[i]*x[j]*ta[i,j]*G[i,j]*(N[j]/D[j]^2 - ta[i,j]/D[j])
+
+        return:
+            jac: *** array *** (M, unknownNo)
+        '''
+        # params
+        xi_exp, _ = params
+        xi_exp = np.asarray(xi_exp, dtype=float)
 
-            # calculate activity coefficient
-            _AcCo = self.NRTL_activity_coefficient_parameter_estimation(
-                _xi, taij, aij)
+        # parameters
+        taij, aij, (I, J), (P, Q) = self.NRTLParameterMatrix(x)
+        Gij = np.exp(-1*aij*taij)
+        N = xi_exp @ (taij*Gij)
+        D = xi_exp @ Gij
+        _ND2 = N/np.power(D, 2)
 
-            ExMoGiEn_cal[i] = self.ExcessMolarGibbsFreeEnergy(_xi, _AcCo)
+        # taij
+        _dTa = xi_exp[:, I]*xi_exp[:, J]*Gij[I, J] * \
+            ((1 - aij[I, J]*taij[I, J])/D[:, J] + aij[I, J]*_ND2[:, J])
 
-        # obj function
-        return ExMoGiEn_exp - ExMoGiEn_cal
+        # aij (symmetric)
+        def _t(i, j):
+            return xi_exp[:, i]*xi_exp[:, j]*taij[i, j]*Gij[i, j] * \
+                (_ND2[:, j] - taij[i, j]/D[:, j])
+        _dA = _t(P, Q) + _t(Q, P)
+
+        # res (res = exp - cal)
+        return -1*np.hstack([_dTa, _dA])
 
     def NRTLTemperatureIndependentParametersFunction(self, x, params):
         '''
@@ -996,33 +1642,16 @@ class VLEClass(ExcessProperties, Margules, ActivityClass):
 
         bounds = [bL, bU]
 
+        # import
+        from scipy import optimize
+
         res0 = optimize.least_squares(
-            fun1, A0, args=(params1,), bounds=bounds)
+            fun1, A0, jac=self.NRTLParameterJacobian, args=(params1,), bounds=bounds)
 
         #! optimal NRTL parameters
-        # temperature-dependent parameters
-        taij = np.zeros((self.compNo, self.compNo))
-        # non-randomness parameters
-        aij = np.zeros((self.compNo, self.compNo))
-
         if res0.success is True:
-            X = res0.x
-
-            # parameters
-            k = 0
-            # taij
-            for i in range(self.compNo):
-                for j in range(self.compNo):
-                    if j != i:
-                        taij[i, j] = X[k]
-                        k += 1
-            # aij
-            for i in range(self.compNo):
-                for j in range(self.compNo-i):
-                    if i != j+i:
-                        aij[i, j+i] = X[k]
-                        aij[j+i, i] = X[k]
-                        k += 1
+            # temperature-dependent/non-randomness parameters
+            taij, aij, _, _ = self.NRTLParameterMatrix(res0.x)
         else:
             return []
 
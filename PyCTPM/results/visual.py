@@ -4,7 +4,6 @@
 # packages/modules
 from typing import List
 import numpy as np
-from matplotlib import pyplot as plt
 
 
 class Visual():
@@ -18,6 +17,8 @@ class Visual():
         y: y point list
         type: plot type 
         """
+        # import
+        from matplotlib import pyplot as plt
 
         # plot default
         plt.plot(x, y)
@@ -72,6 +73,9 @@ class Visual():
         yLabel: y axis name
         title: plot title
         """
+        # import
+        from matplotlib import pyplot as plt
+
         # check data type
         if isinstance(data, List):
             lineNo = range(len(data))
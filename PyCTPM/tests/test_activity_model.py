@@ -0,0 +1,67 @@
+# ACTIVITY COEFFICIENT MODELS (BATCH)
+# -----------------------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM import component
+from PyCTPM.docs.pool import Pool
+from PyCTPM.docs.activityModel import activityModel, ActivityModel, MargulesModel
+
+# component list
+comp1 = component("benzene")
+comp2 = component("toluene")
+comp3 = component("ethylbenzene")
+compList = [comp1, comp2, comp3]
+
+# pool
+pool1 = Pool(compList)
+poolData = pool1.pool_data
+
+# liquid mole fraction (M, N)
+xi = np.array([[0.2, 0.3, 0.5], [0.4, 0.4, 0.2], [0.6, 0.1, 0.3]])
+# temperature [K]
+T = 350
+
+# van laar (van der Waals constants)
+model = activityModel('van-laar', poolData=poolData)
+AcCo, ExMoGiEn = model.calculate(xi, T)
+print("van-laar gamma: ", AcCo)
+print("van-laar G(E)/RT: ", ExMoGiEn)
+
+# wilson
+aij = np.array([[0, 300, 500], [-100, 0, 200], [400, 100, 0]])
+model = activityModel('wilson', aij, poolData)
+AcCo, ExMoGiEn = model.calculate(xi, T)
+print("wilson gamma: ", AcCo)
+print("wilson G(E)/RT: ", ExMoGiEn)
+# check (one composition)
+print("wilson gamma (single): ", pool1.Wilson_activity_coefficient(xi[0], T, aij))
+
+# nrtl
+params = {"aij": np.full((3, 3), 0.3), "gij": np.array(
+    [[0, 800, 1200], [-200, 0, 500], [900, 300, 0]])}
+model = activityModel('nrtl', params, poolData)
+# temperature for each composition (M)
+AcCo, ExMoGiEn = model.calculate(xi, np.array([340, 350, 360]))
+print("nrtl gamma: ", AcCo)
+print("nrtl G(E)/RT: ", ExMoGiEn)
+
+# margules (binary system)
+x1 = np.linspace(0.1, 0.9, 5)
+AcCo, ExMoGiEn = MargulesModel([0.7, 1.3]).calculate(
+    np.stack([x1, 1 - x1], axis=1))
+print("margules gamma: ", AcCo)
+print("margules G(E)/RT: ", ExMoGiEn)
+
+
+# incomplete model (no ln(gamma)): fails on creation
+class IncompleteModel(ActivityModel):
+    name = 'incomplete'
+
+
+try:
+    IncompleteModel(2)
+except TypeError:
+    print("incomplete model rejected")
@@ -0,0 +1,48 @@
+# BATCH EXECUTOR (PROCESS POOL)
+# -----------------------------
+
+# import module/package
+# externals
+import time
+import numpy as np
+# import package/module
+from PyCTPM import run_batch
+
+
+def jobList(caseNo):
+    '''
+    independent jobs (component fugacity, bubble temperature and a failing job)
+    '''
+    # pressure [Pa]
+    P_range = np.linspace(1e5, 10e5, caseNo)
+    for P in P_range:
+        yield {"function": "component.fugacity", "component": "propane", "state": "g",
+               "args": {"P": P, "T": 300}}
+    # bubble temperature
+    for x1 in np.linspace(0.1, 0.9, 5):
+        yield {"function": "pool.bubble_temperature", "components": ["benzene", "toluene"],
+               "state": "l", "args": {"mole_fractions": [x1, 1 - x1], "pressure": 101325}}
+    # not found
+    yield {"function": "component.fugacity", "component": "unknown-component", "args": [1e5, 300]}
+
+
+if __name__ == "__main__":
+    # serial
+    t0 = time.perf_counter()
+    res0 = list(run_batch(jobList(1000), workers=1))
+    print("serial [s]: ", time.perf_counter() - t0)
+
+    # process pool
+    t0 = time.perf_counter()
+    res1 = list(run_batch(jobList(1000), workers=4, chunk_size=100))
+    print("process pool [s]: ", time.perf_counter() - t0)
+
+    # check
+    print("job no: ", len(res1))
+    print("order: ", all(item['index'] == i for i, item in enumerate(res1)))
+    print("same results: ", all(str(a['res']) == str(b['res'])
+          for a, b in zip(res0, res1)))
+    print("first job: ", res1[0])
+    print("bubble temperature: ", res1[1000]['res'])
+    print("failed jobs: ", [(item['index'], item['error'])
+          for item in res1 if item['success'] is False])
@@ -0,0 +1,22 @@
+# MEMOIZATION CACHE
+# ------------------
+
+# import package/module
+from PyCTPM import component
+
+# define a molecule
+comp1 = component("propane", "g")
+
+# first call (computed)
+print("fugacity: ", comp1.fugacity(1e5, 300))
+# same state (cached)
+print("fugacity: ", comp1.fugacity(1e5, 300))
+print("cache: ", comp1.cache_info())
+
+# liquid fugacity (Poynting correction reuses cached vapor-pressure/eos)
+comp2 = component("water", "l")
+print("fugacity: ", comp2.fugacity(1e5, 300))
+print("cache: ", comp2.cache_info())
+
+# reset
+comp1.cache_clear()
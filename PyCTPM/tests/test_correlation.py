@@ -0,0 +1,35 @@
+# CORRELATION EXPRESSION COMPILER
+# --------------------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM.docs.correlation import compileCorrelation, bindCorrelation
+from PyCTPM.docs.dThermo import calCpEq1, calGasTherCondEq1
+
+# heat capacity (hydrogen) [kJ/kmol.K]
+CpExpr = "26.879 + 4.35E-03*T + -3.30E-07*(T**2)"
+CpFun = bindCorrelation(CpExpr)
+print("Cp: ", CpFun(300))
+# temperature array
+T = np.linspace(300, 1000, 5)
+print("Cp: ", CpFun(T))
+
+# expression with parameters
+ThCoFun = compileCorrelation("C1*(T**C2)/(1 + (C3/T) + C4/(T**2))")
+print("variables: ", ThCoFun.variables)
+print("ThCo: ", ThCoFun(T, C1=2.65E-03, C2=7.45E-01, C3=1.20E+01, C4=0))
+print("ThCo: ", calGasTherCondEq1("C1*(T**C2)/(1 + (C3/T) + C4/(T**2))",
+      ["2.65E-03", "7.45E-01", "1.20E+01", "0"], T))
+
+# component list
+loadData = ({"symbol": "H2", "Cp": CpExpr, "unit": "kJ/kmol.K"},)
+print("Cpi: ", calCpEq1(["H2"], T, loadData))
+
+# not allowed
+for expr in ["__import__('os')", "T.__class__", "[T]"]:
+    try:
+        compileCorrelation(expr)
+    except Exception:
+        print("rejected: ", expr)
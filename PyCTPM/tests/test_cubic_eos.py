@@ -0,0 +1,43 @@
+# CUBIC EOS (PR, SRK, RK, VDW)
+# ----------------------------
+
+# import package/module
+import numpy as np
+from PyCTPM import component, pool, eos_batch, fugacity_batch
+from PyCTPM.docs.eosFugacity import MixtureFugacity
+
+# eos models
+eosModels = ["PR", "SRK", "RK", "VDW"]
+
+# ! pure component
+comp1 = component('propane', 'g')
+for item in eosModels:
+    # Z, fugacity, vapor-pressure
+    res = comp1.compressibility_factor(1e5, 300, item)
+    print(item, "Zs: ", res['Zs'], "fugacity: ", comp1.fugacity(1e5, 300, item),
+          "P* [Pa]: ", comp1.vapor_pressure(300, 'eos', eos_model=item))
+
+# ! mixture (many states)
+compList = ["CH4", "C3H8", "C4H10"]
+P = np.linspace(1, 50, 5)*1e5
+T = np.linspace(250, 500, 5)
+for item in eosModels:
+    modelInput = {
+        "eos-model": item,
+        "components": compList,
+        "MoFr": [0.5, 0.3, 0.2],
+        "params": {
+            "pressure": P,
+            "temperature": T,
+        },
+    }
+    print(item, "ZV: ", eos_batch(modelInput)['ZV'])
+    print(item, "ln-phi: ", fugacity_batch(modelInput)['ln-phi'][0])
+
+# ! departure functions
+pool1 = pool([component(item)
+              for item in ["methane", "ethane", "propane", "n-pentane"]])
+for item in eosModels:
+    res = MixtureFugacity(pool1.pool_data.eosConstants, eosName=item).departure(
+        [20e5, 50e5], [320, 230], [0.5, 0.2, 0.2, 0.1], ['vapor', 'liquid'])
+    print(item, "H-R/RT: ", res['H-R'], "S-R/R: ", res['S-R'])
@@ -0,0 +1,34 @@
+# CUBIC ROOT SOLVER
+# ------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM.docs.cubicRoot import cubicRoots, cubicRealRoots
+
+# Peng-Robinson f(Z) coefficients for a range of A, B
+A = np.array([0.009137, 0.5, 2.0])
+B = np.array([0.000612, 0.05, 0.2])
+alpha = -1 + B
+beta = A - 3*np.power(B, 2) - 2*B
+gamma = -A*B + np.power(B, 2) + np.power(B, 3)
+
+# all real roots (nan for complex roots)
+Zs = cubicRoots(alpha, beta, gamma)
+print("Zs: ", Zs)
+
+# residual
+fZ = np.power(Zs, 3) + alpha[:, None]*np.power(Zs, 2) + \
+    beta[:, None]*Zs + gamma[:, None]
+print("max residual: ", np.nanmax(np.abs(fZ)))
+
+# physical roots (Z > B) of a single state
+for i in range(A.size):
+    print("Z: ", cubicRealRoots(alpha[i], beta[i], gamma[i], Zmin=B[i]))
+
+# triple root
+print("Z (triple root): ", cubicRealRoots(-3, 3, -1))
+
+# no physical root (all roots below Zmin): empty
+print("Z (no root above Zmin): ", cubicRealRoots(-3, 3, -1, Zmin=2))
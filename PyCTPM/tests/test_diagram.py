@@ -0,0 +1,50 @@
+# BINARY DIAGRAM (TXY/PXY)
+# ------------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM import component, pool
+
+# binary system
+pool1 = pool([component("benzene"), component("toluene")])
+
+# number of mole fractions
+zi_no = 7
+# pressures [Pa], temperatures [K]
+P_list = [0.5e5, 1.01325e5, 2e5]
+T_list = [330, 350, 370, 390]
+
+
+def checkShape(res, key, K):
+    '''
+    output shapes of a diagram (one row per pressure/temperature)
+    '''
+    _shapes = {item: np.shape(res[item]) for item in res}
+    print(key, _shapes)
+    return (res[key].shape == (K,) and res['x1'].shape == (K, zi_no) and
+            res['y1'].shape == (K, zi_no) and res['xi'].shape == (K, zi_no, 2) and
+            res['yi'].shape == (K, zi_no, 2))
+
+
+if __name__ == "__main__":
+    # ! Txy (serial)
+    res0 = pool1.Txy_binary(P_list, zi_no=zi_no)
+    print("Txy shapes: ", checkShape(res0, 'P', len(P_list)))
+    print("T [K]: ", np.round(res0['T'][:, [0, -1]], 2))
+
+    # single pressure
+    res1 = pool1.Txy_binary(1.01325e5, zi_no=zi_no)
+    print("Txy (one pressure): ", checkShape(res1, 'P', 1),
+          np.allclose(res1['T'][0], res0['T'][1]))
+
+    # ! Pxy (serial)
+    res2 = pool1.Pxy_binary(T_list, model="raoult", zi_no=zi_no)
+    print("Pxy shapes: ", checkShape(res2, 'T', len(T_list)))
+
+    # ! process pool (same result as serial)
+    res3 = pool1.Txy_binary(P_list, zi_no=zi_no, workers=2)
+    print("Txy workers=2: ", all(np.array_equal(res0[item], res3[item]) for item in res0))
+    res4 = pool1.Pxy_binary(T_list, model="raoult", zi_no=zi_no, workers=2)
+    print("Pxy workers=2: ", all(np.array_equal(res2[item], res4[item]) for item in res2))
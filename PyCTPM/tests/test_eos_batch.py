@@ -0,0 +1,45 @@
+# BATCH EOS CALCULATION
+# ----------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM import eos_batch
+
+# component list
+compList = ["CH4", "C3H8", "C4H10"]
+
+# number of states
+statesNo = 1000
+
+# pressure [Pa]
+P = np.linspace(1, 50, statesNo)*1e5
+# temperature [K]
+T = np.linspace(250, 500, statesNo)
+# mole fraction (M,N)
+MoFr = np.random.default_rng(1).dirichlet(np.ones(len(compList)), statesNo)
+
+# model input
+modelInput = {
+    "eos-model": "PR",
+    "components": compList,
+    "MoFr": MoFr,
+    "params": {
+        "pressure": P,
+        "temperature": T,
+    },
+}
+
+# eos
+res = eos_batch(modelInput)
+# log
+print("ZL: ", res['ZL'][:5])
+print("ZV: ", res['ZV'][:5])
+print("VV [m^3/mol]: ", res['VV'][:5])
+
+# state without a physical root (invalid temperature): nan, rootNo = 0
+modelInput['params'] = {"pressure": [1e5, 1e5], "temperature": [300, np.nan]}
+modelInput['MoFr'] = MoFr[:2]
+res = eos_batch(modelInput)
+print("rootNo: ", res['rootNo'], "ZV: ", res['ZV'], "VV: ", res['VV'])
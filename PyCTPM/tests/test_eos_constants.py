@@ -0,0 +1,33 @@
+# EOS CONSTANTS (PARSED ONCE, a(T) MEMOISED)
+# -------------------------------------------
+
+# import module/package
+# import package/module
+from PyCTPM import component
+from PyCTPM.docs.eosConstants import EosConstants
+
+# component
+comp1 = component("propane", "g")
+
+# constants (parsed once)
+eosConstants = comp1.eosConstants
+print("Pc [Pa]: ", eosConstants.Pc)
+print("b (PR): ", eosConstants.bPR)
+print("ac (PR): ", eosConstants.acPR)
+print("kappa (PR): ", eosConstants.kappaPR)
+
+# a(T) memoised per temperature
+print("a (PR) at 300 K: ", eosConstants.aPR(300))
+print("memoised: ", eosConstants.aPR(300) is eosConstants.aPR(300))
+
+# shared store for database records (eos/fugacity functions)
+compData = [{"Pc": "42.48", "Tc": "369.8", "w": "0.152", "Zc": "0.276"}]
+print("shared store: ", EosConstants.store(compData) is EosConstants.store(compData))
+
+# compressibility factor
+print("Z: ", comp1.compressibility_factor(1e5, 300)['Zs'])
+
+# eos aliases share the constants (SRK = SKR = RKS, VDW = VW)
+print("SRK alias: ", eosConstants.eosParams("SKR") is eosConstants.eosParams("SRK")
+      is eosConstants.eosParams("RKS"))
+print("VDW alias: ", eosConstants.eosParams("VW") is eosConstants.eosParams("VDW"))
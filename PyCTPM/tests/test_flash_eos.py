@@ -0,0 +1,51 @@
+# ISOTHERMAL FLASH (EOS, PHI-PHI)
+# --------------------------------
+
+# import package/module
+from PyCTPM import component, pool
+from PyCTPM.docs.eosFlash import EosFlash
+
+# ! set system (light hydrocarbons)
+compList1 = [component(item)
+             for item in ["methane", "ethane", "propane", "n-pentane"]]
+pool1 = pool(compList1)
+
+# ! feed properties
+# mole fraction
+moleFraction1 = [0.5, 0.2, 0.2, 0.1]
+# temperature [K]
+T = 260
+
+# ! flash properties
+# flash pressure [Pa]
+Pf0 = 30e5
+
+# ! run (eos)
+flash0 = pool1.flash_isothermal(moleFraction1, Pf0, T, Pf0, model='eos')
+print("flash0 (eos): ", flash0[0], flash0[4:])
+
+# ! raoult (compare)
+flash1 = pool1.flash_isothermal(moleFraction1, Pf0, T, Pf0)
+print("flash1 (raoult): ", flash1[0], flash1[4:])
+
+# ! iterations: accelerated (GDEM + Newton) vs successive substitution
+eosFlash = EosFlash(pool1.pool_data.eosConstants)
+for P in [10e5, 50e5, 70e5, 85e5]:
+    res0 = eosFlash.flash(moleFraction1, P, T)
+    res1 = eosFlash.flash(moleFraction1, P, T, acceleration=False)
+    print(P, res0['two-phase'], res0['V_F_ratio'],
+          res0['iterations'], res1['iterations'])
+    # check
+    print("V/F difference: ", abs(res0['V_F_ratio'] - res1['V_F_ratio']))
+
+# ! component absent from the feed (z[ethane] = 0)
+moleFraction2 = [0.6, 0, 0.2, 0.2]
+for stability in [False, True]:
+    res2 = eosFlash.flash(moleFraction2, Pf0, 280, stability=stability)
+    print("z[ethane] = 0: ", res2['two-phase'], res2['converged'],
+          res2['V_F_ratio'], res2['xi'], res2['Ki'])
+
+# ! not converged (max iteration)
+res3 = eosFlash.flash(moleFraction1, 50e5, T, maxIter=2)
+print("maxIter = 2: ", res3['two-phase'], res3['converged'],
+      res3['V_F_ratio'], res3['error'])
@@ -0,0 +1,56 @@
+# BATCH MIXTURE FUGACITY COEFFICIENT (PR)
+# ----------------------------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM import fugacity_batch
+
+# component list
+compList = ["CH4", "C3H8", "C4H10"]
+
+# number of states
+statesNo = 1000
+
+# pressure [Pa]
+P = np.linspace(1, 50, statesNo)*1e5
+# temperature [K]
+T = np.linspace(250, 500, statesNo)
+# mole fraction (M,N)
+MoFr = np.random.default_rng(1).dirichlet(np.ones(len(compList)), statesNo)
+
+# model input
+modelInput = {
+    "eos-model": "PR",
+    "components": compList,
+    "MoFr": MoFr,
+    "phase": "gas",
+    "derivatives": True,
+    "params": {
+        "pressure": P,
+        "temperature": T,
+    },
+}
+
+# fugacity coefficient
+res = fugacity_batch(modelInput)
+# log
+print("Z: ", res['Z'][:3])
+print("ln(phi): ", res['ln-phi'][:3])
+print("d(ln(phi))/dP [1/Pa]: ", res['d-ln-phi-dP'][:3])
+print("d(ln(phi))/dT [1/K]: ", res['d-ln-phi-dT'][:3])
+
+# check: Gibbs-Duhem sum(x[i]*d(ln(phi[i]))/dn[j]) = 0
+print("Gibbs-Duhem: ", np.max(
+    np.abs(np.einsum('mi,mij->mj', MoFr, res['d-ln-phi-dn']))))
+
+# check: finite difference (pressure)
+dP = 1.0
+modelInput['derivatives'] = False
+modelInput['params']['pressure'] = P + dP
+lnPhi1 = fugacity_batch(modelInput)['ln-phi']
+modelInput['params']['pressure'] = P - dP
+lnPhi0 = fugacity_batch(modelInput)['ln-phi']
+print("d(ln(phi))/dP error: ", np.max(
+    np.abs((lnPhi1 - lnPhi0)/(2*dP) - res['d-ln-phi-dP'])))
@@ -0,0 +1,58 @@
+# MIXTURE VISCOSITY/THERMAL CONDUCTIVITY FOR MANY STATES
+# ------------------------------------------------------
+
+# import module/package
+# externals
+import time
+import numpy as np
+# import package/module
+from PyCTPM import thermo
+
+# component list
+compList = ["H2", "CO2", "H2O", "CO", "CH4O", "C2H6O"]
+compNo = len(compList)
+
+# states
+stateNo = 500
+# temperature [K]
+T = np.linspace(400, 800, stateNo)
+# mole fraction (M,N)
+MoFri = np.random.default_rng(1).random((stateNo, compNo))
+MoFri = MoFri/np.sum(MoFri, axis=1, keepdims=True)
+
+
+def modelInput(T, MoFri, eq='DEFAULT'):
+    return {
+        "components": compList,
+        "MoFri": MoFri,
+        "params": {
+            "P": 3500000,
+            "T": T,
+        },
+        "unit": "SI",
+        "eq": eq
+    }
+
+
+# all states (one call)
+t0 = time.perf_counter()
+ViMix = thermo("Vi-MIX", modelInput(T, MoFri))
+ThCoMix = thermo("ThCo-MIX", modelInput(T, MoFri))
+print("batch [s]: ", time.perf_counter() - t0)
+
+# state by state
+t0 = time.perf_counter()
+ViMix0 = np.array([thermo("Vi-MIX", modelInput(T[i], MoFri[i]))
+                   for i in range(stateNo)])
+ThCoMix0 = np.array([thermo("ThCo-MIX", modelInput(T[i], MoFri[i]))
+                     for i in range(stateNo)])
+print("loop [s]: ", time.perf_counter() - t0)
+
+# check
+print("Vi-MIX: ", ViMix[:3], ViMix.shape)
+print("ThCo-MIX: ", ThCoMix[:3], ThCoMix.shape)
+print("max relative error (Vi-MIX): ", np.max(np.abs(ViMix/ViMix0 - 1)))
+print("max relative error (ThCo-MIX): ", np.max(np.abs(ThCoMix/ThCoMix0 - 1)))
+
+# Herning and Zipperer
+print("Vi-MIX (eq 2): ", thermo("Vi-MIX", modelInput(T[:3], MoFri[:3], 2)))
@@ -0,0 +1,39 @@
+# ACTIVITY MODEL PARAMETER ESTIMATION
+# ------------------------------------
+
+# import module/package
+# externals
+import os
+import numpy as np
+# import package/module
+from PyCTPM import component, pool
+
+# experimental data (Pxy)
+dataDir = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+
+#! Wilson equation
+pool1 = pool([component("ethanol"), component("methylbutyl-ether")])
+res1 = pool1.Wilson_parameter_estimation(
+    os.path.join(dataDir, 'Pxy2.csv'), plot_result=False)
+print("Wilson alpha[i,j]: ", res1)
+
+#! NRTL equation
+pool2 = pool([component("di-isopropyl-ether"), component("1-propanol")])
+res2 = pool2.NRTL_parameter_estimation(
+    os.path.join(dataDir, 'Pxy1.csv'), bounds=[[0, 2], [0, 2]], plot_result=False)
+print("NRTL: ", res2)
+
+#! analytic jacobian vs central difference (ternary system)
+pool3 = pool([component("benzene"), component(
+    "toluene"), component("ethylbenzene")])
+xi = np.random.default_rng(0).uniform(0.05, 1, (10, 3))
+xi = xi/np.sum(xi, axis=1, keepdims=True)
+ExMoGiEn = np.zeros(10)
+params = (xi, ExMoGiEn)
+# NRTL parameters (6 taij + 3 aij)
+x0 = np.array([0.5, 1.2, -0.3, 0.8, 0.1, 0.4, 0.3, 0.2, 0.35])
+jac = pool3.NRTLParameterJacobian(x0, params)
+h = 1e-7
+jacFD = np.array([(pool3.NRTLParameterObjectiveFunction(x0 + h*e, params) -
+                   pool3.NRTLParameterObjectiveFunction(x0 - h*e, params))/(2*h) for e in np.eye(x0.size)]).T
+print("NRTL jacobian error: ", np.max(np.abs(jac - jacFD)))
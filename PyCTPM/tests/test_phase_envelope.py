@@ -0,0 +1,38 @@
+# PHASE ENVELOPE (PENG-ROBINSON)
+# ------------------------------
+
+# import package/module
+import numpy as np
+from PyCTPM import component, pool
+
+# light hydrocarbons
+compList = [component(item)
+            for item in ["methane", "ethane", "propane", "n-pentane"]]
+pool1 = pool(compList)
+
+# feed mole fraction
+zi = [0.5, 0.2, 0.2, 0.1]
+
+# envelope (bubble curve from 1 bar -> critical point -> dew curve)
+res = pool1.phase_envelope(zi, start_pressure=1e5)
+print("points: ", res['T'].size, "newton iterations: ", res['iterations'])
+print("critical point: ", res['critical'])
+print("cricondenbar: ", res['cricondenbar'])
+print("cricondentherm: ", res['cricondentherm'])
+
+# every 10th point
+for i in range(0, res['T'].size, 10):
+    print(res['branch'][i], np.round(res['T'][i], 2), np.round(res['P'][i], 0))
+
+# check: the flash just inside the bubble curve is two-phase
+_eosFlash = pool1.eosFlashSet()
+for i in range(5, res['T'].size, 20):
+    if res['branch'][i] == 'bubble':
+        _flash = _eosFlash.flash(zi, 0.98*res['P'][i], res['T'][i])
+        print(np.round(res['T'][i], 2), "two-phase: ", _flash['two-phase'],
+              "V/F: ", _flash['V_F_ratio'])
+
+# lean gas (critical point close to the cricondenbar)
+res1 = pool1.phase_envelope([0.9, 0.05, 0.03, 0.02], start_pressure=1e5)
+print("lean gas, complete: ", res1['complete'], "critical point: ", res1['critical'],
+      "last point: ", np.round(res1['T'][-1], 2), np.round(res1['P'][-1], 0))
@@ -0,0 +1,43 @@
+# POOL DATA (STRUCT-OF-ARRAYS)
+# -----------------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM import component
+from PyCTPM.docs.pool import Pool
+
+# component list
+comp1 = component("benzene")
+comp2 = component("toluene")
+comp3 = component("ethylbenzene")
+compList = [comp1, comp2, comp3]
+
+# pool
+pool1 = Pool(compList)
+poolData = pool1.pool_data
+
+# constants (N)
+print("Tc [K]: ", poolData.Tc)
+print("Pc [Pa]: ", poolData.Pc)
+print("w [-]: ", poolData.w)
+print("vapor-pressure equation id: ", poolData.VaPeEqId)
+
+# vapor-pressure (M, N)
+T = np.linspace(300, 400, 5)
+print("P* [Pa]: ", poolData.vaporPressure(T))
+# check
+print("P* [Pa] (component): ", [item.vapor_pressure(350) for item in compList])
+print("P* [Pa] (pool): ", poolData.vaporPressure(350)[0])
+
+# eos constants
+print("a (PR): ", poolData.aPR(350))
+print("b (PR): ", poolData.bPR)
+print("a, b (VDW): ", poolData.aVDW, poolData.bVDW)
+print("VDW = EosConstants: ", np.array_equal(poolData.aVDW, poolData.eosConstants.a("VDW", 350)),
+      np.array_equal(poolData.bVDW, poolData.eosConstants.b("VDW")))
+
+# vapor-pressure and dP*/dT (same pass)
+VaPe, dVaPe = poolData.vaporPressure(T, derivative=True)
+print("dP*/dT [Pa/K]: ", dVaPe)
@@ -0,0 +1,40 @@
+# PROPERTY TABLE
+# ---------------
+
+# import package/module
+import numpy as np
+from PyCTPM import component
+
+# define a molecule
+comp1 = component("propane", "g")
+
+# direct calculation
+print("fugacity: ", comp1.fugacity(1e5, 300))
+print("vapor-pressure: ", comp1.vapor_pressure(300))
+
+# ! property table
+# T [K], P [Pa] range
+coverage = comp1.enable_property_table([250, 400], [1e4, 2e6])
+print("coverage: ", coverage)
+
+# served by interpolation
+print("fugacity: ", comp1.fugacity(1e5, 300))
+print("vapor-pressure: ", comp1.vapor_pressure(300))
+print("molar-volume: ", comp1.molar_volume(1e5, 300)[0])
+
+# check: max error of the served states (random states in the grid)
+_table = comp1.property_table
+_rng = np.random.default_rng(1)
+_lnP = _rng.uniform(_table.lnP[0], _table.lnP[-1], 20000)
+_T = _rng.uniform(_table.T[0], _table.T[-1], 20000)
+_mask = _table.eosMask(_lnP, _T)
+_Z, _lnPhi = _table._eosDirect(np.exp(_lnP[_mask]), _T[_mask])
+print("max error (Z): ", np.max(np.abs(_table.ZTable.ev(_lnP[_mask], _T[_mask])/_Z - 1)),
+      "tolerance: ", _table.tolerance)
+
+# outside the grid (direct calculation)
+print("fugacity: ", comp1.fugacity(5e6, 450))
+print("stats: ", comp1.property_table.stats)
+
+# direct calculation
+comp1.disable_property_table()
@@ -0,0 +1,26 @@
+# RACHFORD-RICE FLASH
+# --------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM.docs.flash import FlashClass
+
+# ! single feed
+zi = np.array([0.4, 0.4, 0.2])
+Ki = np.array([2.71, 0.92, 0.35])
+V_F_ratio, xi, yi, iterNo = FlashClass.rachfordRice(zi, Ki)
+print("V/F: ", V_F_ratio, " iteration: ", iterNo)
+print("xi: ", xi)
+print("yi: ", yi)
+
+# ! many feeds
+zi = np.array([[0.4, 0.4, 0.2], [0.1, 0.3, 0.6], [0.05, 0.15, 0.8]])
+V_F_ratio, xi, yi, iterNo = FlashClass.rachfordRice(zi, Ki)
+print("V/F: ", V_F_ratio, " iteration: ", iterNo)
+
+# ! negative flash (single-phase feed)
+V_F_ratio, xi, yi, iterNo = FlashClass.rachfordRice(
+    zi, Ki, negativeFlash=True)
+print("V/F (negative flash): ", V_F_ratio)
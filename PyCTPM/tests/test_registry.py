@@ -0,0 +1,49 @@
+# COMPONENT REGISTRY
+# -------------------
+
+# import package/module
+import csv
+import os
+from PyCTPM.core.utilities import comp
+from PyCTPM.database import ComponentRegistry
+
+# database
+dataFile = "data_general.csv"
+
+# ! lookup by name, symbol (formula), title case
+for id in ["methane", "CH4", "Methane", "METHANE"]:
+    i = ComponentRegistry.findIndex(dataFile, id)
+    print(id, i, ComponentRegistry.find(dataFile, id).get('component-name'))
+
+# title case names (Methane)
+print("methane: ", ComponentRegistry.find(
+    "data_general_2.csv", "methane").get('component-name'))
+
+# non-key column (MW) is not a lookup key
+print("16.043: ", ComponentRegistry.findIndex(dataFile, "16.043"))
+
+# ! state
+# n-pentane is a liquid in the general data
+print("n-pentane (l): ", ComponentRegistry.findIndex(dataFile, "n-pentane", "l"))
+print("n-pentane (g): ", ComponentRegistry.findIndex(dataFile, "n-pentane", "g"))
+# both states in the formation data
+_formation = "data_enthalpy_and_gibbs_energy_of_formation.csv"
+for state in ["l", "g"]:
+    _record = ComponentRegistry.find(_formation, "n-pentane", state)
+    print("n-pentane formation: ", _record.get('state'), _record.get('dHf25'))
+
+# ! unit row (not a record)
+print("unit: ", ComponentRegistry.unit(dataFile).get('Pc'))
+print("records: ", len(ComponentRegistry.records(dataFile)))
+
+# ! record order
+# comp() follows the csv file
+with open(os.path.join(ComponentRegistry.databaseDir, dataFile), 'r') as file:
+    _rows = list(csv.DictReader(file))[1:]
+_csv = [[row['component-name'], row['component-symbol']] for row in _rows]
+print("comp() order: ", comp() == _csv)
+
+# search follows the component list
+compList = ["n-pentane", "CH4", "water"]
+print("search: ", [item['component-name']
+      for item in ComponentRegistry.search(dataFile, compList)])
@@ -0,0 +1,24 @@
+# SATURATION PRESSURE (EOS)
+# --------------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM import component
+
+# component
+comp1 = component('propane', 'g')
+Tc = comp1.Tc
+
+# vapor-pressure at a temperature [K]
+T = 300
+print("P* [Pa] (PR): ", comp1.vapor_pressure(T, 'eos', eos_model='PR'))
+print("P* [Pa] (polynomial): ", comp1.vapor_pressure(T, 'polynomial'))
+print("P* [Pa] (shortcut): ", comp1.vapor_pressure(T, 'shortcut'))
+
+# saturation curve (nan at/above the critical temperature)
+Ts = np.linspace(0.5*Tc, 1.05*Tc, 12)
+Ps, iterNo = comp1.saturationPressureEOS(Ts, 'PR')
+print("P* [Pa]: ", Ps)
+print("iteration number: ", iterNo)
@@ -0,0 +1,39 @@
+# DATABASE SNAPSHOT
+# ------------------
+
+# import module/package
+# externals
+import os
+import json
+import tempfile
+# import package/module
+from PyCTPM.database import ComponentRegistry
+from PyCTPM.database.snapshot import buildSnapshot, loadSnapshot
+
+# build a snapshot in a temporary folder
+outDir = tempfile.mkdtemp()
+print("snapshot: ", buildSnapshot(outDir, ["data_general.csv"]))
+
+# load (memory-mapped)
+header, unit, cells, values = loadSnapshot("data_general.csv", outDir)
+print("header: ", header)
+print("cells: ", cells.shape, cells.dtype)
+
+# typed column
+i = ComponentRegistry.findIndex("data_general.csv", "water")
+print("Pc [bar]: ", ComponentRegistry.column("data_general.csv", "Pc", [i]))
+
+# ! stamp: size + mtime, crc32 if the mtime differs (e.g. reinstall)
+_info = os.path.join(outDir, "data_general.json")
+with open(_info, 'r', encoding='utf-8') as file:
+    info = json.load(file)
+info['source']['mtime'] = 0
+with open(_info, 'w', encoding='utf-8') as file:
+    json.dump(info, file)
+print("mtime changed, fresh: ", loadSnapshot("data_general.csv", outDir) is not None)
+
+# content changed (crc32)
+info['source']['crc32'] += 1
+with open(_info, 'w', encoding='utf-8') as file:
+    json.dump(info, file)
+print("content changed, fresh: ", loadSnapshot("data_general.csv", outDir) is not None)
@@ -0,0 +1,54 @@
+# PHASE STABILITY TEST (TANGENT PLANE DISTANCE)
+# ----------------------------------------------
+
+# import package/module
+import numpy as np
+from PyCTPM import component, pool
+
+# ! eos (vapor/liquid)
+# light hydrocarbons
+compList1 = [component(item)
+             for item in ["methane", "ethane", "propane", "n-pentane"]]
+pool1 = pool(compList1)
+
+# feed mole fraction
+zi = [0.5, 0.2, 0.2, 0.1]
+# temperature [K]
+T = 260
+
+for P in [10e5, 50e5, 75e5, 85e5, 150e5]:
+    res = pool1.stability_test(zi, P, T)
+    print(P, "stable: ", res['stable'], "tm: ", res['tm'], "Ki: ", res['Ki'])
+
+# flash: stable feeds are not flashed
+for P in [50e5, 85e5]:
+    _flash = pool1.eosFlashSet().flash(zi, P, T)
+    print(P, "two-phase: ", _flash['two-phase'], "V/F: ",
+          _flash['V_F_ratio'], _flash['iterations'])
+
+# ! activity model (liquid/liquid)
+compList2 = [component("benzene"), component("toluene")]
+pool2 = pool(compList2)
+
+# Margules (one-parameter), A > 2 results in two liquid phases
+for A in [1.5, 2.5]:
+    res = pool2.stability_test([0.5, 0.5], 101325, 300, model='modified-raoult',
+                               activity_coefficient_model={"name": "margules", "params": [A]})
+    print("A: ", A, "stable: ", res['stable'],
+          "tm: ", res['tm'], "wi: ", res['wi'][np.argmin(res['tm'])])
+
+# ! components absent from the feed (z[i] = 0)
+# same result as the feed without ethane
+res = pool1.stability_test([0.6, 0, 0.2, 0.2], 30e5, 280)
+print("z[ethane] = 0, stable: ", res['stable'],
+      "tm: ", res['tm'], "Ki: ", res['Ki'])
+pool3 = pool([component(item) for item in ["methane", "propane", "n-pentane"]])
+res = pool3.stability_test([0.6, 0.2, 0.2], 30e5, 280)
+print("without ethane, stable: ", res['stable'], "tm: ", res['tm'])
+
+# liquid/liquid (cyclohexane absent)
+pool4 = pool([component("benzene"), component("toluene"),
+              component("cyclohexane")])
+res = pool4.stability_test([0.5, 0.5, 0], 101325, 300, model='modified-raoult',
+                           activity_coefficient_model={"name": "margules", "params": [2.5]})
+print("z[cyclohexane] = 0, stable: ", res['stable'], "tm: ", res['tm'])
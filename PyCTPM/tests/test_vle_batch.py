@@ -0,0 +1,41 @@
+# BATCH BUBBLE/DEW CALCULATION
+# -----------------------------
+
+# import module/package
+# externals
+import numpy as np
+# import package/module
+from PyCTPM import component, pool
+
+# define a system
+comp1 = component("benzene")
+comp2 = component("toluene")
+comp3 = component("ethylbenzene")
+pool1 = pool([comp1, comp2, comp3])
+
+# mole fractions (M x N)
+moleFractions = np.array([[0.4, 0.4, 0.2], [0.2, 0.5, 0.3], [0.1, 0.1, 0.8]])
+# pressure [Pa]
+P = 101325
+# temperature [K]
+T = 360
+
+# ! bubble/dew pressure
+res0 = pool1.bubble_pressure_batch(moleFractions, T)
+print("bubble pressure: ", res0['P'])
+res1 = pool1.dew_pressure_batch(moleFractions, T)
+print("dew pressure: ", res1['P'])
+
+# ! bubble/dew temperature
+res2 = pool1.bubble_temperature_batch(moleFractions, P)
+print("bubble temperature: ", res2['T'], " iteration: ", res2['iterNo'])
+print("yi: ", res2['yi'])
+res3 = pool1.dew_temperature_batch(moleFractions, P)
+print("dew temperature: ", res3['T'], " iteration: ", res3['iterNo'])
+print("xi: ", res3['xi'])
+
+# ! modified raoult
+res4 = pool1.bubble_temperature_batch(
+    moleFractions, P, model='modified-raoult', activity_coefficient_model='van-laar')
+print("bubble temperature: ", res4['T'])
+print("AcCo: ", res4['AcCo'])
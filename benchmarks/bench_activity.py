@@ -0,0 +1,59 @@
+# BENCHMARK: ACTIVITY COEFFICIENT MODELS
+# ---------------------------------------
+
+# import packages/modules
+import os
+import numpy as np
+# local
+from common import benchmark, DATA_DIR, SETTINGS, pool, moleFractions
+
+
+def binaryPool(id1, id2):
+    '''
+    a binary pool for the experimental data sets
+    '''
+    from PyCTPM import component, pool
+    compList = [component(id1), component(id2)]
+    for item in compList:
+        item.cache.enabled = SETTINGS['cache']
+    return pool(compList)
+
+
+@benchmark()
+def Wilson_parameter_estimation():
+    '''
+    Wilson parameter estimation (Pxy data, ethanol/methylbutyl-ether)
+    '''
+    pool1 = binaryPool('ethanol', 'methylbutyl-ether')
+    csvFile = os.path.join(DATA_DIR, 'Pxy2.csv')
+    return lambda: pool1.Wilson_parameter_estimation(csvFile, plot_result=False)
+
+
+@benchmark()
+def NRTL_parameter_estimation():
+    '''
+    NRTL parameter estimation (Pxy data, di-isopropyl-ether/1-propanol)
+    '''
+    pool1 = binaryPool('di-isopropyl-ether', '1-propanol')
+    csvFile = os.path.join(DATA_DIR, 'Pxy1.csv')
+    return lambda: pool1.NRTL_parameter_estimation(csvFile, bounds=[[0, 2], [0, 2]], plot_result=False)
+
+
+@benchmark(model=['van-laar', 'wilson', 'nrtl'], compNo=[2, 8], batchSize=[10, 1000])
+def activity_coefficient_batch(model, compNo, batchSize):
+    '''
+    activity coefficient of many liquid compositions (one temperature per composition)
+    '''
+    pool1 = pool(compNo)
+    xi = moleFractions(compNo, batchSize)
+    T = np.linspace(330, 370, batchSize)
+    # model parameters
+    rng = np.random.default_rng(0)
+    gij = rng.uniform(-500, 1500, (compNo, compNo))
+    params = {
+        "van-laar": 0,
+        "wilson": gij,
+        "nrtl": {"aij": np.full((compNo, compNo), 0.3), "gij": gij}
+    }[model]
+    AcCoModel = {"name": model, "params": params}
+    return lambda: pool1.activityCoefficientBatch(xi, T, 'modified-raoult', AcCoModel)
@@ -0,0 +1,18 @@
+# BENCHMARK: BATCH EXECUTOR
+# --------------------------
+
+# import packages/modules
+import numpy as np
+# local
+from common import benchmark
+
+
+@benchmark(workers=[1, 4], jobNo=[2000])
+def run_batch_fugacity(workers, jobNo):
+    '''
+    run_batch of independent component fugacity jobs (process pool start-up included)
+    '''
+    from PyCTPM import run_batch
+    jobs = [{"function": "component.fugacity", "component": "propane", "state": "g",
+             "args": {"P": P, "T": 300}} for P in np.linspace(1e5, 10e5, jobNo)]
+    return lambda: list(run_batch(jobs, workers=workers, chunk_size=250))
@@ -0,0 +1,101 @@
+# BENCHMARK: COMPONENT
+# ---------------------
+
+# import packages/modules
+import numpy as np
+# local
+from common import benchmark, components, SETTINGS
+
+# pure components (state)
+PURE_COMPONENTS = {
+    'g': 'propane',
+    'l': 'benzene'
+}
+
+
+def pureComponent(state):
+    '''
+    a component with a defined state (phase root selection)
+    '''
+    from PyCTPM import component
+    comp = component(PURE_COMPONENTS[state], state)
+    comp.cache.enabled = SETTINGS['cache']
+    return comp
+
+
+@benchmark()
+def component_construction():
+    '''
+    Component() construction (database already loaded)
+    '''
+    from PyCTPM import component
+    # load database
+    component('benzene')
+    return lambda: component('benzene')
+
+
+@benchmark(eos_model=['PR', 'SRK', 'RK', 'VDW'])
+def compressibility_factor(eos_model):
+    '''
+    compressibility factor of a pure component
+    '''
+    comp = pureComponent('g')
+    return lambda: comp.compressibility_factor(1e5, 300, eos_model)
+
+
+@benchmark(state=['g', 'l'])
+def fugacity(state):
+    '''
+    fugacity of a pure gas/liquid (liquid: pressure correction)
+    '''
+    comp = pureComponent(state)
+    return lambda: comp.fugacity(1e5, 300, 'PR')
+
+
+@benchmark(batchSize=[1, 100])
+def vapor_pressure_eos(batchSize):
+    '''
+    vapor-pressure from eos (saturation pressure solver)
+    '''
+    comp = components(1)[0]
+    T = np.linspace(0.5, 0.95, batchSize)*comp.Tc
+    if batchSize == 1:
+        T = float(T[0])
+    return lambda: comp.vaporPressureEOS(T, 'PR')
+
+
+@benchmark(batchSize=[1, 1000], derivatives=[False, True])
+def mixture_fugacity_batch(batchSize, derivatives):
+    '''
+    component fugacity coefficients of a PR mixture for many states (fugacity_batch)
+    '''
+    from PyCTPM import fugacity_batch
+    compList = ["CH4", "C3H8", "C4H10"]
+    modelInput = {
+        "eos-model": "PR",
+        "components": compList,
+        "MoFr": np.random.default_rng(1).dirichlet(np.ones(len(compList)), batchSize),
+        "derivatives": derivatives,
+        "params": {
+            "pressure": np.linspace(1, 50, batchSize)*1e5,
+            "temperature": np.linspace(250, 500, batchSize),
+        },
+    }
+    return lambda: fugacity_batch(modelInput)
+
+
+@benchmark(eos_model=['PR', 'SRK', 'RK', 'VDW'])
+def departure_batch(eos_model):
+    '''
+    residual H/S/G of a mixture for 1000 states (generic cubic eos kernel)
+    '''
+    from PyCTPM import component, pool as _pool
+    from PyCTPM.docs.eosFugacity import MixtureFugacity
+    pool1 = _pool([component(item)
+                   for item in ["methane", "ethane", "propane", "n-pentane"]])
+    mixtureFugacity = MixtureFugacity(
+        pool1.pool_data.eosConstants, eosName=eos_model)
+    xi = np.random.default_rng(1).dirichlet(np.ones(4), 1000)
+    P = np.linspace(1, 50, 1000)*1e5
+    T = np.linspace(250, 500, 1000)
+    return lambda: mixtureFugacity.departure(P, T, xi)
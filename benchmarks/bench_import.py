@@ -0,0 +1,49 @@
+# BENCHMARK: IMPORT TIME
+# -----------------------
+
+# import packages/modules
+import os
+import sys
+import subprocess
+# local
+from common import benchmark, ROOT_DIR
+
+# statements (fresh interpreter)
+IMPORT_STATEMENTS = {
+    'package': "import PyCTPM",
+    'thermo': "from PyCTPM import thermo; thermo('MW', {'components': ['CO2', 'H2O']})",
+}
+
+# modules which should not be loaded by the statements above
+HEAVY_MODULES = ['matplotlib', 'pandas', 'scipy']
+
+
+def runPython(code):
+    '''
+    run code in a fresh interpreter (repository version of the package)
+    '''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [ROOT_DIR, env.get('PYTHONPATH', '')]).strip(os.pathsep)
+    res = subprocess.run([sys.executable, '-c', code], env=env, cwd=ROOT_DIR,
+                         capture_output=True, text=True)
+    # check
+    if res.returncode != 0:
+        raise Exception(res.stderr.strip())
+    return res.stdout
+
+
+@benchmark(statement=list(IMPORT_STATEMENTS.keys()))
+def import_time(statement):
+    '''
+    interpreter start-up + statement
+
+    guard: the statement must not load plotting/pandas/scipy
+    '''
+    code = IMPORT_STATEMENTS[statement]
+    _loaded = runPython(
+        code + f"\nimport sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))").strip()
+    # check
+    if _loaded:
+        raise Exception(f"`{code}` loads {_loaded}")
+    return lambda: runPython(code)
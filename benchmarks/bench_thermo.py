@@ -0,0 +1,49 @@
+# BENCHMARK: THERMO PROPERTIES
+# -----------------------------
+
+# local
+from common import benchmark
+
+# components (gas mixture)
+GAS_LIST = ["H2", "CO2", "H2O", "CO", "CH4O", "C2H6O"]
+
+
+@benchmark(compNo=[2, 6])
+def viscosity_mixture(compNo):
+    '''
+    thermo('Vi-MIX') of a gas mixture
+    '''
+    from PyCTPM import thermo
+    modelInput = {
+        "components": GAS_LIST[:compNo],
+        "MoFri": [1/compNo]*compNo,
+        "params": {
+            "P": 3500000,
+            "T": 523,
+        },
+        "unit": "SI",
+        "eq": 'DEFAULT'
+    }
+    return lambda: thermo("Vi-MIX", modelInput)
+
+
+@benchmark(prop=["Vi-MIX", "ThCo-MIX"], stateNo=[1000])
+def mixture_property_batch(prop, stateNo):
+    '''
+    thermo('Vi-MIX'/'ThCo-MIX') of many states (temperature and composition) in one call
+    '''
+    import numpy as np
+    from PyCTPM import thermo
+    compNo = len(GAS_LIST)
+    MoFri = np.random.default_rng(1).random((stateNo, compNo))
+    modelInput = {
+        "components": GAS_LIST,
+        "MoFri": MoFri/np.sum(MoFri, axis=1, keepdims=True),
+        "params": {
+            "P": 3500000,
+            "T": np.linspace(400, 800, stateNo),
+        },
+        "unit": "SI",
+        "eq": 'DEFAULT'
+    }
+    return lambda: thermo(prop, modelInput)
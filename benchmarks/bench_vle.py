@@ -0,0 +1,111 @@
+# BENCHMARK: VAPOR-LIQUID EQUILIBRIUM
+# ------------------------------------
+
+# import packages/modules
+import io
+import contextlib
+# local
+from common import benchmark, pool, moleFractions
+
+
+@benchmark(compNo=[2, 4, 8])
+def bubble_temperature(compNo):
+    '''
+    bubble temperature (fsolve) of a single feed
+    '''
+    pool1 = pool(compNo)
+    zi = moleFractions(compNo)
+    return lambda: pool1.bubble_temperature(zi, 101325)
+
+
+@benchmark(compNo=[2, 8], batchSize=[10, 1000])
+def bubble_temperature_batch(compNo, batchSize):
+    '''
+    bubble temperature of many feeds (vectorized newton)
+    '''
+    pool1 = pool(compNo)
+    zi = moleFractions(compNo, batchSize)
+    return lambda: pool1.bubble_temperature_batch(zi, 101325)
+
+
+@benchmark(compNo=[2, 4, 8])
+def flash_isothermal(compNo):
+    '''
+    isothermal flash (rachford-rice)
+    '''
+    pool1 = pool(compNo)
+    zi = moleFractions(compNo)
+    # bubble/dew pressure at 360 K
+    res = pool1.bubble_pressure_batch(zi[None, :], 360)
+    Pf = 0.5*(res['P'][0] + pool1.dew_pressure_batch(zi[None, :], 360)['P'][0])
+
+    def fun():
+        # the result table is printed
+        with contextlib.redirect_stdout(io.StringIO()):
+            return pool1.flash_isothermal(zi, Pf, 360, 2*Pf)
+    return fun
+
+
+@benchmark(zi_no=[10, 50])
+def Txy_binary(zi_no):
+    '''
+    Txy diagram of a binary system
+    '''
+    pool1 = pool(2)
+    return lambda: pool1.Txy_binary(101325, zi_no=zi_no)
+
+
+@benchmark(pressure=[10e5, 70e5], acceleration=[False, True])
+def flash_isothermal_eos(pressure, acceleration):
+    '''
+    eos (phi-phi) isothermal flash of a light hydrocarbon feed at 260 K,
+    successive substitution vs GDEM + Newton (70 bar is close to the bubble point)
+    '''
+    from PyCTPM import component, pool as _pool
+    from PyCTPM.docs.eosFlash import EosFlash
+    pool1 = _pool([component(item)
+                   for item in ["methane", "ethane", "propane", "n-pentane"]])
+    eosFlash = EosFlash(pool1.pool_data.eosConstants)
+    zi = [0.5, 0.2, 0.2, 0.1]
+    return lambda: eosFlash.flash(zi, pressure, 260, acceleration=acceleration, stability=False)
+
+
+@benchmark(pressure=[50e5, 150e5], stability=[False, True])
+def flash_isothermal_eos_stability(pressure, stability):
+    '''
+    eos isothermal flash with/without the stability test at 260 K
+    (50 bar: two phases, 150 bar: single phase, the stable feed is not flashed)
+    '''
+    from PyCTPM import component, pool as _pool
+    from PyCTPM.docs.eosFlash import EosFlash
+    pool1 = _pool([component(item)
+                   for item in ["methane", "ethane", "propane", "n-pentane"]])
+    eosFlash = EosFlash(pool1.pool_data.eosConstants)
+    zi = [0.5, 0.2, 0.2, 0.1]
+    return lambda: eosFlash.flash(zi, pressure, 260, stability=stability)
+
+
+@benchmark(method=['trace', 'independent'])
+def phase_envelope(method):
+    '''
+    phase envelope (~110 points) of a light hydrocarbon feed vs 10 independent
+    bubble points (Wilson initial guess, 1-80 bar)
+    '''
+    import numpy as np
+    from PyCTPM import component, pool as _pool
+    from PyCTPM.docs.phaseEnvelope import PhaseEnvelope
+    pool1 = _pool([component(item)
+                   for item in ["methane", "ethane", "propane", "n-pentane"]])
+    phaseEnvelope = PhaseEnvelope(pool1.pool_data.eosConstants)
+    zi = np.array([0.5, 0.2, 0.2, 0.1])
+    N = zi.size
+
+    def fun():
+        for P in np.geomspace(1e5, 80e5, 10):
+            T0, lnKi = phaseEnvelope.WilsonBubbleTemperature(zi, P)
+            X = np.concatenate((lnKi, [np.log(T0), np.log(P)]))
+            phaseEnvelope.newton(X, zi, N + 1, X[N + 1])
+
+    if method == 'trace':
+        return lambda: phaseEnvelope.trace(zi)
+    return fun
@@ -0,0 +1,107 @@
+# BENCHMARK COMMON
+# -----------------
+
+# import packages/modules
+import os
+import itertools
+import numpy as np
+
+# no display backend (some routines plot)
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+# repository folder
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# experimental data (Pxy)
+DATA_DIR = os.path.join(ROOT_DIR, 'data')
+
+# components with critical constants and vapor-pressure data (volatility order)
+COMPONENT_LIST = ['propane', 'n-pentane', 'acetone', 'methanol', 'benzene', 'ethanol', 'toluene',
+                  'ethylbenzene', 'o-xylene', 'phenol', 'naphthalene']
+
+# registered benchmarks
+BENCHMARKS = []
+
+# component cache (memoization) is disabled by default to time the calculation itself
+SETTINGS = {
+    "cache": False
+}
+
+
+def benchmark(**params):
+    '''
+    register a benchmark
+
+    the decorated function is the setup, it receives one parameter combination and
+    returns the callable to be timed
+
+    args:
+        params: parameter name -> value list (all combinations are timed)
+    '''
+    def decorator(fun):
+        BENCHMARKS.append({
+            "name": f"{fun.__module__}.{fun.__name__}",
+            "setup": fun,
+            "params": params
+        })
+        return fun
+    return decorator
+
+
+def paramCases(params):
+    '''
+    all parameter combinations *** list of dict ***
+    '''
+    names = list(params.keys())
+    return [dict(zip(names, item)) for item in itertools.product(*[params[k] for k in names])]
+
+
+def caseName(name, case):
+    '''
+    benchmark id such as `bench_vle.bubble_temperature[compNo=4]`
+    '''
+    if len(case) == 0:
+        return name
+    return name + '[' + ','.join(f"{k}={v}" for k, v in case.items()) + ']'
+
+
+def components(compNo):
+    '''
+    a component list (first compNo components)
+    '''
+    # import
+    from PyCTPM import component
+
+    # check
+    if compNo > len(COMPONENT_LIST):
+        raise Exception(
+            f"component number should be <= {len(COMPONENT_LIST)}")
+
+    res = []
+    for item in COMPONENT_LIST[:compNo]:
+        _comp = component(item)
+        _comp.cache.enabled = SETTINGS['cache']
+        res.append(_comp)
+    return res
+
+
+def pool(compNo):
+    '''
+    a pool of compNo components
+    '''
+    # import
+    from PyCTPM import pool as _pool
+    return _pool(components(compNo))
+
+
+def moleFractions(compNo, caseNo=None, seed=0):
+    '''
+    normalized mole fractions
+
+    return:
+        zi: (compNo) or (caseNo, compNo)
+    '''
+    rng = np.random.default_rng(seed)
+    if caseNo is None:
+        return np.ones(compNo)/compNo
+    zi = rng.uniform(0.05, 1, (caseNo, compNo))
+    return zi/np.sum(zi, axis=1, keepdims=True)
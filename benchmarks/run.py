@@ -0,0 +1,242 @@
+# BENCHMARK RUNNER
+# -----------------
+
+'''
+benchmark suite of the main hot paths
+
+usage:
+    python benchmarks/run.py                        run all, compare with baseline.json
+    python benchmarks/run.py -k vle                 run benchmarks whose id contains `vle`
+    python benchmarks/run.py -o results.json        save results (json)
+    python benchmarks/run.py --save-baseline        overwrite baseline.json (with -k: selected entries)
+    python benchmarks/run.py --check                exit code 1 if a benchmark regressed
+
+each benchmark module (bench_*.py) registers setup functions with @benchmark(params),
+a setup returns the callable to be timed, every parameter combination is a separate case
+'''
+
+# import packages/modules
+import os
+import sys
+import json
+import time
+import glob
+import platform
+import argparse
+import importlib
+import statistics
+import subprocess
+import numpy as np
+
+# benchmark folder
+BENCH_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+# local
+from common import ROOT_DIR, BENCHMARKS, SETTINGS, paramCases, caseName
+
+# package (repository version)
+sys.path.insert(0, ROOT_DIR)
+
+# default baseline
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+
+
+def loadModules():
+    '''
+    import all benchmark modules (registration)
+    '''
+    for item in sorted(glob.glob(os.path.join(BENCH_DIR, 'bench_*.py'))):
+        importlib.import_module(os.path.splitext(os.path.basename(item))[0])
+
+
+def timeCallable(fun, repeat, minTime):
+    '''
+    time a callable
+
+    the loop number is doubled until one repeat takes at least minTime
+
+    return:
+        res: per-call times [s] (min, median, mean, stdev), number, repeat
+    '''
+    # warm-up
+    fun()
+
+    # loop number
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fun()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= minTime or number >= 1e6:
+            break
+        number *= 2
+
+    # repeats
+    times = [elapsed/number]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fun()
+        times.append((time.perf_counter() - t0)/number)
+
+    # res
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeat": len(times)
+    }
+
+
+def runBenchmarks(pattern='', repeat=5, minTime=0.1):
+    '''
+    run all registered benchmarks
+
+    return:
+        results: {benchmark id: timing or {error}}
+    '''
+    results = {}
+    for item in BENCHMARKS:
+        for case in paramCases(item['params']):
+            _id = caseName(item['name'], case)
+            # filter
+            if pattern and pattern not in _id:
+                continue
+            try:
+                fun = item['setup'](**case)
+                res = timeCallable(fun, repeat, minTime)
+                print(f"{_id:<60} {formatTime(res['median']):>12}", flush=True)
+            except Exception as e:
+                res = {"error": repr(e)}
+                print(f"{_id:<60} {'failed':>12}  {e!r}", flush=True)
+            results[_id] = res
+    return results
+
+
+def formatTime(t):
+    '''
+    time with unit
+    '''
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if t >= scale:
+            return f"{t/scale:.3f} {unit}"
+    return f"{t/1e-9:.1f} ns"
+
+
+def metadata(args):
+    '''
+    machine/package information
+    '''
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                capture_output=True, text=True, timeout=10).stdout.strip()
+    except Exception:
+        commit = ''
+    return {
+        "date": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cache": SETTINGS['cache'],
+        "repeat": args.repeat,
+        "minTime": args.min_time
+    }
+
+
+def compareResults(results, baseline, threshold):
+    '''
+    compare median times with a baseline
+
+    return:
+        regressions: benchmark ids slower than threshold*baseline
+    '''
+    regressions = []
+    _base = baseline.get('results', {})
+    print()
+    print(f"{'benchmark':<60} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for _id, res in results.items():
+        _b = _base.get(_id)
+        if 'error' in res or _b is None or 'error' in _b:
+            continue
+        ratio = res['median']/_b['median']
+        if ratio > threshold:
+            status = 'slower'
+            regressions.append(_id)
+        elif ratio < 1/threshold:
+            status = 'faster'
+        else:
+            status = ''
+        print(f"{_id:<60} {formatTime(_b['median']):>12} {formatTime(res['median']):>12} {ratio:>8.2f}  {status}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='PyCTPM benchmarks')
+    parser.add_argument('-k', '--filter', default='',
+                        help='run benchmarks whose id contains this text')
+    parser.add_argument('-o', '--output', default='',
+                        help='save results to a json file')
+    parser.add_argument('-b', '--baseline', default=BASELINE_FILE,
+                        help='baseline json file')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='save results as the baseline')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='ratio (current/baseline) reported as a regression')
+    parser.add_argument('--check', action='store_true',
+                        help='exit code 1 if a benchmark regressed')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help='minimum time of one repeat [s]')
+    parser.add_argument('--quick', action='store_true',
+                        help='repeat=3, min-time=0.02')
+    parser.add_argument('--cache', action='store_true',
+                        help='enable component memoization')
+    args = parser.parse_args(argv)
+
+    # set
+    if args.quick:
+        args.repeat = 3
+        args.min_time = 0.02
+    SETTINGS['cache'] = args.cache
+
+    # run
+    loadModules()
+    results = runBenchmarks(args.filter, args.repeat, args.min_time)
+    report = {"meta": metadata(args), "results": results}
+
+    # save
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        # filtered run: update the selected entries only
+        if args.filter and os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+            baseline['results'].update(results)
+            report['results'] = baseline['results']
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        return 0
+
+    # compare
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compareResults(results, baseline, args.threshold)
+        if len(regressions) > 0:
+            print(f"\n{len(regressions)} regression(s): {regressions}")
+
+    # res
+    return 1 if (args.check and len(regressions) > 0) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())